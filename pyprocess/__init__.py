@@ -1,11 +1,30 @@
 # pyprocess/pyprocess/__init__.py
 
-from pyprocess.mp_utils import hand_detector
-from pyprocess.utils import display
-from pyprocess import shapes
+import importlib
+
+# Alt modüller ilk erişimde yüklenir; böylece örneğin yalnızca `pyprocess.convert`
+# kullanan bir süreç MediaPipe ve OpenCV'yi hiç içe aktarmaz.
+_LAZY_MODULES = {
+    'hand_detector': 'pyprocess.mp_utils.hand_detector',
+    'display': 'pyprocess.utils.display',
+    'shapes': 'pyprocess.shapes',
+    'convert': 'pyprocess.convert',
+    'mp_utils': 'pyprocess.mp_utils',
+}
 
 __all__ = [
     'hand_detector',
     'display',
     'shapes',
-]
\ No newline at end of file
+    'convert',
+]
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(_LAZY_MODULES[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES))
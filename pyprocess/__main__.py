@@ -0,0 +1,5 @@
+import sys
+
+from pyprocess.main import main
+
+sys.exit(main())
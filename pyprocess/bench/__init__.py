@@ -0,0 +1,10 @@
+from pyprocess.bench.runner import compare, load_report, main, measure, run_benchmarks, save_report
+
+__all__ = [
+    'measure',
+    'run_benchmarks',
+    'compare',
+    'save_report',
+    'load_report',
+    'main'
+]
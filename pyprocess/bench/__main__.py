@@ -0,0 +1,5 @@
+import sys
+
+from pyprocess.bench.runner import main
+
+sys.exit(main())
@@ -0,0 +1,200 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+def measure(func: Callable[[], Any], repeat: int = 5, min_time: float = 0.02, items: int = 1) -> Dict[str, Any]:
+    """
+    Bir fonksiyonun çağrı süresini ölçer.
+
+    Çağrı sayısı, tek bir ölçüm en az `min_time` saniye sürecek şekilde
+    otomatik seçilir (timeit.autorange gibi); ardından `repeat` ölçüm
+    alınır ve çağrı başına süreler raporlanır.
+
+    Args:
+        func (callable): Argümansız ölçülecek fonksiyon.
+        repeat (int): Ölçüm sayısı.
+        min_time (float): Tek ölçümün en kısa süresi (saniye).
+        items (int): Bir çağrının işlediği öğe sayısı (verim hesabı için).
+
+    Returns:
+        dict: 'median_s', 'min_s', 'mean_s', 'stdev_s', 'number', 'repeat' ve 'items_per_s'.
+    """
+    func()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    median = statistics.median(times)
+    return {
+        'median_s': median,
+        'min_s': min(times),
+        'mean_s': statistics.fmean(times),
+        'stdev_s': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'number': number,
+        'repeat': repeat,
+        'items_per_s': items / median if median > 0 else float('inf'),
+    }
+
+def run_benchmarks(suites: Optional[Iterable[str]] = None, quick: bool = False, repeat: int = 5,
+                   log: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """
+    Seçilen benchmark gruplarını çalıştırır.
+
+    Bir grubun isteğe bağlı bağımlılığı (örn. MediaPipe) yoksa grup atlanır
+    ve 'skipped' altında nedeniyle birlikte listelenir.
+
+    Args:
+        suites (iterable, optional): Grup adları; varsayılan tüm gruplar.
+        quick (bool): Daha küçük boyutlar ve kısa ölçümler (duman testi için).
+        repeat (int): Her ölçümün tekrar sayısı.
+        log (callable, optional): Her sonuç için bir satır alır.
+
+    Returns:
+        dict: 'meta', 'results' (ad -> ölçüm) ve 'skipped' (grup -> neden).
+
+    Raises:
+        ValueError: Eğer bilinmeyen bir grup adı verilirse.
+    """
+    from pyprocess.bench.suites import SUITES
+
+    names = list(SUITES) if suites is None else list(suites)
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark suite(s): {', '.join(unknown)}")
+    min_time = 0.005 if quick else 0.05
+    report: Dict[str, Any] = {'meta': _meta(quick), 'results': {}, 'skipped': {}}
+    for suite in names:
+        try:
+            cases = list(SUITES[suite](quick))
+        except ImportError as error:
+            report['skipped'][suite] = str(error)
+            continue
+        for name, func, items in cases:
+            key = f"{suite}.{name}"
+            result = measure(func, repeat=repeat, min_time=min_time, items=items)
+            report['results'][key] = result
+            if log is not None:
+                log(f"{key:<60} {result['median_s'] * 1e3:10.4f} ms  {result['items_per_s']:14.1f} items/s")
+    return report
+
+def _meta(quick: bool) -> Dict[str, Any]:
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'quick': quick,
+    }
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.1) -> List[Dict[str, Any]]:
+    """
+    İki raporu karşılaştırır.
+
+    Args:
+        current (dict): Yeni rapor.
+        baseline (dict): Saklanan temel rapor.
+        threshold (float): Medyan süredeki izin verilen göreli artış (0.1 = %10).
+
+    Returns:
+        list: Her ortak benchmark için 'name', 'baseline_s', 'current_s', 'ratio',
+        'regression' (bool) ve 'missing' (bool) içeren satırlar; oranı en kötüden en iyiye
+        sıralı. Temel raporda olup yeni raporda bulunmayan (örn. atlanan gruplardaki)
+        benchmarklar başta, 'missing' True ve 'current_s'/'ratio' None olarak yer alır.
+    """
+    rows = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None or base['median_s'] <= 0:
+            continue
+        ratio = result['median_s'] / base['median_s']
+        rows.append({'name': name, 'baseline_s': base['median_s'], 'current_s': result['median_s'],
+                     'ratio': ratio, 'regression': ratio > 1 + threshold, 'missing': False})
+    rows.sort(key=lambda row: row['ratio'], reverse=True)
+    missing = [{'name': name, 'baseline_s': base['median_s'], 'current_s': None, 'ratio': None,
+                'regression': False, 'missing': True}
+               for name, base in sorted(baseline['results'].items()) if name not in current['results']]
+    return missing + rows
+
+def _mode_mismatch(current: Dict[str, Any], baseline: Dict[str, Any]) -> Optional[str]:
+    """
+    Raporlar farklı modlarda (--quick ve tam) üretildiyse açıklayıcı bir uyarı döndürür.
+    """
+    modes = [('quick' if report.get('meta', {}).get('quick') else 'full') for report in (current, baseline)]
+    if modes[0] == modes[1]:
+        return None
+    return f"comparing a {modes[0]} run against a {modes[1]} baseline; input sizes and timings differ."
+
+def build_parser(parser: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentParser:
+    from pyprocess.bench.suites import SUITES
+
+    parser = parser or argparse.ArgumentParser(prog='python -m pyprocess.bench',
+                                               description="Run pyprocess benchmarks on synthetic data.")
+    parser.add_argument('--suite', action='append', choices=sorted(SUITES),
+                        help="Benchmark group to run (repeatable); default all.")
+    parser.add_argument('--quick', action='store_true', help="Smaller inputs and shorter timings.")
+    parser.add_argument('--repeat', type=int, default=5, help="Measurements per benchmark.")
+    parser.add_argument('--output', help="Write the JSON report to this path.")
+    parser.add_argument('--compare', metavar='BASELINE', help="Compare against a stored JSON report.")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="Allowed relative slowdown before a benchmark counts as a regression.")
+    return parser
+
+def run_from_args(args: argparse.Namespace) -> int:
+    report = run_benchmarks(args.suite, quick=args.quick, repeat=args.repeat, log=print)
+    for suite, reason in report['skipped'].items():
+        print(f"skipped {suite}: {reason}")
+    if args.output:
+        save_report(report, args.output)
+    if not args.compare:
+        return 0
+    baseline = load_report(args.compare)
+    mismatch = _mode_mismatch(report, baseline)
+    if mismatch:
+        print(f"warning: {mismatch}")
+    rows = compare(report, baseline, args.threshold)
+    for row in rows:
+        if row['missing']:
+            print(f"{row['name']:<60} {'-':>7} MISSING")
+            continue
+        flag = 'REGRESSION' if row['regression'] else ''
+        print(f"{row['name']:<60} {row['ratio']:6.2f}x {flag}")
+    regressions = [row for row in rows if row['regression']]
+    missing = [row for row in rows if row['missing']]
+    print(f"{len(regressions)} regression(s) over {args.threshold:.0%} in {len(rows) - len(missing)} compared "
+          f"benchmark(s); {len(missing)} missing from this run.")
+    return 1 if regressions or missing or mismatch else 0
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Komut satırı girişi; gerileme, eksik benchmark veya mod uyuşmazlığı bulunursa 1 döndürür.
+    """
+    return run_from_args(build_parser().parse_args(argv))
+
+if __name__ == '__main__':
+    sys.exit(main())
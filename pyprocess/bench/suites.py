@@ -0,0 +1,117 @@
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+Case = Tuple[str, Callable[[], object], int]
+
+CONVERSIONS = (('pascal', 'yolo'), ('yolo', 'coco'), ('coco', 'pascal'))
+IMAGE_SIZE = (1280, 720)
+
+def _pascal_boxes(n: int, size: Tuple[int, int], seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    w, h = size
+    x_min = rng.uniform(0, w / 2, n)
+    y_min = rng.uniform(0, h / 2, n)
+    return np.stack([x_min, y_min, x_min + rng.uniform(1, w / 2, n), y_min + rng.uniform(1, h / 2, n)], axis=1)
+
+def convert_suite(quick: bool) -> Iterator[Case]:
+    """
+    Tekil ve toplu bbox dönüşüm verimi.
+    """
+    from pyprocess.convert import convert_bbox, convert_bbox_batch, get_plan
+
+    for n in ([1000] if quick else [1000, 100000]):
+        pascal = _pascal_boxes(n, IMAGE_SIZE)
+        boxes = {'pascal': pascal,
+                 'yolo': convert_bbox_batch('pascal', 'yolo', pascal, size=IMAGE_SIZE),
+                 'coco': convert_bbox_batch('pascal', 'coco', pascal)}
+        for src, dst in CONVERSIONS:
+            data = boxes[src]
+            # Tekil dönüşüm en fazla 10k satırda ölçülür; daha büyük girdilerde süre yalnızca doğrusal uzar.
+            rows = data[:10000].tolist()
+            out = np.empty_like(data)
+            plan = get_plan(src, dst, size=IMAGE_SIZE)
+            yield (f"{src}_to_{dst}.scalar[n={len(rows)}]",
+                   lambda rows=rows, src=src, dst=dst: [convert_bbox(src, dst, *row, size=IMAGE_SIZE) for row in rows],
+                   len(rows))
+            yield (f"{src}_to_{dst}.batch[n={n}]",
+                   lambda data=data, src=src, dst=dst: convert_bbox_batch(src, dst, data, size=IMAGE_SIZE), n)
+            yield (f"{src}_to_{dst}.plan_out[n={n}]", lambda data=data, plan=plan, out=out: plan.batch(data, out=out), n)
+
+def _synthetic_frame(width: int, height: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+def detector_suite(quick: bool) -> Iterator[Case]:
+    """
+    `HandDetector.find_hands` gecikmesi (çözünürlük başına, sentetik kareler).
+    """
+    from pyprocess.mp_utils.hand_detector import HandDetector
+
+    detector = HandDetector(mode=True)
+    for width, height in ([(320, 240)] if quick else [(320, 240), (640, 480), (1280, 720)]):
+        frame = _synthetic_frame(width, height)
+        yield (f"find_hands[{width}x{height}]", lambda frame=frame: detector.find_hands(frame, draw=False), 1)
+        yield (f"find_hands_draw[{width}x{height}]", lambda frame=frame: detector.find_hands(frame, draw=True), 1)
+
+def geometry_suite(quick: bool) -> Iterator[Case]:
+    """
+    Landmark geometrisi yardımcılarının ek yükü (iki el, enjekte edilmiş sonuçlar).
+    """
+    from pyprocess.mp_utils.hand_detector import HandDetector, arrays_to_results, results_to_arrays
+
+    rng = np.random.default_rng(0)
+    arrays = (rng.uniform(0, 1, (2, 21, 3)).astype(np.float32), np.array([0, 1], np.int8),
+              np.array([0.9, 0.8], np.float32))
+    detector = HandDetector(mode=True)
+    results = detector.results = arrays_to_results(*arrays)
+    img = _synthetic_frame(*IMAGE_SIZE)
+    yield "results_to_arrays", lambda: results_to_arrays(results), 1
+    yield "find_positions", lambda: detector.find_positions(img, draw=False), 1
+    yield "find_positions_draw", lambda: detector.find_positions(img, draw=True), 1
+    yield "get_bounding_box", lambda: detector.get_bounding_box(img), 1
+    yield "bounding_boxes", lambda: detector.bounding_boxes(img), 1
+    yield "fingertip_distances", lambda: detector.fingertip_distances(img), 1
+    yield "draw_bounding_box", lambda: detector.draw_bounding_box(img, (100, 100, 200, 150), text='Right'), 1
+
+def _random_shapes(n: int, seed: int = 0) -> List:
+    from pyprocess.shapes import Circle, Rect, Triangle
+
+    rng = np.random.default_rng(seed)
+    points = rng.integers(0, IMAGE_SIZE[0] - 100, (n, 2)) % (IMAGE_SIZE[0] - 100, IMAGE_SIZE[1] - 100)
+    sizes = rng.integers(10, 100, (n, 2))
+    classes = (Rect, Circle, Triangle)
+    return [classes[i % 3](tuple(p), tuple(s)) for i, (p, s) in enumerate(zip(points.tolist(), sizes.tolist()))]
+
+def shapes_suite(quick: bool) -> Iterator[Case]:
+    """
+    Şekil çizim ve `update` maliyeti: nesne başına döngü ile Scene / IncrementalRenderer.
+    """
+    from pyprocess.shapes import IncrementalRenderer, Scene
+
+    frame = _synthetic_frame(*IMAGE_SIZE)
+    cursors = np.random.default_rng(1).integers(0, 720, (10, 2))
+    for n in ([10, 1000] if quick else [10, 100, 1000, 10000]):
+        shapes = _random_shapes(n)
+        scene = Scene(_random_shapes(n))
+        renderer = IncrementalRenderer(scene)
+        renderer.render(frame.copy())
+        canvas = frame.copy()
+
+        def move_one(scene=scene, renderer=renderer, canvas=canvas):
+            scene.points[0] = (scene.points[0] + 1) % 600
+            renderer.render(canvas)
+
+        yield f"objects.draw[n={n}]", lambda shapes=shapes, canvas=canvas: [s.draw(canvas) for s in shapes], n
+        yield f"objects.update[n={n}]", lambda shapes=shapes: [s.update((5, 5)) for s in shapes], n
+        yield f"scene.draw[n={n}]", lambda scene=scene, canvas=canvas: scene.draw(canvas), n
+        yield f"scene.hit_test[n={n},cursors=10]", lambda scene=scene: scene.hit_test(cursors), n
+        yield f"scene.update[n={n},cursors=10]", lambda scene=scene: scene.update(cursors), n
+        yield f"renderer.static[n={n}]", lambda renderer=renderer, canvas=canvas: renderer.render(canvas), n
+        yield f"renderer.one_moved[n={n}]", move_one, n
+
+SUITES: Dict[str, Callable[[bool], Iterator[Case]]] = {
+    'convert': convert_suite,
+    'detector': detector_suite,
+    'geometry': geometry_suite,
+    'shapes': shapes_suite,
+}
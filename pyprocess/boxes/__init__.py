@@ -0,0 +1,28 @@
+from pyprocess.boxes.ops import (
+    as_pascal,
+    box_area,
+    box_iou,
+    generalized_box_iou,
+    distance_box_iou,
+    pairwise,
+    iter_pairwise,
+    nms,
+    batched_nms,
+    soft_nms
+)
+from pyprocess.boxes.index import BoxIndex, box_distance
+
+__all__ = [
+    'as_pascal',
+    'box_area',
+    'box_iou',
+    'generalized_box_iou',
+    'distance_box_iou',
+    'pairwise',
+    'iter_pairwise',
+    'nms',
+    'batched_nms',
+    'soft_nms',
+    'BoxIndex',
+    'box_distance'
+]
\ No newline at end of file
@@ -0,0 +1,215 @@
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from pyprocess.boxes.ops import as_pascal
+
+def _str_order(boxes: np.ndarray, node_size: int) -> np.ndarray:
+    """
+    Sort-Tile-Recursive paketleme sırasını hesaplar: kutular önce merkez x'e
+    göre dikey dilimlere, sonra her dilim içinde merkez y'ye göre sıralanır.
+    """
+    n = len(boxes)
+    slices = max(1, math.ceil(math.sqrt(math.ceil(n / node_size))))
+    per_slice = slices * node_size
+    cx = boxes[:, 0] + boxes[:, 2]
+    cy = boxes[:, 1] + boxes[:, 3]
+    by_x = np.argsort(cx, kind='stable')
+    slice_id = np.arange(n) // per_slice
+    return by_x[np.lexsort((cy[by_x], slice_id))]
+
+def _group_bounds(boxes: np.ndarray, node_size: int) -> np.ndarray:
+    starts = np.arange(0, len(boxes), node_size)
+    return np.stack([
+        np.minimum.reduceat(boxes[:, 0], starts),
+        np.minimum.reduceat(boxes[:, 1], starts),
+        np.maximum.reduceat(boxes[:, 2], starts),
+        np.maximum.reduceat(boxes[:, 3], starts),
+    ], axis=1)
+
+def _expand(nodes: np.ndarray, node_size: int, n_children: int) -> Tuple[np.ndarray, np.ndarray]:
+    starts = nodes * node_size
+    counts = np.minimum(starts + node_size, n_children) - starts
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(np.arange(len(nodes)), counts), np.repeat(starts, counts) + offsets
+
+def _intersects(q: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return (q[:, 0] <= b[:, 2]) & (b[:, 0] <= q[:, 2]) & (q[:, 1] <= b[:, 3]) & (b[:, 1] <= q[:, 3])
+
+def _overlaps(q: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return (q[:, 0] < b[:, 2]) & (b[:, 0] < q[:, 2]) & (q[:, 1] < b[:, 3]) & (b[:, 1] < q[:, 3])
+
+def _contains(outer: np.ndarray, inner: np.ndarray) -> np.ndarray:
+    return ((outer[:, 0] <= inner[:, 0]) & (outer[:, 1] <= inner[:, 1]) &
+            (inner[:, 2] <= outer[:, 2]) & (inner[:, 3] <= outer[:, 3]))
+
+def _within(q: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return _contains(q, b)
+
+def _containing(q: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return _contains(b, q)
+
+def box_distance(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Satır satır iki kutu arasındaki en kısa Öklid mesafesini döndürür
+    (kesişen kutular için 0).
+    """
+    dx = np.maximum(0, np.maximum(a[:, 0] - b[:, 2], b[:, 0] - a[:, 2]))
+    dy = np.maximum(0, np.maximum(a[:, 1] - b[:, 3], b[:, 1] - a[:, 3]))
+    return np.hypot(dx, dy)
+
+class BoxIndex:
+    """
+    Kutular üzerinde toplu (bulk-loaded) STR paketlenmiş R-tree.
+
+    Ağaç yalnızca NumPy dizilerinden oluşur: her seviye (nodes, 4) sınır
+    kutuları dizisidir ve k numaralı düğümün çocukları alt seviyede
+    [k * node_size, (k + 1) * node_size) aralığındadır. Sorgular tüm sorgu
+    kutuları için seviye seviye vektörel olarak ilerler.
+    """
+    def __init__(self, boxes, fmt: str = 'pascal', size=None, node_size: int = 16):
+        """
+        Args:
+            boxes (array-like): (N, 4) kutular.
+            fmt (str): Kutuların formatı ('pascal', 'coco' veya 'yolo').
+            size (array-like, optional): YOLO görüntü boyutu.
+            node_size (int): Düğüm başına çocuk sayısı.
+        """
+        pascal = as_pascal(boxes, fmt, size)
+        self.fmt = fmt
+        self.size = size
+        self.node_size = node_size
+        self.order = _str_order(pascal, node_size) if len(pascal) else np.empty(0, dtype=np.int64)
+        self.position = np.empty_like(self.order)
+        self.position[self.order] = np.arange(len(self.order))
+        # levels[0] yapraklar (kutuların kendisi), levels[-1] kök seviyesidir.
+        self.levels: List[np.ndarray] = [pascal[self.order]]
+        while len(self.levels[-1]) > node_size:
+            self.levels.append(_group_bounds(self.levels[-1], node_size))
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @property
+    def boxes(self) -> np.ndarray:
+        return self.levels[0]
+
+    def _queries(self, queries, fmt: Optional[str], size) -> np.ndarray:
+        if fmt is None:
+            fmt, size = self.fmt, self.size if size is None else size
+        return as_pascal(queries, fmt, size)
+
+    def _search(self, queries: np.ndarray, prune, leaf_test) -> Tuple[np.ndarray, np.ndarray]:
+        top = self.levels[-1]
+        q_idx = np.repeat(np.arange(len(queries)), len(top))
+        node = np.tile(np.arange(len(top)), len(queries))
+        for level in range(len(self.levels) - 1, 0, -1):
+            hit = prune(queries[q_idx], self.levels[level][node])
+            q_idx, node = q_idx[hit], node[hit]
+            parent, node = _expand(node, self.node_size, len(self.levels[level - 1]))
+            q_idx = q_idx[parent]
+        hit = leaf_test(queries[q_idx], self.levels[0][node])
+        q_idx, item = q_idx[hit], self.order[node[hit]]
+        order = np.lexsort((item, q_idx))
+        return q_idx[order], item[order]
+
+    def _batched(self, queries: np.ndarray, prune, leaf_test, chunk_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        if len(self) == 0 or len(queries) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        parts = []
+        for start in range(0, len(queries), chunk_size):
+            q_idx, item = self._search(queries[start:start + chunk_size], prune, leaf_test)
+            parts.append((q_idx + start, item))
+        return np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
+
+    def query_overlaps(self, queries, fmt: Optional[str] = None, size=None,
+                       chunk_size: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Her sorgu kutusuyla pozitif alanda kesişen kutuları bulur.
+
+        Args:
+            queries (array-like): (Q, 4) sorgu kutuları.
+            fmt (str, optional): Sorgu formatı; verilmezse indeksin formatı kullanılır.
+            size (array-like, optional): YOLO görüntü boyutu.
+            chunk_size (int): Aynı anda işlenecek sorgu sayısı.
+
+        Returns:
+            tuple: (sorgu indisleri, kutu indisleri) eşleşme çiftleri.
+        """
+        return self._batched(self._queries(queries, fmt, size), _intersects, _overlaps, chunk_size)
+
+    def query_within(self, queries, fmt: Optional[str] = None, size=None,
+                     chunk_size: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Her sorgu kutusunun tamamen içinde kalan kutuları bulur.
+
+        Args ve Returns `query_overlaps` ile aynıdır.
+        """
+        return self._batched(self._queries(queries, fmt, size), _intersects, _within, chunk_size)
+
+    def query_containing(self, queries, fmt: Optional[str] = None, size=None,
+                         chunk_size: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Her sorgu kutusunu (veya [x, y, x, y] noktasını) tamamen içeren kutuları bulur.
+
+        Args ve Returns `query_overlaps` ile aynıdır.
+        """
+        return self._batched(self._queries(queries, fmt, size), _containing, _containing, chunk_size)
+
+    def nearest(self, queries, k: int = 1, fmt: Optional[str] = None, size=None,
+                chunk_size: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Her sorgu kutusuna en yakın k kutuyu bulur.
+
+        Arama yarıçapı, her sorgu için en az k aday bulunana (veya yarıçap
+        tüm indeksi kapsayana) kadar ikiye katlanır; bu yarıçap içindeki tüm
+        kutular kesin olarak bulunduğundan sonuç tamdır. NaN veya sonsuz
+        koordinatlı sorguların komşusu yoktur.
+
+        Args:
+            queries (array-like): (Q, 4) sorgu kutuları.
+            k (int): Komşu sayısı.
+            fmt (str, optional): Sorgu formatı; verilmezse indeksin formatı kullanılır.
+            size (array-like, optional): YOLO görüntü boyutu.
+            chunk_size (int): Aynı anda işlenecek sorgu sayısı.
+
+        Returns:
+            tuple: (Q, k) kutu indisleri ve mesafeleri; eksik komşular -1 ve inf ile doldurulur.
+        """
+        queries = self._queries(queries, fmt, size)
+        indices = np.full((len(queries), k), -1, dtype=np.int64)
+        distances = np.full((len(queries), k), np.inf)
+        n = len(self)
+        if n == 0 or len(queries) == 0:
+            return indices, distances
+        root = self.levels[-1]
+        lo, hi = np.nanmin(root[:, :2], axis=0), np.nanmax(root[:, 2:], axis=0)
+        extent = max(float(hi[0] - lo[0]), float(hi[1] - lo[1]), 1e-9)
+        radius = np.full(len(queries), extent * math.sqrt(min(k, n) / n))
+        # Sorgudan kök sınırlarındaki en uzak noktaya olan mesafenin üst sınırı; bu yarıçapta arama tamamlanır.
+        with np.errstate(invalid='ignore', over='ignore'):
+            far = np.hypot(np.maximum(hi[0] - queries[:, 0], queries[:, 2] - lo[0]),
+                           np.maximum(hi[1] - queries[:, 1], queries[:, 3] - lo[1]))
+        pending = np.flatnonzero(np.isfinite(queries).all(axis=1))
+        while pending.size:
+            r = radius[pending][:, None]
+            expanded = queries[pending] + np.hstack([-r, -r, r, r])
+            q_idx, item = self._batched(expanded, _intersects, _intersects, chunk_size)
+            dist = box_distance(queries[pending[q_idx]], self.levels[0][self.position[item]])
+            inside = dist <= radius[pending[q_idx]]
+            counts = np.bincount(q_idx[inside], minlength=len(pending))
+            done = (counts >= k) | (counts >= n) | (radius[pending] >= far[pending])
+            sel = done[q_idx] & inside
+            q_sel, item_sel, dist_sel = q_idx[sel], item[sel], dist[sel]
+            order = np.lexsort((item_sel, dist_sel, q_sel))
+            q_sel, item_sel, dist_sel = q_sel[order], item_sel[order], dist_sel[order]
+            starts = np.searchsorted(q_sel, q_sel, side='left')
+            rank = np.arange(len(q_sel)) - starts
+            take = rank < k
+            rows = pending[q_sel[take]]
+            indices[rows, rank[take]] = item_sel[take]
+            distances[rows, rank[take]] = dist_sel[take]
+            radius[pending[~done]] *= 2
+            pending = pending[~done]
+        return indices, distances
@@ -0,0 +1,250 @@
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from pyprocess.convert.bboxes.batch import convert_bbox_batch
+
+def as_pascal(boxes, fmt: str = 'pascal', size=None, validation: str = 'trusted') -> np.ndarray:
+    """
+    Herhangi bir desteklenen formattaki kutuları (N, 4) Pascal VOC dizisine çevirir.
+
+    Varsayılan 'trusted' modda kutular kontrol edilmez; algılayıcı çıktılarında
+    görülen hafif negatif koordinatlar gibi değerler olduğu gibi dönüştürülür.
+    Diğer modlar her formatta aynı şekilde uygulanır.
+
+    Args:
+        boxes (array-like): (N, 4) bounding box dizisi.
+        fmt (str): Kutuların formatı ('pascal', 'coco' veya 'yolo').
+        size (array-like, optional): YOLO için (width, height) veya (N, 2) görüntü boyutu.
+        validation (str): 'trusted', 'strict' veya 'clip'.
+
+    Returns:
+        np.ndarray: (N, 4) float64 Pascal VOC kutuları.
+
+    Raises:
+        ValueError: Desteklenmeyen bir format istendiğinde.
+    """
+    if fmt not in ('pascal', 'coco', 'yolo'):
+        raise ValueError(f"Unsupported box format: {fmt}")
+    arr = np.asarray(boxes, dtype=np.float64)
+    if arr.size == 0:
+        return arr.reshape(-1, 4)
+    if fmt == 'pascal' and validation == 'trusted':
+        return arr
+    return convert_bbox_batch(fmt, 'pascal', arr, validation=validation, size=size)
+
+def box_area(boxes: np.ndarray) -> np.ndarray:
+    return (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+
+def _iou_parts(a: np.ndarray, b: np.ndarray):
+    lt = np.maximum(a[:, None, :2], b[None, :, :2])
+    rb = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    wh = np.clip(rb - lt, 0, None)
+    inter = wh[..., 0] * wh[..., 1]
+    union = box_area(a)[:, None] + box_area(b)[None, :] - inter
+    iou = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+    return iou, union
+
+def _enclosing(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    lt = np.minimum(a[:, None, :2], b[None, :, :2])
+    rb = np.maximum(a[:, None, 2:], b[None, :, 2:])
+    return lt, rb
+
+def _iou(a, b):
+    return _iou_parts(a, b)[0]
+
+def _giou(a, b):
+    iou, union = _iou_parts(a, b)
+    lt, rb = _enclosing(a, b)
+    wh = rb - lt
+    area = wh[..., 0] * wh[..., 1]
+    penalty = np.divide(area - union, area, out=np.zeros_like(area), where=area > 0)
+    return iou - penalty
+
+def _diou(a, b):
+    iou, _ = _iou_parts(a, b)
+    lt, rb = _enclosing(a, b)
+    diagonal = ((rb - lt) ** 2).sum(-1)
+    ca = (a[:, :2] + a[:, 2:]) / 2
+    cb = (b[:, :2] + b[:, 2:]) / 2
+    distance = ((ca[:, None, :] - cb[None, :, :]) ** 2).sum(-1)
+    return iou - np.divide(distance, diagonal, out=np.zeros_like(distance), where=diagonal > 0)
+
+_METRICS = {
+    'iou': _iou,
+    'giou': _giou,
+    'diou': _diou,
+}
+
+def iter_pairwise(boxes1, boxes2, metric: str = 'iou', fmt: str = 'pascal', size=None,
+                  size2=None, chunk_size: int = 4096) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    İki kutu kümesi arasındaki benzerlik matrisini satır blokları halinde üretir.
+
+    Tüm matris hiçbir zaman bellekte tutulmaz; her blok (chunk_size, M)
+    boyutundadır.
+
+    Args:
+        boxes1 (array-like): (N, 4) kutular.
+        boxes2 (array-like): (M, 4) kutular.
+        metric (str): 'iou', 'giou' veya 'diou'.
+        fmt (str): Kutuların formatı ('pascal', 'coco' veya 'yolo').
+        size (array-like, optional): boxes1 için YOLO görüntü boyutu.
+        size2 (array-like, optional): boxes2 için YOLO görüntü boyutu; verilmezse size kullanılır.
+        chunk_size (int): Blok başına satır sayısı.
+
+    Yields:
+        tuple: (başlangıç satırı, (rows, M) float64 blok).
+
+    Raises:
+        ValueError: Desteklenmeyen bir metrik istendiğinde.
+    """
+    func = _METRICS.get(metric)
+    if func is None:
+        raise ValueError(f"Unsupported metric: {metric}")
+    a = as_pascal(boxes1, fmt, size)
+    b = as_pascal(boxes2, fmt, size if size2 is None else size2)
+    for start in range(0, len(a), chunk_size):
+        yield start, func(a[start:start + chunk_size], b)
+
+def pairwise(boxes1, boxes2, metric: str = 'iou', fmt: str = 'pascal', size=None, size2=None,
+             chunk_size: int = 4096, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    İki kutu kümesi arasındaki (N, M) IoU/GIoU/DIoU matrisini hesaplar.
+
+    Hesaplama `chunk_size` satırlık bloklarla yapılır. Çok büyük matrisler
+    için `out` olarak bir `np.memmap` verilirse sonuç doğrudan diske yazılır
+    ve bellek kullanımı bir blokla sınırlı kalır.
+
+    Args:
+        boxes1 (array-like): (N, 4) kutular.
+        boxes2 (array-like): (M, 4) kutular.
+        metric (str): 'iou', 'giou' veya 'diou'.
+        fmt (str): Kutuların formatı ('pascal', 'coco' veya 'yolo').
+        size (array-like, optional): boxes1 için YOLO görüntü boyutu.
+        size2 (array-like, optional): boxes2 için YOLO görüntü boyutu.
+        chunk_size (int): Blok başına satır sayısı.
+        out (np.ndarray, optional): Sonucun yazılacağı (N, M) dizi veya memmap.
+
+    Returns:
+        np.ndarray: (N, M) benzerlik matrisi.
+    """
+    n, m = len(np.asarray(boxes1).reshape(-1, 4)), len(np.asarray(boxes2).reshape(-1, 4))
+    if out is None:
+        out = np.empty((n, m), dtype=np.float64)
+    elif out.shape != (n, m):
+        raise ValueError(f"out must have shape {(n, m)}.")
+    for start, block in iter_pairwise(boxes1, boxes2, metric, fmt, size, size2, chunk_size):
+        out[start:start + len(block)] = block
+    return out
+
+def box_iou(boxes1, boxes2, **kwargs) -> np.ndarray:
+    return pairwise(boxes1, boxes2, 'iou', **kwargs)
+
+def generalized_box_iou(boxes1, boxes2, **kwargs) -> np.ndarray:
+    return pairwise(boxes1, boxes2, 'giou', **kwargs)
+
+def distance_box_iou(boxes1, boxes2, **kwargs) -> np.ndarray:
+    return pairwise(boxes1, boxes2, 'diou', **kwargs)
+
+def _greedy_nms(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float) -> np.ndarray:
+    order = np.argsort(-scores, kind='stable')
+    keep = []
+    while order.size:
+        best = order[0]
+        keep.append(best)
+        if order.size == 1:
+            break
+        rest = order[1:]
+        iou = _iou(boxes[best:best + 1], boxes[rest])[0]
+        order = rest[iou <= iou_threshold]
+    return np.array(keep, dtype=np.int64)
+
+def nms(boxes, scores, iou_threshold: float = 0.5, fmt: str = 'pascal', size=None) -> np.ndarray:
+    """
+    Açgözlü (greedy) Non-Maximum Suppression uygular.
+
+    Her adımda yalnızca seçilen kutu ile kalanlar arasındaki IoU hesaplanır,
+    bu yüzden bellek kullanımı O(N)'dir.
+
+    Args:
+        boxes (array-like): (N, 4) kutular.
+        scores (array-like): (N,) skorlar.
+        iou_threshold (float): Bu değerden büyük IoU'ya sahip kutular bastırılır.
+        fmt (str): Kutuların formatı ('pascal', 'coco' veya 'yolo').
+        size (array-like, optional): YOLO görüntü boyutu.
+
+    Returns:
+        np.ndarray: Korunan kutuların skora göre azalan sıradaki indisleri.
+    """
+    return _greedy_nms(as_pascal(boxes, fmt, size), np.asarray(scores, dtype=np.float64), iou_threshold)
+
+def batched_nms(boxes, scores, classes, iou_threshold: float = 0.5, fmt: str = 'pascal', size=None) -> np.ndarray:
+    """
+    Sınıf farkındalıklı NMS uygular; farklı sınıflardaki kutular birbirini bastırmaz.
+
+    Kutular sınıf numarasına göre birbirinden uzaklaştırılır ve tek bir NMS
+    çağrısı yapılır.
+
+    Args:
+        boxes (array-like): (N, 4) kutular.
+        scores (array-like): (N,) skorlar.
+        classes (array-like): (N,) tam sayı sınıf numaraları.
+        iou_threshold (float): Bastırma eşiği.
+        fmt (str): Kutuların formatı ('pascal', 'coco' veya 'yolo').
+        size (array-like, optional): YOLO görüntü boyutu.
+
+    Returns:
+        np.ndarray: Korunan kutuların skora göre azalan sıradaki indisleri.
+    """
+    pascal = as_pascal(boxes, fmt, size)
+    if len(pascal) == 0:
+        return np.empty(0, dtype=np.int64)
+    _, class_index = np.unique(np.asarray(classes), return_inverse=True)
+    offset = pascal.max() - min(pascal.min(), 0) + 1
+    shifted = pascal + (class_index.reshape(-1) * offset)[:, None]
+    return _greedy_nms(shifted, np.asarray(scores, dtype=np.float64), iou_threshold)
+
+def soft_nms(boxes, scores, iou_threshold: float = 0.3, sigma: float = 0.5, score_threshold: float = 0.001,
+             method: str = 'gaussian', fmt: str = 'pascal', size=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Soft-NMS uygular: çakışan kutular silinmek yerine skorları düşürülür.
+
+    Args:
+        boxes (array-like): (N, 4) kutular.
+        scores (array-like): (N,) skorlar.
+        iou_threshold (float): 'linear' yöntemde skor düşürme eşiği.
+        sigma (float): 'gaussian' yöntemin genişliği.
+        score_threshold (float): Bu skorun altına düşen kutular atılır.
+        method (str): 'gaussian' veya 'linear'.
+        fmt (str): Kutuların formatı ('pascal', 'coco' veya 'yolo').
+        size (array-like, optional): YOLO görüntü boyutu.
+
+    Returns:
+        tuple: (korunan indisler, güncellenmiş skorları) seçilme sırasıyla.
+
+    Raises:
+        ValueError: Desteklenmeyen bir yöntem istendiğinde.
+    """
+    if method not in ('gaussian', 'linear'):
+        raise ValueError(f"Unsupported soft-NMS method: {method}")
+    pascal = as_pascal(boxes, fmt, size)
+    current = np.asarray(scores, dtype=np.float64).copy()
+    remaining = np.flatnonzero(current >= score_threshold)
+    keep, kept_scores = [], []
+    while remaining.size:
+        i = int(np.argmax(current[remaining]))
+        best = remaining[i]
+        keep.append(best)
+        kept_scores.append(current[best])
+        remaining = np.delete(remaining, i)
+        if not remaining.size:
+            break
+        iou = _iou(pascal[best:best + 1], pascal[remaining])[0]
+        if method == 'gaussian':
+            decay = np.exp(-(iou ** 2) / sigma)
+        else:
+            decay = np.where(iou > iou_threshold, 1 - iou, 1.0)
+        current[remaining] *= decay
+        remaining = remaining[current[remaining] >= score_threshold]
+    return np.array(keep, dtype=np.int64), np.array(kept_scores, dtype=np.float64)
@@ -5,8 +5,37 @@ from pyprocess.convert.bboxes.convert_bbox import (
     coco_to_yolo,
     coco_to_pascal,
     pascal_to_coco,
-    pascal_to_yolo
+    pascal_to_yolo,
+    pascal_to_cxcywh,
+    cxcywh_to_pascal,
+    pascal_to_pascal_norm,
+    pascal_norm_to_pascal,
+    clip_pascal,
+    VALIDATION_MODES
 )
+from pyprocess.convert.bboxes.batch import (
+    convert_bbox_batch,
+    yolo_to_coco_batch,
+    yolo_to_pascal_batch,
+    coco_to_yolo_batch,
+    coco_to_pascal_batch,
+    pascal_to_coco_batch,
+    pascal_to_yolo_batch,
+    pascal_to_cxcywh_batch,
+    cxcywh_to_pascal_batch,
+    pascal_to_pascal_norm_batch,
+    pascal_norm_to_pascal_batch,
+    validate_pascal_batch,
+    validate_coco_batch,
+    validate_yolo_batch
+)
+from pyprocess.convert.bboxes.plan import (
+    ConversionPlan,
+    available_formats,
+    get_plan,
+    register_format
+)
+from pyprocess.convert.annotations import AnnotationStore, convert_dataset, convert_dataset_parallel
 
 __all__ = [
     'convert_bbox',
@@ -15,5 +44,32 @@ __all__ = [
     'coco_to_yolo',
     'coco_to_pascal',
     'pascal_to_coco',
-    'pascal_to_yolo'
+    'pascal_to_yolo',
+    'pascal_to_cxcywh',
+    'cxcywh_to_pascal',
+    'pascal_to_pascal_norm',
+    'pascal_norm_to_pascal',
+    'clip_pascal',
+    'VALIDATION_MODES',
+    'convert_bbox_batch',
+    'yolo_to_coco_batch',
+    'yolo_to_pascal_batch',
+    'coco_to_yolo_batch',
+    'coco_to_pascal_batch',
+    'pascal_to_coco_batch',
+    'pascal_to_yolo_batch',
+    'pascal_to_cxcywh_batch',
+    'cxcywh_to_pascal_batch',
+    'pascal_to_pascal_norm_batch',
+    'pascal_norm_to_pascal_batch',
+    'validate_pascal_batch',
+    'validate_coco_batch',
+    'validate_yolo_batch',
+    'ConversionPlan',
+    'available_formats',
+    'get_plan',
+    'register_format',
+    'AnnotationStore',
+    'convert_dataset',
+    'convert_dataset_parallel'
 ]
\ No newline at end of file
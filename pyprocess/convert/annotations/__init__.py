@@ -0,0 +1,25 @@
+from pyprocess.convert.annotations.record import ImageAnnotation
+from pyprocess.convert.annotations.yolo import iter_yolo, write_yolo
+from pyprocess.convert.annotations.coco import iter_coco, write_coco
+from pyprocess.convert.annotations.voc import iter_voc, write_voc
+from pyprocess.convert.annotations.store import AnnotationStore, iter_store, write_store
+from pyprocess.convert.annotations.dataset import convert_dataset, iter_dataset, write_dataset
+from pyprocess.convert.annotations.parallel import ConversionProgress, convert_dataset_parallel
+
+__all__ = [
+    'ImageAnnotation',
+    'iter_yolo',
+    'write_yolo',
+    'iter_coco',
+    'write_coco',
+    'iter_voc',
+    'write_voc',
+    'AnnotationStore',
+    'iter_store',
+    'write_store',
+    'convert_dataset',
+    'iter_dataset',
+    'write_dataset',
+    'ConversionProgress',
+    'convert_dataset_parallel'
+]
\ No newline at end of file
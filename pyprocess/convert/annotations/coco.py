@@ -0,0 +1,305 @@
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from pyprocess.convert.bboxes.batch import coco_to_pascal_batch, pascal_to_coco_batch
+from pyprocess.convert.annotations.record import ImageAnnotation, convert_record_boxes, empty_boxes
+from pyprocess.convert.annotations.yolo import ClassMap
+
+_WHITESPACE = ' \t\n\r'
+
+class JsonStream:
+    """
+    Büyük JSON dosyalarını parça parça okuyan artımlı (incremental) ayrıştırıcı.
+    Bellekte yalnızca o an çözülen değer ve bir okuma parçası tutulur.
+    """
+    def __init__(self, file, chunk_size: int = 1 << 20):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Malformed JSON: expected '{char}' at offset {self.pos}.")
+        self.pos += 1
+
+    def decode(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                # Parça sonunda biten sayılar eksik okunmuş olabilir.
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if not self._fill():
+                value, self.pos = self.decoder.raw_decode(self.buf, self.pos)
+                return value
+
+    def iter_array(self) -> Iterator:
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.decode()
+            char = self.peek()
+            self.pos += 1
+            if char == ']':
+                return
+            if char != ',':
+                raise ValueError(f"Malformed JSON: expected ',' or ']' at offset {self.pos}.")
+
+def iter_json_arrays(path: str, keys: Set[str]) -> Iterator[Tuple[str, object]]:
+    """
+    Üst seviye JSON nesnesindeki seçili dizilerin elemanlarını tek tek üretir.
+    Diğer diziler de eleman eleman okunup atlanır, bu yüzden bellek sınırlı kalır.
+
+    Args:
+        path (str): JSON dosyası.
+        keys (set): Elemanları üretilecek üst seviye anahtarlar.
+
+    Yields:
+        tuple: (anahtar, eleman) çiftleri.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        stream = JsonStream(file)
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+        while True:
+            key = stream.decode()
+            stream.expect(':')
+            if stream.peek() == '[':
+                for item in stream.iter_array():
+                    if key in keys:
+                        yield key, item
+            else:
+                stream.decode()
+            char = stream.peek()
+            stream.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise ValueError("Malformed JSON: expected ',' or '}'.")
+
+def _group_annotations(annotations: Iterable[Tuple[int, int, List[float]]]) -> Dict[int, list]:
+    groups: Dict[int, list] = {}
+    for image_id, category_id, bbox in annotations:
+        groups.setdefault(image_id, []).append((category_id, bbox))
+    return groups
+
+def _read_bucket(path: str) -> Iterator[Tuple[int, int, List[float]]]:
+    with open(path, 'r') as file:
+        for line in file:
+            image_id, category_id, x, y, w, h = line.split()
+            yield int(image_id), int(category_id), [float(x), float(y), float(w), float(h)]
+
+def iter_coco(json_path: str, bucket_bytes: int = 256 << 20, validation: str = 'strict') -> Iterator[ImageAnnotation]:
+    """
+    COCO JSON dosyasını akış halinde okuyarak görüntü başına anotasyon üretir.
+
+    İlk geçişte yalnızca `images` ve `categories` okunur. İkinci geçişte
+    `annotations` dizisi eleman eleman okunur; dosya `bucket_bytes`'tan
+    büyükse anotasyonlar image_id'ye göre geçici dosyalara bölünür ve her
+    bölüm ayrı ayrı gruplanır, böylece bellek kullanımı dosya boyutundan
+    bağımsız kalır.
+
+    Args:
+        json_path (str): COCO JSON dosyası.
+        bucket_bytes (int): Bellekte gruplanacak yaklaşık en büyük veri miktarı.
+        validation (str): 'strict', 'clip' veya 'trusted'; 'strict' dışında geçersiz kutular NaN satır olur.
+
+    Yields:
+        ImageAnnotation: Her görüntü için bir kayıt; her bölüm içinde `images` sırasıyla.
+    """
+    images: Dict[int, Tuple[str, int, int]] = {}
+    categories: Dict[int, str] = {}
+    for key, item in iter_json_arrays(json_path, {'images', 'categories'}):
+        if key == 'images':
+            images[item['id']] = (item['file_name'], item['width'], item['height'])
+        else:
+            categories[item['id']] = item['name']
+
+    annotations = ((item['image_id'], item['category_id'], item['bbox'])
+                   for _, item in iter_json_arrays(json_path, {'annotations'}))
+    n_buckets = max(1, -(-os.path.getsize(json_path) // bucket_bytes))
+
+    if n_buckets == 1:
+        yield from _build_records(images, images, categories, _group_annotations(annotations), validation)
+        return
+
+    with tempfile.TemporaryDirectory(prefix='pyprocess-coco-') as tmp:
+        paths = [os.path.join(tmp, f'{i}.txt') for i in range(n_buckets)]
+        buckets = [open(path, 'w', buffering=1 << 20) for path in paths]
+        try:
+            for image_id, category_id, (x, y, w, h) in annotations:
+                buckets[image_id % n_buckets].write(f"{image_id} {category_id} {x!r} {y!r} {w!r} {h!r}\n")
+        finally:
+            for bucket in buckets:
+                bucket.close()
+        for i, path in enumerate(paths):
+            order = [image_id for image_id in images if image_id % n_buckets == i]
+            groups = _group_annotations(_read_bucket(path))
+            yield from _build_records(order, images, categories, groups, validation)
+
+def _build_records(order, images, categories, groups, validation: str = 'strict') -> Iterator[ImageAnnotation]:
+    for image_id in order:
+        file_name, width, height = images[image_id]
+        items = groups.get(image_id, [])
+        if items:
+            coco = np.array([bbox for _, bbox in items], dtype=np.float64)
+            if validation == 'strict':
+                boxes = coco_to_pascal_batch(coco, out=coco)
+            else:
+                boxes, _ = coco_to_pascal_batch(coco, out=coco, validation=validation, return_mask=True)
+        else:
+            boxes = empty_boxes()
+        labels = [categories[category_id] for category_id, _ in items]
+        yield ImageAnnotation(file_name, width, height, boxes, labels)
+
+def coco_image_json(image_id: int, record: ImageAnnotation) -> str:
+    return json.dumps({'id': image_id, 'file_name': record.file_name,
+                       'width': record.width, 'height': record.height})
+
+def coco_annotation_fragments(record: ImageAnnotation, image_id: int, class_map: ClassMap,
+                              validation: str = 'strict') -> List[str]:
+    """
+    Bir görüntünün kutularını `id` alanı olmayan COCO anotasyon parçalarına çevirir.
+
+    Anotasyon numaraları genel sıraya bağlı olduğundan, parçalar yazılırken
+    `{"id": <n>, ` öneki eklenir. Böylece paralel işçiler numaraları bilmeden
+    metni hazırlayabilir.
+
+    Args:
+        record (ImageAnnotation): Görüntünün anotasyonları.
+        image_id (int): Görüntünün COCO numarası.
+        class_map (ClassMap): Sınıf adlarını numaralara eşleyen tablo.
+        validation (str): 'strict', 'clip' veya 'trusted'; son ikisinde geçersiz kutular atlanır.
+
+    Returns:
+        list: Her geçerli kutu için `"image_id": ...}` biçiminde JSON parçası.
+    """
+    coco, labels, _ = convert_record_boxes(record, pascal_to_coco_batch, validation=validation)
+    return [json.dumps({'image_id': image_id, 'category_id': class_map[label] + 1,
+                        'bbox': [x, y, w, h], 'area': w * h, 'iscrowd': 0})[1:]
+            for label, (x, y, w, h) in zip(labels, coco.tolist())]
+
+def join_annotations(fragments: List[str], first_id: int) -> str:
+    return ', '.join(f'{{"id": {i}, {fragment}' for i, fragment in enumerate(fragments, first_id))
+
+def coco_categories_json(class_map: ClassMap) -> str:
+    return json.dumps([{'id': i + 1, 'name': name} for i, name in enumerate(class_map.names)])
+
+class CocoWriter:
+    """
+    COCO JSON dosyasını akış halinde yazar.
+
+    `images` çıktının yanındaki geçici bir dosyaya, `annotations` ise ayrı
+    bir geçici dosyaya tamponlu olarak yazılır ve `close` çağrısında
+    birleştirilip çıktı dosyasının yerine taşınır; bu sayede tüm veri kümesi
+    bellekte tutulmaz ve yarıda kalan bir yazma tamamlanmış bir dosya gibi
+    görünmez. Hata durumunda `abort` geçici dosyaları siler. 'strict'
+    dışındaki doğrulama modlarında atlanan kutular `invalid` sayacında toplanır.
+    """
+    def __init__(self, out_path: str, class_map: ClassMap, validation: str = 'strict'):
+        out_dir = os.path.dirname(os.path.abspath(out_path))
+        os.makedirs(out_dir, exist_ok=True)
+        self.class_map = class_map
+        self.validation = validation
+        self.images = 0
+        self.boxes = 0
+        self.invalid = 0
+        self.out_path = out_path
+        self.tmp_path = out_path + '.tmp'
+        self.out = open(self.tmp_path, 'w', encoding='utf-8', buffering=1 << 20)
+        self.spool = tempfile.TemporaryFile('w+', encoding='utf-8', dir=out_dir, buffering=1 << 20)
+        self.out.write('{"images": [')
+
+    def write_images(self, images_json: List[str]) -> None:
+        if images_json:
+            self.out.write((', ' if self.images else '') + ', '.join(images_json))
+            self.images += len(images_json)
+
+    def write_annotations(self, fragments: List[str]) -> None:
+        if fragments:
+            self.spool.write((', ' if self.boxes else '') + join_annotations(fragments, self.boxes + 1))
+            self.boxes += len(fragments)
+
+    def write(self, record: ImageAnnotation) -> None:
+        self.write_images([coco_image_json(self.images + 1, record)])
+        fragments = coco_annotation_fragments(record, self.images, self.class_map, self.validation)
+        self.write_annotations(fragments)
+        self.invalid += len(record.boxes) - len(fragments)
+
+    def close(self) -> Dict[str, int]:
+        self.out.write('], "annotations": [')
+        self.spool.seek(0)
+        shutil.copyfileobj(self.spool, self.out, 1 << 20)
+        self.out.write('], "categories": ' + coco_categories_json(self.class_map) + '}')
+        self.spool.close()
+        self.out.close()
+        os.replace(self.tmp_path, self.out_path)
+        return {'images': self.images, 'boxes': self.boxes, 'invalid': self.invalid}
+
+    def abort(self) -> None:
+        """
+        Dosyaları JSON'u tamamlamadan kapatır ve geçici çıktıyı siler; hedef dosyaya dokunulmaz.
+        """
+        self.spool.close()
+        self.out.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+def write_coco(records: Iterable[ImageAnnotation], out_path: str,
+               classes: Optional[List[str]] = None, validation: str = 'strict') -> Dict[str, int]:
+    """
+    Anotasyonları tek bir COCO JSON dosyasına akış halinde yazar.
+
+    Args:
+        records: ImageAnnotation kayıtları.
+        out_path (str): Çıktı JSON dosyası.
+        classes (list, optional): Kategori adları; verilmezse kayıtlardan türetilir.
+        validation (str): 'strict', 'clip' veya 'trusted'; son ikisinde geçersiz kutular atılır.
+
+    Returns:
+        dict: Yazılan görüntü, kutu ve atılan (geçersiz) kutu sayıları.
+    """
+    writer = CocoWriter(out_path, ClassMap(classes), validation)
+    try:
+        for record in records:
+            writer.write(record)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
@@ -0,0 +1,101 @@
+from typing import Dict, Iterator, List, Optional
+
+from pyprocess.convert.annotations.record import ImageAnnotation
+from pyprocess.convert.annotations.yolo import SizeLookup, iter_yolo, write_yolo
+from pyprocess.convert.annotations.coco import iter_coco, write_coco
+from pyprocess.convert.annotations.voc import iter_voc, write_voc
+from pyprocess.convert.annotations.store import iter_store, write_store
+from pyprocess.utils import metrics
+
+_WRITERS = {
+    'yolo': write_yolo,
+    'coco': write_coco,
+    'voc': write_voc,
+    'store': write_store,
+}
+
+def iter_dataset(src: str, src_format: str, size_of: Optional[SizeLookup] = None,
+                 classes: Optional[List[str]] = None, image_ext: str = '.jpg',
+                 validation: str = 'strict', size_cache: Optional[str] = None) -> Iterator[ImageAnnotation]:
+    """
+    Bir anotasyon kaynağını akış halinde okur.
+
+    Args:
+        src (str): YOLO/VOC için dizin, COCO için JSON dosyası, store için depo dosyası.
+        src_format (str): Kaynak format ('yolo', 'coco', 'voc' veya 'store').
+        size_of: YOLO için görüntü adından (width, height) döndüren callable, dict veya görüntü dizini.
+        classes (list, optional): YOLO sınıf adları.
+        image_ext (str): YOLO görüntü dosyalarının uzantısı.
+        validation (str): 'strict', 'clip' veya 'trusted'; 'strict' dışında geçersiz kutular NaN satır olur.
+        size_cache (str, optional): size_of bir dizinse kalıcı boyut önbelleğinin yolu.
+
+    Returns:
+        Iterator[ImageAnnotation]: Görüntü başına anotasyon kayıtları.
+
+    Raises:
+        ValueError: Desteklenmeyen bir format istendiğinde.
+    """
+    if src_format == 'yolo':
+        return iter_yolo(src, size_of, classes, image_ext, validation, size_cache)
+    if src_format == 'coco':
+        return iter_coco(src, validation=validation)
+    if src_format == 'voc':
+        return iter_voc(src)
+    if src_format == 'store':
+        return iter_store(src)
+    raise ValueError(f"Unsupported dataset format: {src_format}")
+
+def write_dataset(records, dst: str, dst_format: str, classes: Optional[List[str]] = None,
+                  validation: str = 'strict') -> Dict[str, int]:
+    """
+    Anotasyon kayıtlarını hedef formatta yazar.
+
+    Args:
+        records: ImageAnnotation kayıtları.
+        dst (str): YOLO/VOC için dizin, COCO için JSON dosyası, store için depo dosyası.
+        dst_format (str): Hedef format ('yolo', 'coco', 'voc' veya 'store').
+        classes (list, optional): Sınıf adları.
+        validation (str): 'strict', 'clip' veya 'trusted'; son ikisinde geçersiz kutular atılır.
+
+    Returns:
+        dict: Yazılan görüntü, kutu ve atılan (geçersiz) kutu sayıları.
+
+    Raises:
+        ValueError: Desteklenmeyen bir format istendiğinde.
+    """
+    writer = _WRITERS.get(dst_format)
+    if writer is None:
+        raise ValueError(f"Unsupported dataset format: {dst_format}")
+    return writer(records, dst, classes, validation)
+
+def convert_dataset(src: str, src_format: str, dst: str, dst_format: str,
+                    size_of: Optional[SizeLookup] = None, classes: Optional[List[str]] = None,
+                    image_ext: str = '.jpg', validation: str = 'strict',
+                    size_cache: Optional[str] = None) -> Dict[str, int]:
+    """
+    Tüm bir anotasyon ağacını formatlar arasında dönüştürür.
+
+    Kaynak görüntü görüntü okunur ve hedefe hemen yazılır; bellek kullanımı
+    veri kümesinin boyutundan bağımsızdır.
+
+    Args:
+        src (str): Kaynak dizin, COCO JSON dosyası veya depo dosyası.
+        src_format (str): Kaynak format ('yolo', 'coco', 'voc' veya 'store').
+        dst (str): Hedef dizin, COCO JSON dosyası veya depo dosyası.
+        dst_format (str): Hedef format ('yolo', 'coco', 'voc' veya 'store').
+        size_of: YOLO kaynakları için görüntü boyutları (callable, dict veya görüntü dizini).
+        classes (list, optional): Sınıf adları.
+        image_ext (str): YOLO görüntü dosyalarının uzantısı.
+        validation (str): 'strict' (ilk geçersiz kutuda hata), 'clip' (kutular görüntüye kırpılır)
+            veya 'trusted' (kontrol yapılmaz). Son ikisinde geçersiz kalan kutular atlanır.
+        size_cache (str, optional): size_of bir dizinse kalıcı boyut önbelleğinin yolu; verilmezse
+            boyutlar her çalışmada başlıklardan yeniden okunur.
+
+    Returns:
+        dict: Yazılan görüntü, kutu ve atılan (geçersiz) kutu sayıları.
+    """
+    records = iter_dataset(src, src_format, size_of, classes, image_ext, validation, size_cache)
+    with metrics.timer('convert.dataset'):
+        stats = write_dataset(records, dst, dst_format, classes, validation)
+    metrics.count('convert.images', stats['images'])
+    return stats
@@ -0,0 +1,220 @@
+import os
+import time
+from collections import deque
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pyprocess.convert.annotations.record import ImageAnnotation, write_atomic
+from pyprocess.convert.annotations.yolo import (
+    ClassMap, SizeLookup, iter_label_files, read_yolo_file, size_resolver, write_yolo
+)
+from pyprocess.convert.annotations.coco import (
+    CocoWriter, coco_annotation_fragments, coco_image_json, iter_coco
+)
+from pyprocess.convert.annotations.voc import read_voc_file, write_voc
+from pyprocess.utils import metrics
+
+class ConversionProgress:
+    """
+    Paralel dönüşümün ilerleme ve hız sayaçları.
+
+    Attributes:
+        shards_done (int): Birleştirilen parça sayısı.
+        images (int): İşlenen görüntü sayısı.
+        boxes (int): Yazılan kutu sayısı.
+        invalid (int): Doğrulamada atılan kutu sayısı.
+        skipped (int): Devam ettirmede (resume) çıktısı zaten bulunduğu için atlanan görüntü sayısı.
+        started (float): Başlangıç zamanı (`time.perf_counter`).
+    """
+    def __init__(self):
+        self.shards_done = 0
+        self.images = 0
+        self.boxes = 0
+        self.invalid = 0
+        self.skipped = 0
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def images_per_second(self) -> float:
+        return self.images / max(self.elapsed, 1e-9)
+
+    @property
+    def boxes_per_second(self) -> float:
+        return self.boxes / max(self.elapsed, 1e-9)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'shards': self.shards_done,
+            'images': self.images,
+            'boxes': self.boxes,
+            'invalid': self.invalid,
+            'skipped': self.skipped,
+            'elapsed': self.elapsed,
+            'images_per_second': self.images_per_second,
+            'boxes_per_second': self.boxes_per_second,
+        }
+
+def _read_shard(task) -> List[ImageAnnotation]:
+    src_format, items, sizes, classes, image_ext = task[:5]
+    validation = task[8]
+    if src_format == 'yolo':
+        return [read_yolo_file(path, sizes[i], classes, image_ext, validation) for i, path in enumerate(items)]
+    if src_format == 'voc':
+        return [read_voc_file(path) for path in items]
+    return items
+
+def _output_path(record: ImageAnnotation, dst: str, dst_format: str) -> str:
+    stem = os.path.splitext(os.path.basename(record.file_name))[0]
+    return os.path.join(dst, stem + ('.txt' if dst_format == 'yolo' else '.xml'))
+
+def _convert_shard(task) -> Tuple[int, int, int, int, Optional[Tuple[List[str], List[str]]]]:
+    """
+    Tek bir parçayı işçi sürecinde dönüştürür.
+
+    YOLO ve VOC hedeflerinde dosyalar doğrudan işçide yazılır; `resume` açıksa
+    çıktısı zaten bulunan kayıtlar atlanır. COCO hedefinde görüntü JSON'u ve
+    `id`'siz anotasyon parçaları ana sürece döndürülür. Dönüş değeri
+    (görüntü, yazılan kutu, atılan kutu, atlanan görüntü, COCO parçaları) beşlisidir.
+    """
+    _, _, _, classes, _, dst, dst_format, first_image_id, validation, resume = task
+    records = _read_shard(task)
+    if dst_format == 'coco':
+        class_map = ClassMap(classes)
+        images_json, fragments = [], []
+        for image_id, record in enumerate(records, first_image_id):
+            images_json.append(coco_image_json(image_id, record))
+            fragments.extend(coco_annotation_fragments(record, image_id, class_map, validation))
+        total = sum(len(record.boxes) for record in records)
+        return len(records), len(fragments), total - len(fragments), 0, (images_json, fragments)
+    skipped = 0
+    if resume:
+        pending = [record for record in records if not os.path.exists(_output_path(record, dst, dst_format))]
+        skipped = len(records) - len(pending)
+        records = pending
+    if dst_format == 'yolo':
+        stats = write_yolo(records, dst, classes, validation, write_classes=False)
+    else:
+        stats = write_voc(records, dst, validation=validation)
+    return stats['images'], stats['boxes'], stats['invalid'], skipped, None
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def convert_dataset_parallel(src: str, src_format: str, dst: str, dst_format: str,
+                             size_of: Optional[SizeLookup] = None, classes: Optional[List[str]] = None,
+                             image_ext: str = '.jpg', workers: Optional[int] = None, chunk_size: int = 512,
+                             progress: Optional[Callable[[ConversionProgress], None]] = None,
+                             validation: str = 'strict', resume: bool = False,
+                             size_cache: Optional[str] = None) -> Dict[str, float]:
+    """
+    Anotasyon ağacını süreç havuzu (process pool) ile paralel olarak dönüştürür.
+
+    Girdi dosya listesi `chunk_size` büyüklüğünde parçalara bölünür ve işçilere
+    dağıtılır. Sonuçlar parça sırasıyla birleştirilir, bu yüzden çıktı
+    `convert_dataset` ile aynıdır. YOLO kaynaklarında görüntü boyutları ana
+    süreçte `size_of` indeksinden çözülür ve parçayla birlikte gönderilir;
+    işçiler görüntü açmaz. Aynı anda en fazla `2 * workers` parça işlemdedir.
+
+    Args:
+        src (str): Kaynak dizin veya COCO JSON dosyası.
+        src_format (str): Kaynak format ('yolo', 'coco' veya 'voc').
+        dst (str): Hedef dizin veya COCO JSON dosyası.
+        dst_format (str): Hedef format ('yolo', 'coco' veya 'voc').
+        size_of: YOLO kaynakları için görüntü boyutları (callable, dict veya görüntü dizini).
+        classes (list, optional): Sınıf adları; YOLO ve COCO hedefleri için zorunludur.
+        image_ext (str): YOLO görüntü dosyalarının uzantısı.
+        workers (int, optional): İşçi süreç sayısı; varsayılan `os.cpu_count()`.
+        chunk_size (int): Parça başına görüntü sayısı.
+        progress (callable, optional): Her parça birleştirildiğinde çağrılır.
+        validation (str): 'strict', 'clip' veya 'trusted'; son ikisinde geçersiz kutular atılır ve
+            'invalid' olarak sayılır.
+        resume (bool): True ise yarıda kalmış bir dönüşüme devam edilir; hedefte çıktı dosyası
+            zaten bulunan görüntüler yeniden yazılmaz ve 'skipped' olarak sayılır. Yalnızca
+            görüntü başına dosya yazan YOLO ve VOC hedeflerinde desteklenir.
+        size_cache (str, optional): size_of bir dizinse kalıcı boyut önbelleğinin yolu; verilmezse
+            boyutlar her çalışmada başlıklardan yeniden okunur.
+
+    Returns:
+        dict: Görüntü/kutu/atılan kutu sayıları, süre ve saniye başına verim.
+
+    Raises:
+        ValueError: Desteklenmeyen bir format istendiğinde, sınıf listesi eksikse veya COCO
+            hedefinde resume istenirse.
+    """
+    if dst_format not in ('yolo', 'coco', 'voc'):
+        raise ValueError(f"Unsupported dataset format: {dst_format}")
+    if resume and dst_format == 'coco':
+        raise ValueError("Resuming is only supported for per-image (YOLO or VOC) destinations.")
+    if classes is None and dst_format in ('yolo', 'coco'):
+        raise ValueError("Parallel conversion to YOLO or COCO needs an explicit class list.")
+    if src_format == 'yolo':
+        resolve = size_resolver(size_of, size_cache)
+        shards = ((chunk, [resolve(os.path.splitext(os.path.basename(p))[0]) for p in chunk])
+                  for chunk in _chunks(iter_label_files(src), chunk_size))
+    elif src_format == 'voc':
+        shards = ((chunk, None) for chunk in _chunks(iter_label_files(src, suffix='.xml'), chunk_size))
+    elif src_format == 'coco':
+        shards = ((chunk, None) for chunk in _chunks(iter_coco(src, validation=validation), chunk_size))
+    else:
+        raise ValueError(f"Unsupported dataset format: {src_format}")
+    if dst_format != 'coco':
+        os.makedirs(dst, exist_ok=True)
+
+    # multiprocessing yalnızca paralel dönüşüm çağrıldığında yüklenir; `import pyprocess.convert` hafif kalır.
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    state = ConversionProgress()
+    writer = CocoWriter(dst, ClassMap(classes)) if dst_format == 'coco' else None
+    pending = deque()
+    next_image_id = 1
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shards = iter(shards)
+            while True:
+                while len(pending) < 2 * workers:
+                    shard = next(shards, None)
+                    if shard is None:
+                        break
+                    items, sizes = shard
+                    task = (src_format, items, sizes, classes, image_ext, dst, dst_format, next_image_id,
+                            validation, resume)
+                    pending.append(executor.submit(_convert_shard, task))
+                    next_image_id += len(items)
+                if not pending:
+                    break
+                images, boxes, invalid, skipped, coco = pending.popleft().result()
+                if writer is not None:
+                    writer.write_images(coco[0])
+                    writer.write_annotations(coco[1])
+                state.shards_done += 1
+                state.images += images
+                state.boxes += boxes
+                state.invalid += invalid
+                state.skipped += skipped
+                if metrics.ENABLED:
+                    # İşçi süreçlerin sayaçları ana sürece taşınmaz; sayılar parça sonuçlarından eklenir.
+                    metrics.count('convert.images', images)
+                    metrics.count('convert.boxes', boxes)
+                    metrics.count('convert.invalid', invalid)
+                if progress is not None:
+                    progress(state)
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+    if writer is not None:
+        writer.close()
+    if dst_format == 'yolo':
+        write_atomic(os.path.join(dst, 'classes.txt'), ''.join(name + '\n' for name in classes))
+    metrics.observe('convert.dataset', state.elapsed)
+    return state.as_dict()
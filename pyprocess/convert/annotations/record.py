@@ -0,0 +1,87 @@
+import os
+from typing import Callable, List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from pyprocess.utils import metrics
+
+class ImageAnnotation(NamedTuple):
+    """
+    Tek bir görüntünün anotasyonları. Kutular her zaman Pascal VOC
+    ([x_min, y_min, x_max, y_max], piksel) formatında tutulur.
+
+    Attributes:
+        file_name (str): Görüntü dosyasının adı.
+        width (int): Görüntü genişliği.
+        height (int): Görüntü yüksekliği.
+        boxes (np.ndarray): (N, 4) Pascal VOC bounding box dizisi. 'strict' dışındaki
+            doğrulama modlarında okuyucular geçersiz kutuları NaN satır olarak bırakır;
+            bu satırlar yazıcılar tarafından atılır.
+        labels (list): Her kutunun sınıf adı.
+    """
+    file_name: str
+    width: int
+    height: int
+    boxes: np.ndarray
+    labels: List[str]
+
+def empty_boxes() -> np.ndarray:
+    return np.empty((0, 4), dtype=np.float64)
+
+def write_atomic(path: str, data: Union[str, bytes]) -> None:
+    """
+    Dosyayı önce aynı dizindeki geçici bir dosyaya yazar, sonra yerine taşır.
+
+    Yarıda kesilen bir yazma hedefte yarım bir dosya bırakmaz; `resume`
+    yalnızca var olan dosyalara baktığı için bu gereklidir.
+
+    Args:
+        path (str): Hedef dosya.
+        data (str or bytes): Dosya içeriği.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb' if isinstance(data, bytes) else 'w') as file:
+        file.write(data)
+    os.replace(tmp_path, path)
+
+def convert_record_boxes(record: ImageAnnotation, batch_func: Callable, *args,
+                         validation: str = 'strict') -> Tuple[np.ndarray, List[str], int]:
+    """
+    Bir kaydın kutularını toplu dönüşüm fonksiyonuyla çevirir.
+
+    'strict' modda geçersiz bir kutu hata fırlatır. Diğer modlarda geçersiz
+    kutular (okuyucunun NaN bıraktığı satırlar dahil) etiketleriyle birlikte
+    atılır ve sayılır.
+
+    Args:
+        record (ImageAnnotation): Görüntünün anotasyonları.
+        batch_func (callable): (boxes, *args, validation=, return_mask=) imzalı toplu dönüşüm.
+        *args: batch_func'a geçirilecek ek argümanlar (örn. görüntü boyutu).
+        validation (str): 'strict', 'clip' veya 'trusted'.
+
+    Returns:
+        tuple: (dönüştürülmüş kutular, etiketler, atılan kutu sayısı).
+    """
+    if validation == 'strict':
+        if not metrics.ENABLED:
+            return batch_func(record.boxes, *args), record.labels, 0
+        try:
+            converted = batch_func(record.boxes, *args)
+        except ValueError:
+            metrics.count('convert.validation_failures')
+            raise
+        metrics.count('convert.boxes', len(converted))
+        return converted, record.labels, 0
+    converted, invalid = batch_func(record.boxes, *args, validation=validation, return_mask=True)
+    invalid |= np.isnan(record.boxes).any(axis=1)
+    if not invalid.any():
+        if metrics.ENABLED:
+            metrics.count('convert.boxes', len(converted))
+        return converted, record.labels, 0
+    keep = ~invalid
+    labels = [label for label, kept in zip(record.labels, keep.tolist()) if kept]
+    dropped = int(invalid.sum())
+    if metrics.ENABLED:
+        metrics.count('convert.boxes', len(labels))
+        metrics.count('convert.invalid', dropped)
+    return converted[keep], labels, dropped
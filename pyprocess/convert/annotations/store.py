@@ -0,0 +1,320 @@
+import json
+import os
+import shutil
+import struct
+import tempfile
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from pyprocess.convert.bboxes.batch import validate_pascal_batch
+from pyprocess.convert.bboxes.plan import get_plan
+from pyprocess.convert.annotations.record import ImageAnnotation, convert_record_boxes
+from pyprocess.convert.annotations.yolo import ClassMap
+
+MAGIC = b'PYPANN\x00\x01'
+VERSION = 1
+ALIGN = 64
+# Başlık JSON'u için ayrılan ek alan; yerinde dönüşümde format adı değişince başlık yeniden yazılır.
+HEADER_SLACK = 64
+# (ad, dtype, satır başına ek boyut) — bölümler dosyada bu sırayla, ALIGN sınırlarında durur.
+SECTIONS = (
+    ('boxes', '<f4', (4,)),
+    ('class_ids', '<i4', ()),
+    ('image_ids', '<i4', ()),
+    ('offsets', '<i8', ()),
+    ('sizes', '<i4', (2,)),
+    ('name_offsets', '<i8', ()),
+    ('names', '|u1', ()),
+)
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGN) * ALIGN
+
+def write_store(records: Iterable[ImageAnnotation], out_path: str, classes: Optional[List[str]] = None,
+                validation: str = 'strict', box_format: str = 'pascal') -> Dict[str, int]:
+    """
+    Anotasyonları tek dosyalık, sütunlu bir ikili depoya yazar.
+
+    Kutular (N, 4) float32, sınıf ve görüntü numaraları int32 sütunları
+    olarak tutulur; görüntü başına kutu aralıkları bir ofset tablosundadır.
+    Kayıtlar akış halinde geçici sütun dosyalarına yazılır, ardından tek
+    dosyada birleştirilip atomik olarak yerine taşınır.
+
+    Args:
+        records: ImageAnnotation kayıtları.
+        out_path (str): Depo dosyası.
+        classes (list, optional): Sınıf adları; verilmezse kayıtlardan türetilir.
+        validation (str): 'strict' (geçersiz kutuda hata), 'clip' veya 'trusted'; son ikisinde
+            geçersiz kutular atılır ve 'invalid' olarak sayılır.
+        box_format (str): Kutuların saklanacağı bbox formatı (örn. 'pascal', 'yolo', 'coco').
+
+    Returns:
+        dict: Yazılan görüntü, kutu ve atılan (geçersiz) kutu sayıları.
+    """
+    directory = os.path.dirname(os.path.abspath(out_path))
+    os.makedirs(directory, exist_ok=True)
+    class_map = ClassMap(classes)
+    offsets, sizes, name_offsets = array('q', [0]), array('i'), array('q', [0])
+    boxes = invalid = 0
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        columns = {name: open(os.path.join(tmp, name), 'w+b') for name in ('boxes', 'class_ids', 'image_ids', 'names')}
+        try:
+            for image_id, record in enumerate(records):
+                size = (record.width, record.height) if record.width > 0 and record.height > 0 else None
+                pascal, labels, dropped = convert_record_boxes(record, validate_pascal_batch, size,
+                                                               validation=validation)
+                columns['boxes'].write(np.asarray(pascal, dtype='<f4').tobytes())
+                columns['class_ids'].write(np.array([class_map[label] for label in labels], '<i4').tobytes())
+                columns['image_ids'].write(np.full(len(labels), image_id, '<i4').tobytes())
+                name = record.file_name.encode('utf-8')
+                columns['names'].write(name)
+                boxes += len(labels)
+                invalid += dropped
+                offsets.append(boxes)
+                sizes.extend((record.width, record.height))
+                name_offsets.append(name_offsets[-1] + len(name))
+            tables = {'offsets': offsets, 'sizes': sizes, 'name_offsets': name_offsets}
+            images = len(offsets) - 1
+            tmp_path = os.path.join(tmp, 'store')
+            _assemble(tmp_path, columns, tables, images, boxes, class_map.names)
+        finally:
+            for file in columns.values():
+                file.close()
+        if box_format != 'pascal':
+            with AnnotationStore(tmp_path, mode='r+') as store:
+                store.convert(box_format)
+        os.replace(tmp_path, out_path)
+    return {'images': images, 'boxes': boxes, 'invalid': invalid}
+
+def _assemble(path: str, columns: Dict, tables: Dict[str, array], images: int, boxes: int,
+              classes: List[str]) -> None:
+    rows = {'boxes': boxes, 'class_ids': boxes, 'image_ids': boxes, 'offsets': images + 1, 'sizes': images,
+            'name_offsets': images + 1, 'names': columns['names'].tell()}
+    sections = {}
+    for name, dtype, extra in SECTIONS:
+        shape = [rows[name], *extra]
+        sections[name] = {'dtype': dtype, 'shape': shape,
+                          'nbytes': int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize}
+    header = {'version': VERSION, 'box_format': 'pascal', 'num_images': images, 'num_boxes': boxes,
+              'classes': classes, 'sections': sections}
+    # Bölüm ofsetleri başlık uzunluğuna bağlıdır; başlık için sabit bir alan ayrılıp ofsetler ona göre hesaplanır.
+    capacity = _align(len(json.dumps(header)) + 32 * len(SECTIONS) + HEADER_SLACK)
+    offset = _align(16 + capacity)
+    for name, _, _ in SECTIONS:
+        sections[name]['offset'] = offset
+        offset = _align(offset + sections[name]['nbytes'])
+    with open(path, 'wb') as out:
+        out.write(MAGIC + struct.pack('<I4x', capacity))
+        out.write(json.dumps(header).encode().ljust(capacity))
+        for name, dtype, _ in SECTIONS:
+            out.seek(sections[name]['offset'])
+            if name in columns:
+                columns[name].seek(0)
+                shutil.copyfileobj(columns[name], out, 1 << 20)
+            else:
+                out.write(np.asarray(tables[name], dtype=dtype).tobytes())
+        out.truncate(offset)
+
+class AnnotationStore:
+    """
+    `write_store` ile yazılmış sütunlu anotasyon deposu.
+
+    Dosya bir kez `np.memmap` ile eşlenir; tüm sütunlar bu eşlemin
+    kopyasız görünümleridir. Bir görüntünün kutuları ofset tablosundan
+    O(1) dilimle alınır ve yalnızca dokunulan sayfalar diskten okunur.
+
+    Attributes:
+        box_format (str): Kutuların saklandığı bbox formatı.
+        classes (list): Sınıf adları; `class_ids` bu listeye indekstir.
+        boxes (np.ndarray): (N, 4) float32 kutular.
+        class_ids (np.ndarray): (N,) int32 sınıf numaraları.
+        image_ids (np.ndarray): (N,) int32 kutunun ait olduğu görüntü.
+        offsets (np.ndarray): (M + 1,) int64; i. görüntünün kutuları offsets[i]:offsets[i + 1] aralığındadır.
+        sizes (np.ndarray): (M, 2) int32 görüntü boyutları (width, height).
+
+    Kullanım:
+        with AnnotationStore('train.ppa') as store:
+            boxes = store.image_boxes(10)
+            yolo = store.to_format('yolo')
+    """
+    def __init__(self, path: str, mode: str = 'r'):
+        """
+        Args:
+            path (str): Depo dosyası.
+            mode (str): 'r' salt okunur, 'r+' yerinde dönüşüm için okuma-yazma, 'c' yazılabilir
+                ama diske yansımayan (copy-on-write) eşlem.
+
+        Raises:
+            ValueError: Eğer dosya bir anotasyon deposu değilse, sürümü desteklenmiyorsa veya
+                yarıda kalmış bir yerinde dönüşüm nedeniyle kutuların formatı belirsizse.
+        """
+        self.path = path
+        self.mode = mode
+        self._mmap = np.memmap(path, dtype=np.uint8, mode=mode)
+        if bytes(self._mmap[:8]) != MAGIC:
+            raise ValueError(f"Not an annotation store: {path}")
+        capacity, = struct.unpack('<I', bytes(self._mmap[8:12]))
+        self._capacity = capacity
+        self.header = json.loads(bytes(self._mmap[16:16 + capacity]).decode())
+        if self.header['version'] != VERSION:
+            raise ValueError(f"Unsupported annotation store version: {self.header['version']}")
+        if 'converting' in self.header:
+            raise ValueError(f"Annotation store was left mid-conversion from '{self.header['box_format']}' "
+                             f"to '{self.header['converting']}'; its boxes are unusable: {path}")
+        self.classes: List[str] = self.header['classes']
+        for name, section in self.header['sections'].items():
+            start = section['offset']
+            view = self._mmap[start:start + section['nbytes']].view(section['dtype']).reshape(section['shape'])
+            setattr(self, name, view)
+
+    def __enter__(self) -> 'AnnotationStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.header['num_images']
+
+    def __getitem__(self, index: int) -> ImageAnnotation:
+        return self.record(index)
+
+    def __iter__(self) -> Iterator[ImageAnnotation]:
+        for index in range(len(self)):
+            yield self.record(index)
+
+    def __repr__(self) -> str:
+        return (f"AnnotationStore({self.path!r}, images={len(self)}, boxes={self.num_boxes}, "
+                f"box_format={self.box_format!r})")
+
+    @property
+    def box_format(self) -> str:
+        return self.header['box_format']
+
+    @property
+    def num_boxes(self) -> int:
+        return self.header['num_boxes']
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Annotation store index out of range.")
+        return index
+
+    def image_slice(self, index: int) -> slice:
+        index = self._index(index)
+        return slice(int(self.offsets[index]), int(self.offsets[index + 1]))
+
+    def image_boxes(self, index: int) -> np.ndarray:
+        """
+        Bir görüntünün kutularını deponun formatında, kopyasız görünüm olarak döndürür.
+        """
+        return self.boxes[self.image_slice(index)]
+
+    def file_name(self, index: int) -> str:
+        index = self._index(index)
+        return bytes(self.names[self.name_offsets[index]:self.name_offsets[index + 1]]).decode('utf-8')
+
+    def record(self, index: int) -> ImageAnnotation:
+        """
+        Bir görüntünün anotasyonlarını Pascal VOC kutularıyla (float64 kopya) döndürür.
+        """
+        index = self._index(index)
+        span = self.image_slice(index)
+        width, height = self.sizes[index].tolist()
+        boxes = self.boxes[span]
+        if self.box_format == 'pascal':
+            boxes = boxes.astype(np.float64)
+        else:
+            plan = get_plan(self.box_format, 'pascal', validation='trusted')
+            boxes = plan.batch(boxes, size=(width, height) if plan.needs_size else None)
+        labels = [self.classes[c] for c in self.class_ids[span].tolist()]
+        return ImageAnnotation(self.file_name(index), width, height, boxes, labels)
+
+    def box_sizes(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Kutu başına (width, height) görüntü boyutları; formatlar arası toplu dönüşümler için.
+        """
+        return self.sizes[self.image_ids[start:stop]]
+
+    def to_format(self, to_format: str, out: Optional[np.ndarray] = None, chunk_size: int = 1 << 20) -> np.ndarray:
+        """
+        Tüm kutuları başka bir formata çevirir; depo değişmez.
+
+        Args:
+            to_format (str): Hedef bbox formatı.
+            out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon; verilmezse float32 ayrılır.
+            chunk_size (int): Tek seferde dönüştürülen kutu sayısı (geçici bellek sınırı).
+
+        Returns:
+            np.ndarray: (N, 4) dönüştürülmüş kutular.
+        """
+        if out is None:
+            out = np.empty(self.boxes.shape, dtype=np.float32)
+        self._convert_into(to_format, out, chunk_size)
+        return out
+
+    def convert(self, to_format: str, chunk_size: int = 1 << 20) -> None:
+        """
+        Kutuları diskteki dosyada yerinde başka bir formata çevirir ve başlığı günceller.
+
+        Kutular yazılırken doğrulandığından dönüşüm 'trusted' modda yapılır.
+        Dönüşüm başlamadan önce başlığa hedef format 'converting' olarak işlenir ve
+        yalnızca tüm kutular yazıldıktan sonra yeni format kaydedilir; yarıda kalan bir
+        dönüşümden sonra depo açılmaz, kutular yanlış formatta okunmaz.
+
+        Args:
+            to_format (str): Hedef bbox formatı.
+            chunk_size (int): Tek seferde dönüştürülen kutu sayısı.
+
+        Raises:
+            ValueError: Eğer depo salt okunur açılmışsa veya başlıkta yeni format adına yer yoksa.
+        """
+        if self.mode != 'r+':
+            raise ValueError("In-place conversion needs an annotation store opened with mode='r+'.")
+        if to_format == self.box_format:
+            return
+        # Desteklenmeyen bir format başlık işaretlenmeden önce hata verir.
+        get_plan(self.box_format, to_format, validation='trusted')
+        converting = dict(self.header, converting=to_format)
+        converted = dict(self.header, box_format=to_format)
+        if max(len(json.dumps(converting)), len(json.dumps(converted))) > self._capacity:
+            raise ValueError("Annotation store header has no room for the new format name.")
+        self._write_header(converting)
+        self._convert_into(to_format, self.boxes, chunk_size)
+        self._mmap.flush()
+        self._write_header(converted)
+
+    def _write_header(self, header: Dict) -> None:
+        encoded = json.dumps(header).encode().ljust(self._capacity)
+        self._mmap[16:16 + self._capacity] = np.frombuffer(encoded, dtype=np.uint8)
+        self._mmap.flush()
+        self.header = header
+
+    def _convert_into(self, to_format: str, out: np.ndarray, chunk_size: int) -> None:
+        plan = get_plan(self.box_format, to_format, validation='trusted')
+        for start in range(0, self.num_boxes, chunk_size):
+            stop = min(start + chunk_size, self.num_boxes)
+            size = self.box_sizes(start, stop) if plan.needs_size else None
+            # Dönüşüm float64 ara dizilerde yapılır; sonuç aynı dilime (yerinde ise kendi üzerine) yazılır.
+            plan.batch(self.boxes[start:stop], size=size, out=out[start:stop])
+
+    def flush(self) -> None:
+        if self.mode != 'r':
+            self._mmap.flush()
+
+    def close(self) -> None:
+        self.flush()
+        for name, _, _ in SECTIONS:
+            self.__dict__.pop(name, None)
+        self._mmap = None
+
+def iter_store(path: str) -> Iterator[ImageAnnotation]:
+    """
+    Bir depodaki kayıtları sırayla üretir (kutular Pascal VOC formatında).
+    """
+    with AnnotationStore(path) as store:
+        yield from store
@@ -0,0 +1,108 @@
+import os
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, Iterator
+
+import numpy as np
+
+from pyprocess.convert.bboxes.batch import validate_pascal_batch
+from pyprocess.convert.annotations.record import ImageAnnotation, convert_record_boxes, empty_boxes, write_atomic
+from pyprocess.convert.annotations.yolo import iter_label_files
+
+def read_voc_file(path: str) -> ImageAnnotation:
+    """
+    Tek bir Pascal VOC XML dosyasını `iterparse` ile okur.
+
+    Args:
+        path (str): VOC XML dosyası.
+
+    Returns:
+        ImageAnnotation: Görüntünün anotasyonları.
+    """
+    file_name = os.path.splitext(os.path.basename(path))[0] + '.jpg'
+    width = height = 0
+    labels, rows = [], []
+    for _, elem in ET.iterparse(path, events=('end',)):
+        if elem.tag == 'filename':
+            file_name = (elem.text or '').strip() or file_name
+        elif elem.tag == 'size':
+            width = int(float(elem.findtext('width')))
+            height = int(float(elem.findtext('height')))
+            elem.clear()
+        elif elem.tag == 'object':
+            bndbox = elem.find('bndbox')
+            labels.append(elem.findtext('name').strip())
+            rows.append([float(bndbox.findtext(tag)) for tag in ('xmin', 'ymin', 'xmax', 'ymax')])
+            elem.clear()
+    boxes = np.array(rows, dtype=np.float64) if rows else empty_boxes()
+    return ImageAnnotation(file_name, width, height, boxes, labels)
+
+def iter_voc(xml_dir: str) -> Iterator[ImageAnnotation]:
+    """
+    Pascal VOC XML dizinini dosya dosya okuyarak anotasyon üretir.
+
+    Args:
+        xml_dir (str): VOC XML dosyalarının bulunduğu dizin.
+
+    Yields:
+        ImageAnnotation: Her XML dosyası için bir kayıt.
+    """
+    for path in iter_label_files(xml_dir, suffix='.xml'):
+        yield read_voc_file(path)
+
+def _format_coordinate(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+def to_voc_xml(record: ImageAnnotation) -> bytes:
+    """
+    Bir anotasyon kaydını Pascal VOC XML belgesine çevirir.
+
+    Args:
+        record (ImageAnnotation): Görüntünün anotasyonları.
+
+    Returns:
+        bytes: UTF-8 kodlanmış XML belgesi.
+    """
+    root = ET.Element('annotation')
+    ET.SubElement(root, 'filename').text = record.file_name
+    size = ET.SubElement(root, 'size')
+    ET.SubElement(size, 'width').text = str(record.width)
+    ET.SubElement(size, 'height').text = str(record.height)
+    ET.SubElement(size, 'depth').text = '3'
+    for label, row in zip(record.labels, record.boxes.tolist()):
+        obj = ET.SubElement(root, 'object')
+        ET.SubElement(obj, 'name').text = label
+        bndbox = ET.SubElement(obj, 'bndbox')
+        for tag, value in zip(('xmin', 'ymin', 'xmax', 'ymax'), row):
+            ET.SubElement(bndbox, tag).text = _format_coordinate(value)
+    return ET.tostring(root, encoding='utf-8')
+
+def write_voc(records: Iterable[ImageAnnotation], out_dir: str, classes=None,
+              validation: str = 'strict') -> Dict[str, int]:
+    """
+    Anotasyonları görüntü başına bir Pascal VOC XML dosyası olarak yazar.
+
+    Her dosya geçici bir dosyaya yazılıp yerine taşınır; yarıda kalan bir
+    dönüşüm hedefte kesik XML bırakmaz.
+
+    Args:
+        records: ImageAnnotation kayıtları.
+        out_dir (str): Çıktı dizini.
+        classes: Kullanılmaz; diğer yazıcılarla aynı imza için vardır.
+        validation (str): 'strict' (geçersiz kutuda hata), 'clip' veya 'trusted'; son ikisinde
+            geçersiz kutular atılır ve 'invalid' olarak sayılır.
+
+    Returns:
+        dict: Yazılan görüntü, kutu ve atılan (geçersiz) kutu sayıları.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    images = boxes = invalid = 0
+    for record in records:
+        stem = os.path.splitext(os.path.basename(record.file_name))[0]
+        size = (record.width, record.height) if record.width > 0 and record.height > 0 else None
+        pascal, labels, dropped = convert_record_boxes(record, validate_pascal_batch, size, validation=validation)
+        record = record._replace(boxes=pascal, labels=labels)
+        invalid += dropped
+        write_atomic(os.path.join(out_dir, stem + '.xml'), to_voc_xml(record))
+        images += 1
+        boxes += len(record.boxes)
+    return {'images': images, 'boxes': boxes, 'invalid': invalid}
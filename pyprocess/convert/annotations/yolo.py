@@ -0,0 +1,214 @@
+import os
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from pyprocess.convert.bboxes.batch import pascal_to_yolo_batch, yolo_to_pascal_batch
+from pyprocess.convert.annotations.record import ImageAnnotation, convert_record_boxes, empty_boxes, write_atomic
+from pyprocess.utils.image_size import ImageSizeIndex
+
+SizeLookup = Union[Callable[[str], Tuple[int, int]], Dict[str, Tuple[int, int]], str]
+
+class _DirectorySizes:
+    """
+    Dizin taramasında okunamayan görüntüler için, boyut istendiğinde nedenini bildiren arama tablosu.
+    """
+    def __init__(self, sizes: Dict[str, Tuple[int, int]], failed: Dict[str, str]):
+        self.sizes = sizes
+        self.failed = {os.path.splitext(os.path.basename(path))[0]: message for path, message in failed.items()}
+
+    def __call__(self, stem: str) -> Tuple[int, int]:
+        size = self.sizes.get(stem)
+        if size is None:
+            if stem in self.failed:
+                raise ValueError(f"Cannot read the size of image {stem!r}: {self.failed[stem]}")
+            raise KeyError(stem)
+        return size
+
+def size_resolver(size_of: SizeLookup, size_cache: Optional[str] = None) -> Callable[[str], Tuple[int, int]]:
+    """
+    Görüntü boyutu kaynağını (callable, dict veya görüntü dizini) tek tip bir fonksiyona çevirir.
+
+    Dizin verilirse boyutlar `ImageSizeIndex` ile yalnızca başlıklardan okunur.
+    `size_cache` verilirse boyutlar bu dosyada saklanır ve sonraki çalışmalar
+    yalnızca değişen görüntülerin başlığını okur; görüntü dizinine hiçbir şey
+    yazılmaz. Başlığı okunamayan bir görüntü yalnızca etiketi o görüntünün
+    boyutuna ihtiyaç duyduğunda hata verir.
+
+    Args:
+        size_of: Görüntü adından (uzantısız) (width, height) döndüren callable,
+            dict veya görüntülerin bulunduğu dizin.
+        size_cache (str, optional): Dizin için kalıcı önbellek dosyası; verilmezse önbellek
+            yalnızca bellekte tutulur.
+
+    Returns:
+        callable: stem -> (width, height) fonksiyonu.
+
+    Raises:
+        TypeError: Eğer size_of verilmemişse.
+    """
+    if size_of is None:
+        raise TypeError("YOLO labels need image sizes; pass size_of.")
+    if isinstance(size_of, str):
+        index = ImageSizeIndex(size_cache)
+        sizes = index.directory(size_of)
+        index.save()
+        if index.failed:
+            return _DirectorySizes(sizes, index.failed)
+        size_of = sizes
+    if isinstance(size_of, dict):
+        return size_of.__getitem__
+    return size_of
+
+def iter_label_files(labels_dir: str, suffix: str = '.txt') -> Iterator[str]:
+    """
+    Bir dizindeki etiket dosyalarının yollarını sıralı olarak üretir.
+
+    Args:
+        labels_dir (str): Etiket dizini.
+        suffix (str): Dosya uzantısı.
+
+    Yields:
+        str: Etiket dosyasının yolu.
+    """
+    names = sorted(entry.name for entry in os.scandir(labels_dir)
+                   if entry.is_file() and entry.name.endswith(suffix) and entry.name != 'classes.txt')
+    for name in names:
+        yield os.path.join(labels_dir, name)
+
+def read_yolo_file(path: str, size: Tuple[int, int], classes: Optional[List[str]] = None,
+                   image_ext: str = '.jpg', validation: str = 'strict') -> ImageAnnotation:
+    """
+    Tek bir YOLO etiket dosyasını okur ve kutuları Pascal VOC formatına çevirir.
+
+    Args:
+        path (str): YOLO .txt dosyası.
+        size (tuple): Görüntü boyutu (width, height).
+        classes (list, optional): Sınıf adları; verilmezse sınıf numarası ad olarak kullanılır.
+        image_ext (str): Görüntü dosyasının uzantısı.
+        validation (str): 'strict', 'clip' veya 'trusted'; 'strict' dışında geçersiz kutular NaN satır olur.
+
+    Returns:
+        ImageAnnotation: Görüntünün anotasyonları.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    with open(path, 'r') as file:
+        rows = [line.split() for line in file if line.strip()]
+    if rows:
+        class_ids = [int(row[0]) for row in rows]
+        yolo = np.array([row[1:5] for row in rows], dtype=np.float64)
+        if validation == 'strict':
+            boxes = yolo_to_pascal_batch(yolo, size, out=yolo)
+        else:
+            boxes, _ = yolo_to_pascal_batch(yolo, size, out=yolo, validation=validation, return_mask=True)
+    else:
+        class_ids = []
+        boxes = empty_boxes()
+    labels = [classes[i] if classes else str(i) for i in class_ids]
+    return ImageAnnotation(stem + image_ext, int(size[0]), int(size[1]), boxes, labels)
+
+def iter_yolo(labels_dir: str, size_of: SizeLookup, classes: Optional[List[str]] = None,
+              image_ext: str = '.jpg', validation: str = 'strict',
+              size_cache: Optional[str] = None) -> Iterator[ImageAnnotation]:
+    """
+    YOLO etiket dizinini dosya dosya okuyarak anotasyon üretir.
+
+    Args:
+        labels_dir (str): YOLO .txt dosyalarının bulunduğu dizin.
+        size_of: Görüntü adından (uzantısız) (width, height) döndüren callable, dict veya görüntü dizini.
+        classes (list, optional): Sınıf adları.
+        image_ext (str): Görüntü dosyalarının uzantısı.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        size_cache (str, optional): size_of bir dizinse kalıcı boyut önbelleğinin yolu.
+
+    Yields:
+        ImageAnnotation: Her etiket dosyası için bir kayıt.
+    """
+    resolve = size_resolver(size_of, size_cache)
+    for path in iter_label_files(labels_dir):
+        stem = os.path.splitext(os.path.basename(path))[0]
+        yield read_yolo_file(path, resolve(stem), classes, image_ext, validation)
+
+def format_yolo_lines(class_ids: Iterable[int], yolo: np.ndarray) -> str:
+    """
+    Sınıf numaralarını ve normalize kutuları YOLO metin satırlarına çevirir.
+
+    Args:
+        class_ids: Her kutunun sınıf numarası.
+        yolo (np.ndarray): (N, 4) YOLO kutuları.
+
+    Returns:
+        str: Satır sonlarıyla birleştirilmiş YOLO satırları.
+    """
+    return ''.join(f"{c} {x:.6f} {y:.6f} {w:.6f} {h:.6f}\n"
+                   for c, (x, y, w, h) in zip(class_ids, yolo.tolist()))
+
+class ClassMap:
+    """
+    Sınıf adlarını YOLO sınıf numaralarına eşler; liste verilmezse adları
+    ilk görüldükleri sırayla numaralandırır.
+
+    Liste verilmediğinde sayısal adlar (sınıf listesi olmadan okunan YOLO
+    etiketleri, örn. '5') kendi numaralarını korur; aradaki numaralar
+    kendi sayısal adlarıyla doldurulur. Böylece YOLO'dan YOLO'ya dönüşüm
+    sınıf numaralarını değiştirmez.
+    """
+    def __init__(self, classes: Optional[List[str]] = None):
+        self.fixed = classes is not None
+        self.names: List[str] = list(classes or [])
+        self.ids: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+
+    def __getitem__(self, name: str) -> int:
+        class_id = self.ids.get(name)
+        if class_id is not None:
+            return class_id
+        if self.fixed:
+            raise ValueError(f"Unknown class: {name}")
+        if not name.isdigit():
+            class_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+            return class_id
+        class_id = int(name)
+        if class_id < len(self.names):
+            raise ValueError(f"Class id {class_id} is already used by {self.names[class_id]!r}; "
+                             "pass an explicit class list.")
+        for i in range(len(self.names), class_id + 1):
+            self.ids[str(i)] = i
+            self.names.append(str(i))
+        return class_id
+
+def write_yolo(records: Iterable[ImageAnnotation], out_dir: str,
+               classes: Optional[List[str]] = None, validation: str = 'strict',
+               write_classes: bool = True) -> Dict[str, int]:
+    """
+    Anotasyonları görüntü başına bir YOLO .txt dosyası olarak yazar.
+
+    Her görüntünün tüm kutuları tek seferde dönüştürülür ve geçici bir
+    dosyaya yazılıp yerine taşınır. Sınıf listesi `classes.txt` olarak kaydedilir.
+
+    Args:
+        records: ImageAnnotation kayıtları.
+        out_dir (str): Çıktı dizini.
+        classes (list, optional): Sınıf adları; verilmezse kayıtlardan türetilir.
+        validation (str): 'strict' (geçersiz kutuda hata), 'clip' veya 'trusted'; son ikisinde
+            geçersiz kutular atılır ve 'invalid' olarak sayılır.
+        write_classes (bool): False ise `classes.txt` yazılmaz; paralel dönüşümde ana süreç yazar.
+
+    Returns:
+        dict: Yazılan görüntü, kutu ve atılan (geçersiz) kutu sayıları.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    class_map = ClassMap(classes)
+    images = boxes = invalid = 0
+    for record in records:
+        stem = os.path.splitext(os.path.basename(record.file_name))[0]
+        yolo, labels, dropped = convert_record_boxes(record, pascal_to_yolo_batch, (record.width, record.height),
+                                                     validation=validation)
+        text = format_yolo_lines((class_map[label] for label in labels), yolo)
+        write_atomic(os.path.join(out_dir, stem + '.txt'), text)
+        images += 1
+        boxes += len(yolo)
+        invalid += dropped
+    if write_classes:
+        write_atomic(os.path.join(out_dir, 'classes.txt'), ''.join(name + '\n' for name in class_map.names))
+    return {'images': images, 'boxes': boxes, 'invalid': invalid}
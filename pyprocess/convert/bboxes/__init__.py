@@ -1,13 +1,39 @@
-# from .convert_bbox import (
-
-from bboxes.convert_bbox import (
+from .convert_bbox import (
     convert_bbox,
     yolo_to_coco,
     yolo_to_pascal,
     coco_to_yolo,
     coco_to_pascal,
     pascal_to_coco,
-    pascal_to_yolo
+    pascal_to_yolo,
+    pascal_to_cxcywh,
+    cxcywh_to_pascal,
+    pascal_to_pascal_norm,
+    pascal_norm_to_pascal,
+    clip_pascal,
+    VALIDATION_MODES
+)
+from .batch import (
+    convert_bbox_batch,
+    yolo_to_coco_batch,
+    yolo_to_pascal_batch,
+    coco_to_yolo_batch,
+    coco_to_pascal_batch,
+    pascal_to_coco_batch,
+    pascal_to_yolo_batch,
+    pascal_to_cxcywh_batch,
+    cxcywh_to_pascal_batch,
+    pascal_to_pascal_norm_batch,
+    pascal_norm_to_pascal_batch,
+    validate_pascal_batch,
+    validate_coco_batch,
+    validate_yolo_batch
+)
+from .plan import (
+    ConversionPlan,
+    available_formats,
+    get_plan,
+    register_format
 )
 
 __all__ = [
@@ -17,5 +43,29 @@ __all__ = [
     'coco_to_yolo',
     'coco_to_pascal',
     'pascal_to_coco',
-    'pascal_to_yolo'
+    'pascal_to_yolo',
+    'pascal_to_cxcywh',
+    'cxcywh_to_pascal',
+    'pascal_to_pascal_norm',
+    'pascal_norm_to_pascal',
+    'clip_pascal',
+    'VALIDATION_MODES',
+    'convert_bbox_batch',
+    'yolo_to_coco_batch',
+    'yolo_to_pascal_batch',
+    'coco_to_yolo_batch',
+    'coco_to_pascal_batch',
+    'pascal_to_coco_batch',
+    'pascal_to_yolo_batch',
+    'pascal_to_cxcywh_batch',
+    'cxcywh_to_pascal_batch',
+    'pascal_to_pascal_norm_batch',
+    'pascal_norm_to_pascal_batch',
+    'validate_pascal_batch',
+    'validate_coco_batch',
+    'validate_yolo_batch',
+    'ConversionPlan',
+    'available_formats',
+    'get_plan',
+    'register_format'
 ]
\ No newline at end of file
@@ -0,0 +1,685 @@
+import numpy as np
+
+from pyprocess.convert.bboxes.convert_bbox import is_clip_mode
+
+def _as_boxes(boxes, out=None):
+    """
+    Girdi kutularını (N, 4) float64 diziye çevirir ve çıktı tamponunu hazırlar.
+
+    Args:
+        boxes (array-like): (N, 4) şeklinde bounding box dizisi.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+
+    Returns:
+        tuple: (boxes, out) float64 girdi dizisi ve çıktı tamponu.
+
+    Raises:
+        TypeError: Eğer kutular sayısal değilse veya şekil (N, 4) değilse.
+        ValueError: Eğer out tamponunun şekli uyuşmuyorsa.
+    """
+    arr = np.asarray(boxes)
+    if arr.ndim != 2 or arr.shape[1] != 4:
+        raise TypeError("Boxes must be an array of shape (N, 4).")
+    if not (np.issubdtype(arr.dtype, np.number) or arr.dtype == np.bool_):
+        raise TypeError("All arguments must be numeric.")
+    arr = arr.astype(np.float64, copy=False)
+    if out is None:
+        out = np.empty(arr.shape, dtype=np.float64)
+    elif not isinstance(out, np.ndarray) or out.shape != arr.shape:
+        raise ValueError(f"out must be an ndarray of shape {arr.shape}.")
+    return arr, out
+
+def _as_size(size, n):
+    """
+    Ortak (w, h) veya kutu başına (N, 2) görüntü boyutlarını ayrıştırır.
+
+    Args:
+        size (array-like): (width, height) veya (N, 2) boyut dizisi.
+        n (int): Kutu sayısı.
+
+    Returns:
+        tuple: Yayınlanabilir (broadcastable) genişlik ve yükseklik dizileri.
+
+    Raises:
+        TypeError: Eğer size (2,) veya (N, 2) şeklinde değilse.
+        ValueError: Eğer boyutlar pozitif sayılar değilse.
+    """
+    if size is None:
+        raise TypeError("Size must be a list or tuple of length 2.")
+    arr = np.asarray(size)
+    if arr.shape != (2,) and arr.shape != (n, 2):
+        raise TypeError("Size must be of shape (2,) or (N, 2).")
+    if not np.issubdtype(arr.dtype, np.number):
+        raise TypeError("Size must be of shape (2,) or (N, 2).")
+    arr = arr.astype(np.float64, copy=False)
+    if not np.all(arr > 0):
+        raise ValueError("Image dimensions must be positive numbers.")
+    return arr[..., 0], arr[..., 1]
+
+def _negative(*cols):
+    mask = cols[0] < 0
+    for col in cols[1:]:
+        mask |= col < 0
+    return mask
+
+def _pascal_checks(x_min, y_min, x_max, y_max):
+    return [
+        (_negative(x_min, y_min, x_max, y_max), "All arguments must be non-negative."),
+        ((x_max <= x_min) | (y_max <= y_min), "Invalid Pascal bounding box coordinates."),
+    ]
+
+def _coco_checks(x_min, y_min, width, height):
+    return [
+        (_negative(x_min, y_min, width, height), "All arguments must be non-negative."),
+        ((width <= 0) | (height <= 0), "Invalid COCO bounding box parameters."),
+    ]
+
+def _yolo_checks(x_center, y_center, r_width, r_height):
+    return [
+        (~((0 <= x_center) & (x_center <= 1) & (0 <= y_center) & (y_center <= 1)),
+         "Center coordinates must be between 0 and 1."),
+        (~((0 < r_width) & (r_width <= 1) & (0 < r_height) & (r_height <= 1)),
+         "Invalid YOLO bounding box dimensions."),
+    ]
+
+def _clip_corners(x_min, y_min, x_max, y_max, max_width=None, max_height=None):
+    return (np.clip(x_min, 0, max_width), np.clip(y_min, 0, max_height),
+            np.clip(x_max, 0, max_width), np.clip(y_max, 0, max_height))
+
+def _clip_extent(x_min, y_min, width, height, max_width=None, max_height=None):
+    x_max = x_min + width
+    y_max = y_min + height
+    changed = (x_min < 0) | (y_min < 0)
+    if max_width is not None:
+        changed |= (x_max > max_width) | (y_max > max_height)
+    c_x_min, c_y_min, c_x_max, c_y_max = _clip_corners(x_min, y_min, x_max, y_max, max_width, max_height)
+    return (np.where(changed, c_x_min, x_min), np.where(changed, c_y_min, y_min),
+            np.where(changed, c_x_max - c_x_min, width), np.where(changed, c_y_max - c_y_min, height))
+
+def _clip_center(x_center, y_center, width, height, upper=None):
+    x_min, x_max = x_center - (width / 2), x_center + (width / 2)
+    y_min, y_max = y_center - (height / 2), y_center + (height / 2)
+    changed = (x_min < 0) | (y_min < 0)
+    if upper is not None:
+        changed |= (x_max > upper) | (y_max > upper)
+    x_min, y_min, x_max, y_max = _clip_corners(x_min, y_min, x_max, y_max, upper, upper)
+    return (np.where(changed, (x_min + x_max) / 2, x_center), np.where(changed, (y_min + y_max) / 2, y_center),
+            np.where(changed, x_max - x_min, width), np.where(changed, y_max - y_min, height))
+
+def _raise_invalid(checks):
+    """
+    Maske listesinde geçersiz satır varsa ilk hatayı fırlatır.
+
+    Args:
+        checks (list): (mask, message) çiftleri; kontroller skaler fonksiyonlardaki sırayla verilir.
+
+    Raises:
+        ValueError: Herhangi bir maskede True satır varsa.
+    """
+    for mask, message in checks:
+        if mask.any():
+            row = int(np.flatnonzero(mask)[0])
+            raise ValueError(f"{message} (row {row})")
+
+def _collect_invalid(checks, n, return_mask):
+    """
+    Kontrolleri doğrulama moduna göre uygular.
+
+    Args:
+        checks (list or None): (mask, message) çiftleri; 'trusted' modda None.
+        n (int): Kutu sayısı.
+        return_mask (bool): True ise hata fırlatmak yerine birleşik maske döndürülür.
+
+    Returns:
+        np.ndarray or None: return_mask True ise (N,) bool geçersiz satır maskesi.
+
+    Raises:
+        ValueError: return_mask False iken geçersiz satır varsa.
+    """
+    if not return_mask:
+        if checks is not None:
+            _raise_invalid(checks)
+        return None
+    invalid = np.zeros(n, dtype=bool)
+    for mask, _ in checks or ():
+        invalid |= mask
+    return invalid
+
+def _finish(out, invalid):
+    if invalid is None:
+        return out
+    out[invalid] = np.nan
+    return out, invalid
+
+def pascal_to_coco_batch(boxes, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) Pascal VOC kutularını COCO formatına dönüştürür.
+
+    Args:
+        boxes (array-like): [x_min, y_min, x_max, y_max] satırlarından oluşan (N, 4) dizi.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: [x, y, width, height] satırlarından oluşan (N, 4) dizi.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer herhangi bir satırın koordinatları geçersizse.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_min, y_min, x_max, y_max = boxes.T
+    if clip:
+        x_min, y_min, x_max, y_max = _clip_corners(x_min, y_min, x_max, y_max)
+    checks = None if trusted else _pascal_checks(x_min, y_min, x_max, y_max)
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    width = x_max - x_min
+    height = y_max - y_min
+    out[:, 0] = x_min
+    out[:, 1] = y_min
+    out[:, 2] = width
+    out[:, 3] = height
+    return _finish(out, invalid)
+
+def pascal_to_yolo_batch(boxes, size, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) Pascal VOC kutularını YOLO formatına dönüştürür.
+
+    Args:
+        boxes (array-like): [x_min, y_min, x_max, y_max] satırlarından oluşan (N, 4) dizi.
+        size (array-like): Ortak (width, height) veya kutu başına (N, 2) görüntü boyutu.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: Normalize edilmiş [x_center, y_center, width, height] satırları.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer koordinatlar geçersizse veya görüntü boyutları dışındaysa.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    max_width, max_height = _as_size(size, len(boxes))
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_min, y_min, x_max, y_max = boxes.T
+    if clip:
+        x_min, y_min, x_max, y_max = _clip_corners(x_min, y_min, x_max, y_max, max_width, max_height)
+    checks = None
+    if not trusted:
+        checks = _pascal_checks(x_min, y_min, x_max, y_max)
+        checks.append(((x_max > max_width) | (y_max > max_height),
+                       "Bounding box coordinates are outside image dimensions."))
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    x_center = ((x_min + x_max) / 2) / max_width
+    y_center = ((y_min + y_max) / 2) / max_height
+    r_width = (x_max - x_min) / max_width
+    r_height = (y_max - y_min) / max_height
+    out[:, 0] = x_center
+    out[:, 1] = y_center
+    out[:, 2] = r_width
+    out[:, 3] = r_height
+    return _finish(out, invalid)
+
+def coco_to_pascal_batch(boxes, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) COCO kutularını Pascal VOC formatına dönüştürür.
+
+    Args:
+        boxes (array-like): [x_min, y_min, width, height] satırlarından oluşan (N, 4) dizi.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: [x_min, y_min, x_max, y_max] satırlarından oluşan (N, 4) dizi.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer koordinatlar veya boyutlar geçersizse.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_min, y_min, width, height = boxes.T
+    if clip:
+        x_min, y_min, width, height = _clip_extent(x_min, y_min, width, height)
+    checks = None if trusted else _coco_checks(x_min, y_min, width, height)
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    x_max = x_min + width
+    y_max = y_min + height
+    out[:, 0] = x_min
+    out[:, 1] = y_min
+    out[:, 2] = x_max
+    out[:, 3] = y_max
+    return _finish(out, invalid)
+
+def coco_to_yolo_batch(boxes, size, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) COCO kutularını YOLO formatına dönüştürür.
+
+    Args:
+        boxes (array-like): [x_min, y_min, width, height] satırlarından oluşan (N, 4) dizi.
+        size (array-like): Ortak (width, height) veya kutu başına (N, 2) görüntü boyutu.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: Normalize edilmiş [x_center, y_center, width, height] satırları.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer koordinatlar veya boyutlar geçersizse veya görüntü boyutları dışındaysa.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    max_width, max_height = _as_size(size, len(boxes))
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_min, y_min, width, height = boxes.T
+    if clip:
+        x_min, y_min, width, height = _clip_extent(x_min, y_min, width, height, max_width, max_height)
+    checks = None
+    if not trusted:
+        checks = _coco_checks(x_min, y_min, width, height)
+        checks.append(((x_min + width > max_width) | (y_min + height > max_height),
+                       "Bounding box extends beyond image dimensions."))
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    x_center = (x_min + (width / 2)) / max_width
+    y_center = (y_min + (height / 2)) / max_height
+    r_width = width / max_width
+    r_height = height / max_height
+    out[:, 0] = x_center
+    out[:, 1] = y_center
+    out[:, 2] = r_width
+    out[:, 3] = r_height
+    return _finish(out, invalid)
+
+def yolo_to_coco_batch(boxes, size, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) YOLO kutularını COCO formatına dönüştürür.
+
+    Args:
+        boxes (array-like): Normalize edilmiş [x_center, y_center, width, height] satırları.
+        size (array-like): Ortak (width, height) veya kutu başına (N, 2) görüntü boyutu.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: [x_min, y_min, width, height] satırlarından oluşan (N, 4) dizi.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer normalize edilmiş koordinatlar veya boyutlar geçersizse.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    max_width, max_height = _as_size(size, len(boxes))
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_center, y_center, r_width, r_height = boxes.T
+    if clip:
+        x_center, y_center, r_width, r_height = _clip_center(x_center, y_center, r_width, r_height, 1)
+    checks = None if trusted else _yolo_checks(x_center, y_center, r_width, r_height)
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    width = r_width * max_width
+    height = r_height * max_height
+    x_min = (x_center * max_width) - (width / 2)
+    y_min = (y_center * max_height) - (height / 2)
+    out[:, 0] = x_min
+    out[:, 1] = y_min
+    out[:, 2] = width
+    out[:, 3] = height
+    return _finish(out, invalid)
+
+def yolo_to_pascal_batch(boxes, size, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) YOLO kutularını Pascal VOC formatına dönüştürür.
+
+    Args:
+        boxes (array-like): Normalize edilmiş [x_center, y_center, width, height] satırları.
+        size (array-like): Ortak (width, height) veya kutu başına (N, 2) görüntü boyutu.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: [x_min, y_min, x_max, y_max] satırlarından oluşan (N, 4) dizi.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer normalize edilmiş koordinatlar veya boyutlar geçersizse.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    max_width, max_height = _as_size(size, len(boxes))
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_center, y_center, r_width, r_height = boxes.T
+    if clip:
+        x_center, y_center, r_width, r_height = _clip_center(x_center, y_center, r_width, r_height, 1)
+    checks = None if trusted else _yolo_checks(x_center, y_center, r_width, r_height)
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    width = r_width * max_width
+    height = r_height * max_height
+    x_min = (x_center * max_width) - (width / 2)
+    y_min = (y_center * max_height) - (height / 2)
+    x_max = x_min + width
+    y_max = y_min + height
+    out[:, 0] = x_min
+    out[:, 1] = y_min
+    out[:, 2] = x_max
+    out[:, 3] = y_max
+    return _finish(out, invalid)
+
+def pascal_to_cxcywh_batch(boxes, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) Pascal VOC kutularını merkez-genişlik-yükseklik (cxcywh) formatına dönüştürür.
+
+    Args:
+        boxes (array-like): [x_min, y_min, x_max, y_max] satırlarından oluşan (N, 4) dizi.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: [x_center, y_center, width, height] satırlarından oluşan (N, 4) dizi.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer herhangi bir satırın koordinatları geçersizse.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_min, y_min, x_max, y_max = boxes.T
+    if clip:
+        x_min, y_min, x_max, y_max = _clip_corners(x_min, y_min, x_max, y_max)
+    checks = None if trusted else _pascal_checks(x_min, y_min, x_max, y_max)
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    x_center = (x_min + x_max) / 2
+    y_center = (y_min + y_max) / 2
+    width = x_max - x_min
+    height = y_max - y_min
+    out[:, 0] = x_center
+    out[:, 1] = y_center
+    out[:, 2] = width
+    out[:, 3] = height
+    return _finish(out, invalid)
+
+def cxcywh_to_pascal_batch(boxes, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) merkez-genişlik-yükseklik (cxcywh) kutularını Pascal VOC formatına dönüştürür.
+
+    Args:
+        boxes (array-like): [x_center, y_center, width, height] satırlarından oluşan (N, 4) dizi.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: [x_min, y_min, x_max, y_max] satırlarından oluşan (N, 4) dizi.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer boyutlar geçersizse.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_center, y_center, width, height = boxes.T
+    if clip:
+        x_center, y_center, width, height = _clip_center(x_center, y_center, width, height)
+    checks = None if trusted else [((width <= 0) | (height <= 0), "Invalid center bounding box dimensions.")]
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    x_min = x_center - (width / 2)
+    y_min = y_center - (height / 2)
+    x_max = x_min + width
+    y_max = y_min + height
+    out[:, 0] = x_min
+    out[:, 1] = y_min
+    out[:, 2] = x_max
+    out[:, 3] = y_max
+    return _finish(out, invalid)
+
+def pascal_to_pascal_norm_batch(boxes, size, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) Pascal VOC kutularını normalize edilmiş Pascal (albumentations) formatına dönüştürür.
+
+    Args:
+        boxes (array-like): [x_min, y_min, x_max, y_max] satırlarından oluşan (N, 4) dizi.
+        size (array-like): Ortak (width, height) veya kutu başına (N, 2) görüntü boyutu.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: 0-1 aralığına normalize edilmiş [x_min, y_min, x_max, y_max] satırları.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer koordinatlar geçersizse veya görüntü boyutları dışındaysa.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    max_width, max_height = _as_size(size, len(boxes))
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_min, y_min, x_max, y_max = boxes.T
+    if clip:
+        x_min, y_min, x_max, y_max = _clip_corners(x_min, y_min, x_max, y_max, max_width, max_height)
+    checks = None
+    if not trusted:
+        checks = _pascal_checks(x_min, y_min, x_max, y_max)
+        checks.append(((x_max > max_width) | (y_max > max_height),
+                       "Bounding box coordinates are outside image dimensions."))
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    n_x_min = x_min / max_width
+    n_y_min = y_min / max_height
+    n_x_max = x_max / max_width
+    n_y_max = y_max / max_height
+    out[:, 0] = n_x_min
+    out[:, 1] = n_y_min
+    out[:, 2] = n_x_max
+    out[:, 3] = n_y_max
+    return _finish(out, invalid)
+
+def pascal_norm_to_pascal_batch(boxes, size, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) normalize edilmiş Pascal (albumentations) kutularını Pascal VOC formatına dönüştürür.
+
+    Args:
+        boxes (array-like): 0-1 aralığında [x_min, y_min, x_max, y_max] satırları.
+        size (array-like): Ortak (width, height) veya kutu başına (N, 2) görüntü boyutu.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: Piksel cinsinden [x_min, y_min, x_max, y_max] satırları.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer normalize edilmiş koordinatlar geçersizse.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    max_width, max_height = _as_size(size, len(boxes))
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_min, y_min, x_max, y_max = boxes.T
+    if clip:
+        x_min, y_min, x_max, y_max = _clip_corners(x_min, y_min, x_max, y_max, 1, 1)
+    checks = None
+    if not trusted:
+        in_range = (x_min >= 0) & (x_min <= 1) & (y_min >= 0) & (y_min <= 1)
+        in_range &= (x_max >= 0) & (x_max <= 1) & (y_max >= 0) & (y_max <= 1)
+        checks = [
+            (~in_range, "Normalized coordinates must be between 0 and 1."),
+            ((x_max <= x_min) | (y_max <= y_min), "Invalid Pascal bounding box coordinates."),
+        ]
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    p_x_min = x_min * max_width
+    p_y_min = y_min * max_height
+    p_x_max = x_max * max_width
+    p_y_max = y_max * max_height
+    out[:, 0] = p_x_min
+    out[:, 1] = p_y_min
+    out[:, 2] = p_x_max
+    out[:, 3] = p_y_max
+    return _finish(out, invalid)
+
+def validate_pascal_batch(boxes, size=None, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) Pascal VOC kutularını formatı değiştirmeden doğrular.
+
+    'clip' modunda kutular görüntü sınırlarına kırpılır; dönüşüm gerektirmeyen
+    yollarda (örn. VOC'tan VOC'a) aynı doğrulama kurallarını uygulamak için kullanılır.
+
+    Args:
+        boxes (array-like): [x_min, y_min, x_max, y_max] satırlarından oluşan (N, 4) dizi.
+        size (array-like, optional): Ortak (width, height) veya kutu başına (N, 2) görüntü boyutu;
+            verilmezse görüntü sınırları kontrol edilmez.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: Doğrulanmış (N, 4) Pascal VOC dizisi.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer koordinatlar geçersizse veya görüntü boyutları dışındaysa.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    max_width, max_height = (None, None) if size is None else _as_size(size, len(boxes))
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_min, y_min, x_max, y_max = boxes.T
+    if clip:
+        x_min, y_min, x_max, y_max = _clip_corners(x_min, y_min, x_max, y_max, max_width, max_height)
+    checks = None
+    if not trusted:
+        checks = _pascal_checks(x_min, y_min, x_max, y_max)
+        if size is not None:
+            checks.append(((x_max > max_width) | (y_max > max_height),
+                           "Bounding box coordinates are outside image dimensions."))
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    if clip:
+        out[:, 0] = x_min
+        out[:, 1] = y_min
+        out[:, 2] = x_max
+        out[:, 3] = y_max
+    elif out is not boxes:
+        out[...] = boxes
+    return _finish(out, invalid)
+
+def validate_coco_batch(boxes, size=None, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) COCO kutularını formatı değiştirmeden doğrular.
+
+    'clip' modunda kutular görüntü sınırlarına kırpılır; COCO'dan COCO'ya
+    dönüşümlerde kullanılır.
+
+    Args:
+        boxes (array-like): [x_min, y_min, width, height] satırlarından oluşan (N, 4) dizi.
+        size (array-like, optional): Ortak (width, height) veya kutu başına (N, 2) görüntü boyutu;
+            verilmezse görüntü sınırları kontrol edilmez.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: Doğrulanmış (N, 4) COCO dizisi.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer koordinatlar veya boyutlar geçersizse veya görüntü boyutları dışındaysa.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    max_width, max_height = (None, None) if size is None else _as_size(size, len(boxes))
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_min, y_min, width, height = boxes.T
+    if clip:
+        x_min, y_min, width, height = _clip_extent(x_min, y_min, width, height, max_width, max_height)
+    checks = None
+    if not trusted:
+        checks = _coco_checks(x_min, y_min, width, height)
+        if size is not None:
+            checks.append(((x_min + width > max_width) | (y_min + height > max_height),
+                           "Bounding box extends beyond image dimensions."))
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    if clip:
+        out[:, 0] = x_min
+        out[:, 1] = y_min
+        out[:, 2] = width
+        out[:, 3] = height
+    elif out is not boxes:
+        out[...] = boxes
+    return _finish(out, invalid)
+
+def validate_yolo_batch(boxes, out=None, validation='strict', return_mask=False):
+    """
+    (N, 4) YOLO kutularını formatı değiştirmeden doğrular.
+
+    'clip' modunda kutular 0-1 aralığına kırpılır; YOLO'dan YOLO'ya
+    dönüşümlerde kullanılır. Koordinatlar normalize olduğu için görüntü
+    boyutu gerekmez.
+
+    Args:
+        boxes (array-like): Normalize edilmiş [x_center, y_center, width, height] satırları.
+        out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+        validation (str): 'strict', 'clip' veya 'trusted'.
+        return_mask (bool): True ise hata fırlatılmaz; geçersiz satırlar NaN yapılır ve maske de döndürülür.
+
+    Returns:
+        np.ndarray: Doğrulanmış (N, 4) YOLO dizisi.
+        tuple: return_mask True ise (out, invalid_mask).
+
+    Raises:
+        ValueError: Eğer normalize edilmiş koordinatlar veya boyutlar geçersizse.
+    """
+    boxes, out = _as_boxes(boxes, out)
+    trusted = validation == 'trusted'
+    clip = not trusted and is_clip_mode(validation)
+    x_center, y_center, r_width, r_height = boxes.T
+    if clip:
+        x_center, y_center, r_width, r_height = _clip_center(x_center, y_center, r_width, r_height, 1)
+    checks = None if trusted else _yolo_checks(x_center, y_center, r_width, r_height)
+    invalid = _collect_invalid(checks, len(boxes), return_mask)
+    if clip:
+        out[:, 0] = x_center
+        out[:, 1] = y_center
+        out[:, 2] = r_width
+        out[:, 3] = r_height
+    elif out is not boxes:
+        out[...] = boxes
+    return _finish(out, invalid)
+
+def convert_bbox_batch(from_format, to_format, boxes, validation='strict', **kwargs):
+    """
+    (N, 4) bounding box dizilerini formatlar arasında toplu olarak dönüştürür.
+
+    Sonuçlar, skaler `convert_bbox` fonksiyonunun her satır için döndürdüğü
+    değerlerle birebir aynıdır. Dönüşüm yolu `get_plan` ile önbelleğe alınır.
+
+    Args:
+        from_format (str): Kaynak format ('pascal', 'coco', 'yolo', 'cxcywh', 'pascal_norm' veya kayıtlı bir format).
+        to_format (str): Hedef format.
+        boxes (array-like): (N, 4) bounding box dizisi.
+        validation (str): 'strict' (ilk geçersiz satırda hata), 'clip' (görüntüye kırpar) veya 'trusted' (kontrol yok).
+        **kwargs: Ek parametreler (örn. 'size', 'out', 'return_mask').
+
+    Returns:
+        np.ndarray: Dönüştürülmüş (N, 4) bounding box dizisi.
+        tuple: return_mask True ise (out, invalid_mask); geçersiz satırlar NaN olur.
+
+    Raises:
+        ValueError: Desteklenmeyen bir dönüşüm istendiğinde.
+    """
+    return _plan._cached_plan(from_format, to_format, None, validation).batch(boxes, **kwargs)
+
+# plan modülü bu modülü içe aktarır; döngüsel içe aktarmayı kırmak için en sonda yüklenir.
+from pyprocess.convert.bboxes import plan as _plan  # noqa: E402
@@ -41,7 +41,64 @@ def validate_non_negative(*args):
     if any(arg < 0 for arg in args):
         raise ValueError("All arguments must be non-negative.")
 
-def pascal_to_coco(x_min, y_min, x_max, y_max):
+VALIDATION_MODES = ('strict', 'clip', 'trusted')
+
+def is_clip_mode(validation):
+    """
+    Doğrulama modunun kırpma (clip) olup olmadığını döndürür.
+
+    Args:
+        validation (str): 'strict' veya 'clip' ('trusted' çağıran tarafta ele alınır).
+
+    Returns:
+        bool: Mod 'clip' ise True.
+
+    Raises:
+        ValueError: Eğer mod bilinmiyorsa.
+    """
+    if validation == 'strict':
+        return False
+    if validation == 'clip':
+        return True
+    raise ValueError(f"Unknown validation mode: {validation}. Expected one of {VALIDATION_MODES}.")
+
+def _clip(value, upper=None):
+    value = max(value, 0)
+    return value if upper is None else min(value, upper)
+
+def clip_pascal(x_min, y_min, x_max, y_max, size=None):
+    """
+    Pascal VOC koordinatlarını görüntü sınırlarına kırpar.
+
+    Args:
+        x_min (float): Sol üst köşenin x koordinatı.
+        y_min (float): Sol üst köşenin y koordinatı.
+        x_max (float): Sağ alt köşenin x koordinatı.
+        y_max (float): Sağ alt köşenin y koordinatı.
+        size (tuple, optional): Görüntü boyutu (width, height); verilmezse yalnızca negatif değerler kırpılır.
+
+    Returns:
+        list: Kırpılmış [x_min, y_min, x_max, y_max].
+    """
+    max_width, max_height = size if size is not None else (None, None)
+    return [_clip(x_min, max_width), _clip(y_min, max_height), _clip(x_max, max_width), _clip(y_max, max_height)]
+
+def _clip_coco(x_min, y_min, width, height, size=None):
+    x_max, y_max = x_min + width, y_min + height
+    if x_min >= 0 and y_min >= 0 and (size is None or (x_max <= size[0] and y_max <= size[1])):
+        return [x_min, y_min, width, height]
+    x_min, y_min, x_max, y_max = clip_pascal(x_min, y_min, x_max, y_max, size)
+    return [x_min, y_min, x_max - x_min, y_max - y_min]
+
+def _clip_center(x_center, y_center, width, height, upper=None):
+    x_min, x_max = x_center - (width / 2), x_center + (width / 2)
+    y_min, y_max = y_center - (height / 2), y_center + (height / 2)
+    if x_min >= 0 and y_min >= 0 and (upper is None or (x_max <= upper and y_max <= upper)):
+        return [x_center, y_center, width, height]
+    x_min, y_min, x_max, y_max = clip_pascal(x_min, y_min, x_max, y_max, None if upper is None else (upper, upper))
+    return [(x_min + x_max) / 2, (y_min + y_max) / 2, x_max - x_min, y_max - y_min]
+
+def pascal_to_coco(x_min, y_min, x_max, y_max, validation='strict'):
     """
     Pascal VOC formatından COCO formatına dönüşüm yapar.
 
@@ -50,6 +107,7 @@ def pascal_to_coco(x_min, y_min, x_max, y_max):
         y_min (float): Sol üst köşenin y koordinatı.
         x_max (float): Sağ alt köşenin x koordinatı.
         y_max (float): Sağ alt köşenin y koordinatı.
+        validation (str): 'strict' (hata fırlatır), 'clip' (negatif değerleri kırpar) veya 'trusted' (kontrol yok).
 
     Returns:
         list: [x, y, width, height] formatında COCO bounding box.
@@ -57,13 +115,16 @@ def pascal_to_coco(x_min, y_min, x_max, y_max):
     Raises:
         ValueError: Eğer koordinatlar geçersizse.
     """
-    validate_numeric(x_min, y_min, x_max, y_max)
-    validate_non_negative(x_min, y_min, x_max, y_max)
-    if x_max <= x_min or y_max <= y_min:
-        raise ValueError("Invalid Pascal bounding box coordinates.")
+    if validation != 'trusted':
+        validate_numeric(x_min, y_min, x_max, y_max)
+        if is_clip_mode(validation):
+            x_min, y_min, x_max, y_max = clip_pascal(x_min, y_min, x_max, y_max)
+        validate_non_negative(x_min, y_min, x_max, y_max)
+        if x_max <= x_min or y_max <= y_min:
+            raise ValueError("Invalid Pascal bounding box coordinates.")
     return [x_min, y_min, x_max - x_min, y_max - y_min]
 
-def pascal_to_yolo(x_min, y_min, x_max, y_max, size):
+def pascal_to_yolo(x_min, y_min, x_max, y_max, size, validation='strict'):
     """
     Pascal VOC formatından YOLO formatına dönüşüm yapar.
 
@@ -73,6 +134,7 @@ def pascal_to_yolo(x_min, y_min, x_max, y_max, size):
         x_max (float): Sağ alt köşenin x koordinatı.
         y_max (float): Sağ alt köşenin y koordinatı.
         size (tuple): Görüntü boyutu (width, height).
+        validation (str): 'strict' (hata fırlatır), 'clip' (görüntüye kırpar) veya 'trusted' (kontrol yok).
 
     Returns:
         list: [x_center, y_center, width, height] formatında normalize edilmiş YOLO bounding box.
@@ -80,22 +142,25 @@ def pascal_to_yolo(x_min, y_min, x_max, y_max, size):
     Raises:
         ValueError: Eğer koordinatlar geçersizse veya görüntü boyutları dışındaysa.
     """
-
-    validate_numeric(x_min, y_min, x_max, y_max)
-    validate_size(size)
-    validate_non_negative(x_min, y_min, x_max, y_max)
+    if validation != 'trusted':
+        validate_numeric(x_min, y_min, x_max, y_max)
+        validate_size(size)
+        if is_clip_mode(validation):
+            x_min, y_min, x_max, y_max = clip_pascal(x_min, y_min, x_max, y_max, size)
+        validate_non_negative(x_min, y_min, x_max, y_max)
     max_width, max_height = size
-    if x_max <= x_min or y_max <= y_min:
-        raise ValueError("Invalid Pascal bounding box coordinates.")
-    if x_min < 0 or y_min < 0 or x_max > max_width or y_max > max_height:
-        raise ValueError("Bounding box coordinates are outside image dimensions.")
+    if validation != 'trusted':
+        if x_max <= x_min or y_max <= y_min:
+            raise ValueError("Invalid Pascal bounding box coordinates.")
+        if x_min < 0 or y_min < 0 or x_max > max_width or y_max > max_height:
+            raise ValueError("Bounding box coordinates are outside image dimensions.")
     x_center = ((x_min + x_max) / 2) / max_width
     y_center = ((y_min + y_max) / 2) / max_height
     r_width = (x_max - x_min) / max_width
     r_height = (y_max - y_min) / max_height
     return [x_center, y_center, r_width, r_height]
 
-def coco_to_pascal(x_min, y_min, width, height):
+def coco_to_pascal(x_min, y_min, width, height, validation='strict'):
     """
     COCO formatından Pascal VOC formatına dönüşüm yapar.
 
@@ -104,6 +169,7 @@ def coco_to_pascal(x_min, y_min, width, height):
         y_min (float): Sol üst köşenin y koordinatı.
         width (float): Bounding box'ın genişliği.
         height (float): Bounding box'ın yüksekliği.
+        validation (str): 'strict' (hata fırlatır), 'clip' (negatif değerleri kırpar) veya 'trusted' (kontrol yok).
 
     Returns:
         list: [x_min, y_min, x_max, y_max] formatında Pascal VOC bounding box.
@@ -111,14 +177,16 @@ def coco_to_pascal(x_min, y_min, width, height):
     Raises:
         ValueError: Eğer koordinatlar veya boyutlar geçersizse.
     """
-
-    validate_numeric(x_min, y_min, width, height)
-    validate_non_negative(x_min, y_min, width, height)
-    if x_min < 0 or y_min < 0 or width <= 0 or height <= 0:
-        raise ValueError("Invalid COCO bounding box parameters.")
+    if validation != 'trusted':
+        validate_numeric(x_min, y_min, width, height)
+        if is_clip_mode(validation):
+            x_min, y_min, width, height = _clip_coco(x_min, y_min, width, height)
+        validate_non_negative(x_min, y_min, width, height)
+        if x_min < 0 or y_min < 0 or width <= 0 or height <= 0:
+            raise ValueError("Invalid COCO bounding box parameters.")
     return [x_min, y_min, x_min + width, y_min + height]
 
-def coco_to_yolo(x_min, y_min, width, height, size):
+def coco_to_yolo(x_min, y_min, width, height, size, validation='strict'):
     """
     COCO formatından YOLO formatına dönüşüm yapar.
 
@@ -128,6 +196,7 @@ def coco_to_yolo(x_min, y_min, width, height, size):
         width (float): Bounding box'ın genişliği.
         height (float): Bounding box'ın yüksekliği.
         size (tuple): Görüntü boyutu (width, height).
+        validation (str): 'strict' (hata fırlatır), 'clip' (görüntüye kırpar) veya 'trusted' (kontrol yok).
 
     Returns:
         list: [x_center, y_center, width, height] formatında normalize edilmiş YOLO bounding box.
@@ -135,22 +204,125 @@ def coco_to_yolo(x_min, y_min, width, height, size):
     Raises:
         ValueError: Eğer koordinatlar veya boyutlar geçersizse veya görüntü boyutları dışındaysa.
     """
-
-    validate_numeric(x_min, y_min, width, height)
-    validate_size(size)
-    validate_non_negative(x_min, y_min, width, height)
+    if validation != 'trusted':
+        validate_numeric(x_min, y_min, width, height)
+        validate_size(size)
+        if is_clip_mode(validation):
+            x_min, y_min, width, height = _clip_coco(x_min, y_min, width, height, size)
+        validate_non_negative(x_min, y_min, width, height)
     max_width, max_height = size
-    if x_min < 0 or y_min < 0 or width <= 0 or height <= 0:
-        raise ValueError("Invalid COCO bounding box parameters.")
-    if x_min + width > max_width or y_min + height > max_height:
-        raise ValueError("Bounding box extends beyond image dimensions.")
+    if validation != 'trusted':
+        if x_min < 0 or y_min < 0 or width <= 0 or height <= 0:
+            raise ValueError("Invalid COCO bounding box parameters.")
+        if x_min + width > max_width or y_min + height > max_height:
+            raise ValueError("Bounding box extends beyond image dimensions.")
     x_center = (x_min + (width / 2)) / max_width
     y_center = (y_min + (height / 2)) / max_height
     r_width = width / max_width
     r_height = height / max_height
     return [x_center, y_center, r_width, r_height]
 
-def yolo_to_coco(x_center, y_center, r_width, r_height, size):
+def _validate_yolo(x_center, y_center, r_width, r_height, size, validation):
+    validate_numeric(x_center, y_center, r_width, r_height)
+    validate_size(size)
+    if is_clip_mode(validation):
+        x_center, y_center, r_width, r_height = _clip_center(x_center, y_center, r_width, r_height, 1)
+    if not (0 <= x_center <= 1 and 0 <= y_center <= 1):
+        raise ValueError("Center coordinates must be between 0 and 1.")
+    if not (0 < r_width <= 1 and 0 < r_height <= 1):
+        raise ValueError("Invalid YOLO bounding box dimensions.")
+    return x_center, y_center, r_width, r_height
+
+def validate_pascal(x_min, y_min, x_max, y_max, size=None, validation='strict'):
+    """
+    Pascal VOC kutusunu formatı değiştirmeden doğrular (Pascal VOC'tan Pascal VOC'a dönüşüm).
+
+    Args:
+        x_min (float): Sol üst köşenin x koordinatı.
+        y_min (float): Sol üst köşenin y koordinatı.
+        x_max (float): Sağ alt köşenin x koordinatı.
+        y_max (float): Sağ alt köşenin y koordinatı.
+        size (tuple, optional): Görüntü boyutu (width, height); verilmezse görüntü sınırları kontrol edilmez.
+        validation (str): 'strict' (hata fırlatır), 'clip' (görüntüye kırpar) veya 'trusted' (kontrol yok).
+
+    Returns:
+        list: [x_min, y_min, x_max, y_max].
+
+    Raises:
+        ValueError: Eğer koordinatlar geçersizse veya görüntü boyutları dışındaysa.
+    """
+    if validation != 'trusted':
+        validate_numeric(x_min, y_min, x_max, y_max)
+        if size is not None:
+            validate_size(size)
+        if is_clip_mode(validation):
+            x_min, y_min, x_max, y_max = clip_pascal(x_min, y_min, x_max, y_max, size)
+        validate_non_negative(x_min, y_min, x_max, y_max)
+        if x_max <= x_min or y_max <= y_min:
+            raise ValueError("Invalid Pascal bounding box coordinates.")
+        if size is not None and (x_max > size[0] or y_max > size[1]):
+            raise ValueError("Bounding box coordinates are outside image dimensions.")
+    return [x_min, y_min, x_max, y_max]
+
+def validate_coco(x_min, y_min, width, height, size=None, validation='strict'):
+    """
+    COCO kutusunu formatı değiştirmeden doğrular (COCO'dan COCO'ya dönüşüm).
+
+    Args:
+        x_min (float): Sol üst köşenin x koordinatı.
+        y_min (float): Sol üst köşenin y koordinatı.
+        width (float): Bounding box'ın genişliği.
+        height (float): Bounding box'ın yüksekliği.
+        size (tuple, optional): Görüntü boyutu (width, height); verilmezse görüntü sınırları kontrol edilmez.
+        validation (str): 'strict' (hata fırlatır), 'clip' (görüntüye kırpar) veya 'trusted' (kontrol yok).
+
+    Returns:
+        list: [x_min, y_min, width, height].
+
+    Raises:
+        ValueError: Eğer koordinatlar veya boyutlar geçersizse veya görüntü boyutları dışındaysa.
+    """
+    if validation != 'trusted':
+        validate_numeric(x_min, y_min, width, height)
+        if size is not None:
+            validate_size(size)
+        if is_clip_mode(validation):
+            x_min, y_min, width, height = _clip_coco(x_min, y_min, width, height, size)
+        validate_non_negative(x_min, y_min, width, height)
+        if width <= 0 or height <= 0:
+            raise ValueError("Invalid COCO bounding box parameters.")
+        if size is not None and (x_min + width > size[0] or y_min + height > size[1]):
+            raise ValueError("Bounding box extends beyond image dimensions.")
+    return [x_min, y_min, width, height]
+
+def validate_yolo(x_center, y_center, r_width, r_height, validation='strict'):
+    """
+    YOLO kutusunu formatı değiştirmeden doğrular (YOLO'dan YOLO'ya dönüşüm).
+
+    Args:
+        x_center (float): Normalize edilmiş merkez x koordinatı.
+        y_center (float): Normalize edilmiş merkez y koordinatı.
+        r_width (float): Normalize edilmiş genişlik.
+        r_height (float): Normalize edilmiş yükseklik.
+        validation (str): 'strict' (hata fırlatır), 'clip' (0-1 aralığına kırpar) veya 'trusted' (kontrol yok).
+
+    Returns:
+        list: [x_center, y_center, width, height].
+
+    Raises:
+        ValueError: Eğer normalize edilmiş koordinatlar veya boyutlar geçersizse.
+    """
+    if validation != 'trusted':
+        validate_numeric(x_center, y_center, r_width, r_height)
+        if is_clip_mode(validation):
+            x_center, y_center, r_width, r_height = _clip_center(x_center, y_center, r_width, r_height, 1)
+        if not (0 <= x_center <= 1 and 0 <= y_center <= 1):
+            raise ValueError("Center coordinates must be between 0 and 1.")
+        if not (0 < r_width <= 1 and 0 < r_height <= 1):
+            raise ValueError("Invalid YOLO bounding box dimensions.")
+    return [x_center, y_center, r_width, r_height]
+
+def yolo_to_coco(x_center, y_center, r_width, r_height, size, validation='strict'):
     """
     YOLO formatından COCO formatına dönüşüm yapar.
 
@@ -160,6 +332,7 @@ def yolo_to_coco(x_center, y_center, r_width, r_height, size):
         r_width (float): Normalize edilmiş genişlik.
         r_height (float): Normalize edilmiş yükseklik.
         size (tuple): Görüntü boyutu (width, height).
+        validation (str): 'strict' (hata fırlatır), 'clip' (görüntüye kırpar) veya 'trusted' (kontrol yok).
 
     Returns:
         list: [x_min, y_min, width, height] formatında COCO bounding box.
@@ -167,21 +340,16 @@ def yolo_to_coco(x_center, y_center, r_width, r_height, size):
     Raises:
         ValueError: Eğer normalize edilmiş koordinatlar veya boyutlar geçersizse.
     """
-
-    validate_numeric(x_center, y_center, r_width, r_height)
-    validate_size(size)
+    if validation != 'trusted':
+        x_center, y_center, r_width, r_height = _validate_yolo(x_center, y_center, r_width, r_height, size, validation)
     max_width, max_height = size
-    if not (0 <= x_center <= 1 and 0 <= y_center <= 1):
-        raise ValueError("Center coordinates must be between 0 and 1.")
-    if not (0 < r_width <= 1 and 0 < r_height <= 1):
-        raise ValueError("Invalid YOLO bounding box dimensions.")
     width = r_width * max_width
     height = r_height * max_height
     x_min = (x_center * max_width) - (width / 2)
     y_min = (y_center * max_height) - (height / 2)
     return [x_min, y_min, width, height]
 
-def yolo_to_pascal(x_center, y_center, r_width, r_height, size):
+def yolo_to_pascal(x_center, y_center, r_width, r_height, size, validation='strict'):
     """
     YOLO formatından Pascal VOC formatına dönüşüm yapar.
 
@@ -191,6 +359,7 @@ def yolo_to_pascal(x_center, y_center, r_width, r_height, size):
         r_width (float): Normalize edilmiş genişlik.
         r_height (float): Normalize edilmiş yükseklik.
         size (tuple): Görüntü boyutu (width, height).
+        validation (str): 'strict' (hata fırlatır), 'clip' (görüntüye kırpar) veya 'trusted' (kontrol yok).
 
     Returns:
         list: [x_min, y_min, x_max, y_max] formatında Pascal VOC bounding box.
@@ -198,14 +367,9 @@ def yolo_to_pascal(x_center, y_center, r_width, r_height, size):
     Raises:
         ValueError: Eğer normalize edilmiş koordinatlar veya boyutlar geçersizse.
     """
-
-    validate_numeric(x_center, y_center, r_width, r_height)
-    validate_size(size)
+    if validation != 'trusted':
+        x_center, y_center, r_width, r_height = _validate_yolo(x_center, y_center, r_width, r_height, size, validation)
     max_width, max_height = size
-    if not (0 <= x_center <= 1 and 0 <= y_center <= 1):
-        raise ValueError("Center coordinates must be between 0 and 1.")
-    if not (0 < r_width <= 1 and 0 < r_height <= 1):
-        raise ValueError("Invalid YOLO bounding box dimensions.")
     width = r_width * max_width
     height = r_height * max_height
     x_min = (x_center * max_width) - (width / 2)
@@ -214,14 +378,133 @@ def yolo_to_pascal(x_center, y_center, r_width, r_height, size):
     y_max = y_min + height
     return [x_min, y_min, x_max, y_max]
 
-def convert_bbox(from_format, to_format, *args, **kwargs):
+def pascal_to_cxcywh(x_min, y_min, x_max, y_max, validation='strict'):
+    """
+    Pascal VOC formatından merkez-genişlik-yükseklik (cxcywh) formatına dönüşüm yapar.
+
+    Args:
+        x_min (float): Sol üst köşenin x koordinatı.
+        y_min (float): Sol üst köşenin y koordinatı.
+        x_max (float): Sağ alt köşenin x koordinatı.
+        y_max (float): Sağ alt köşenin y koordinatı.
+        validation (str): 'strict' (hata fırlatır), 'clip' (negatif değerleri kırpar) veya 'trusted' (kontrol yok).
+
+    Returns:
+        list: [x_center, y_center, width, height] formatında piksel cinsinden bounding box.
+
+    Raises:
+        ValueError: Eğer koordinatlar geçersizse.
+    """
+    if validation != 'trusted':
+        validate_numeric(x_min, y_min, x_max, y_max)
+        if is_clip_mode(validation):
+            x_min, y_min, x_max, y_max = clip_pascal(x_min, y_min, x_max, y_max)
+        validate_non_negative(x_min, y_min, x_max, y_max)
+        if x_max <= x_min or y_max <= y_min:
+            raise ValueError("Invalid Pascal bounding box coordinates.")
+    return [(x_min + x_max) / 2, (y_min + y_max) / 2, x_max - x_min, y_max - y_min]
+
+def cxcywh_to_pascal(x_center, y_center, width, height, validation='strict'):
+    """
+    Merkez-genişlik-yükseklik (cxcywh) formatından Pascal VOC formatına dönüşüm yapar.
+
+    Args:
+        x_center (float): Merkezin x koordinatı.
+        y_center (float): Merkezin y koordinatı.
+        width (float): Bounding box'ın genişliği.
+        height (float): Bounding box'ın yüksekliği.
+        validation (str): 'strict' (hata fırlatır), 'clip' (negatif köşeleri kırpar) veya 'trusted' (kontrol yok).
+
+    Returns:
+        list: [x_min, y_min, x_max, y_max] formatında Pascal VOC bounding box.
+
+    Raises:
+        ValueError: Eğer boyutlar geçersizse.
+    """
+    if validation != 'trusted':
+        validate_numeric(x_center, y_center, width, height)
+        if is_clip_mode(validation):
+            x_center, y_center, width, height = _clip_center(x_center, y_center, width, height)
+        if width <= 0 or height <= 0:
+            raise ValueError("Invalid center bounding box dimensions.")
+    x_min = x_center - (width / 2)
+    y_min = y_center - (height / 2)
+    return [x_min, y_min, x_min + width, y_min + height]
+
+def pascal_to_pascal_norm(x_min, y_min, x_max, y_max, size, validation='strict'):
+    """
+    Pascal VOC formatından normalize edilmiş Pascal (albumentations) formatına dönüşüm yapar.
+
+    Args:
+        x_min (float): Sol üst köşenin x koordinatı.
+        y_min (float): Sol üst köşenin y koordinatı.
+        x_max (float): Sağ alt köşenin x koordinatı.
+        y_max (float): Sağ alt köşenin y koordinatı.
+        size (tuple): Görüntü boyutu (width, height).
+        validation (str): 'strict' (hata fırlatır), 'clip' (görüntüye kırpar) veya 'trusted' (kontrol yok).
+
+    Returns:
+        list: [x_min, y_min, x_max, y_max] formatında 0-1 aralığına normalize edilmiş bounding box.
+
+    Raises:
+        ValueError: Eğer koordinatlar geçersizse veya görüntü boyutları dışındaysa.
+    """
+    if validation != 'trusted':
+        validate_numeric(x_min, y_min, x_max, y_max)
+        validate_size(size)
+        if is_clip_mode(validation):
+            x_min, y_min, x_max, y_max = clip_pascal(x_min, y_min, x_max, y_max, size)
+        validate_non_negative(x_min, y_min, x_max, y_max)
+    max_width, max_height = size
+    if validation != 'trusted':
+        if x_max <= x_min or y_max <= y_min:
+            raise ValueError("Invalid Pascal bounding box coordinates.")
+        if x_max > max_width or y_max > max_height:
+            raise ValueError("Bounding box coordinates are outside image dimensions.")
+    return [x_min / max_width, y_min / max_height, x_max / max_width, y_max / max_height]
+
+def pascal_norm_to_pascal(x_min, y_min, x_max, y_max, size, validation='strict'):
+    """
+    Normalize edilmiş Pascal (albumentations) formatından Pascal VOC formatına dönüşüm yapar.
+
+    Args:
+        x_min (float): Normalize edilmiş sol üst köşe x koordinatı.
+        y_min (float): Normalize edilmiş sol üst köşe y koordinatı.
+        x_max (float): Normalize edilmiş sağ alt köşe x koordinatı.
+        y_max (float): Normalize edilmiş sağ alt köşe y koordinatı.
+        size (tuple): Görüntü boyutu (width, height).
+        validation (str): 'strict' (hata fırlatır), 'clip' (0-1 aralığına kırpar) veya 'trusted' (kontrol yok).
+
+    Returns:
+        list: [x_min, y_min, x_max, y_max] formatında piksel cinsinden Pascal VOC bounding box.
+
+    Raises:
+        ValueError: Eğer normalize edilmiş koordinatlar geçersizse.
+    """
+    if validation != 'trusted':
+        validate_numeric(x_min, y_min, x_max, y_max)
+        validate_size(size)
+        if is_clip_mode(validation):
+            x_min, y_min, x_max, y_max = clip_pascal(x_min, y_min, x_max, y_max, (1, 1))
+        if not all(0 <= arg <= 1 for arg in (x_min, y_min, x_max, y_max)):
+            raise ValueError("Normalized coordinates must be between 0 and 1.")
+        if x_max <= x_min or y_max <= y_min:
+            raise ValueError("Invalid Pascal bounding box coordinates.")
+    max_width, max_height = size
+    return [x_min * max_width, y_min * max_height, x_max * max_width, y_max * max_height]
+
+def convert_bbox(from_format, to_format, *args, validation='strict', **kwargs):
     """
     Bounding box formatları arasında dönüşüm yapar.
 
+    Dönüşüm yolu `get_plan` ile bir kez çözülür ve önbelleğe alınır. Sık
+    çağrılan döngülerde planı doğrudan kullanmak daha hızlıdır.
+
     Args:
-        from_format (str): Kaynak format ('pascal', 'coco', veya 'yolo').
-        to_format (str): Hedef format ('pascal', 'coco', veya 'yolo').
+        from_format (str): Kaynak format ('pascal', 'coco', 'yolo', 'cxcywh', 'pascal_norm' veya kayıtlı bir format).
+        to_format (str): Hedef format.
         *args: Bounding box koordinatları.
+        validation (str): 'strict', 'clip' veya 'trusted'.
         **kwargs: Ek parametreler (örn. 'size').
 
     Returns:
@@ -230,12 +513,10 @@ def convert_bbox(from_format, to_format, *args, **kwargs):
     Raises:
         ValueError: Desteklenmeyen bir dönüşüm istendiğinde.
     """
-    func_name = f"{from_format}_to_{to_format}"
-    conversion_func = globals().get(func_name)
-    if conversion_func:
-        return conversion_func(*args, **kwargs)
-    else:
-        raise ValueError(f"Unsupported conversion: {from_format} to {to_format}")
+    return _plan._cached_plan(from_format, to_format, None, validation)(*args, **kwargs)
+
+# plan modülü bu modülü içe aktarır; döngüsel içe aktarmayı kırmak için en sonda yüklenir.
+from pyprocess.convert.bboxes import plan as _plan  # noqa: E402
 
 def main():
     # Test pascal_to_coco
@@ -0,0 +1,315 @@
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from pyprocess.convert.bboxes.convert_bbox import (
+    is_clip_mode,
+    pascal_to_coco,
+    pascal_to_yolo,
+    coco_to_pascal,
+    coco_to_yolo,
+    yolo_to_coco,
+    yolo_to_pascal,
+    pascal_to_cxcywh,
+    cxcywh_to_pascal,
+    pascal_to_pascal_norm,
+    pascal_norm_to_pascal,
+    validate_pascal,
+    validate_coco,
+    validate_yolo
+)
+from pyprocess.convert.bboxes.batch import (
+    _as_boxes,
+    pascal_to_coco_batch,
+    pascal_to_yolo_batch,
+    coco_to_pascal_batch,
+    coco_to_yolo_batch,
+    yolo_to_coco_batch,
+    yolo_to_pascal_batch,
+    pascal_to_cxcywh_batch,
+    cxcywh_to_pascal_batch,
+    pascal_to_pascal_norm_batch,
+    pascal_norm_to_pascal_batch,
+    validate_pascal_batch,
+    validate_coco_batch,
+    validate_yolo_batch
+)
+from pyprocess.utils import metrics
+
+class BoxFormat(NamedTuple):
+    """
+    Kayıtlı bir bounding box formatı. Her format Pascal VOC'a ve Pascal
+    VOC'tan dönüşüm fonksiyonlarıyla tanımlanır; diğer tüm çiftler bu
+    fonksiyonlar zincirlenerek elde edilir.
+
+    Attributes:
+        name (str): Format adı.
+        to_pascal (callable): Skaler (a, b, c, d[, size]) -> Pascal VOC listesi.
+        from_pascal (callable): Skaler Pascal VOC (x_min, y_min, x_max, y_max[, size]) -> liste.
+        needs_size (bool): Dönüşümlerin görüntü boyutuna ihtiyaç duyup duymadığı.
+        to_pascal_batch (callable): Toplu (boxes[, size], out=) sürümü.
+        from_pascal_batch (callable): Toplu (boxes[, size], out=) sürümü.
+
+    'strict' dışındaki doğrulama modlarında fonksiyonlara `validation=`
+    anahtar argümanı, toplu sürümlere ayrıca `return_mask=` geçirilir.
+    """
+    name: str
+    to_pascal: Optional[Callable]
+    from_pascal: Optional[Callable]
+    needs_size: bool
+    to_pascal_batch: Optional[Callable]
+    from_pascal_batch: Optional[Callable]
+
+class _Step(NamedTuple):
+    func: Callable
+    batch_func: Callable
+    needs_size: bool
+
+_FORMATS: Dict[str, BoxFormat] = {}
+_ALIASES: Dict[str, str] = {'albumentations': 'pascal_norm'}
+
+# Doğrudan dönüşüm fonksiyonu olan çiftler; zincirleme yerine tercih edilir.
+_DIRECT: Dict[Tuple[str, str], _Step] = {
+    ('pascal', 'coco'): _Step(pascal_to_coco, pascal_to_coco_batch, False),
+    ('pascal', 'yolo'): _Step(pascal_to_yolo, pascal_to_yolo_batch, True),
+    ('coco', 'pascal'): _Step(coco_to_pascal, coco_to_pascal_batch, False),
+    ('coco', 'yolo'): _Step(coco_to_yolo, coco_to_yolo_batch, True),
+    ('yolo', 'coco'): _Step(yolo_to_coco, yolo_to_coco_batch, True),
+    ('yolo', 'pascal'): _Step(yolo_to_pascal, yolo_to_pascal_batch, True),
+}
+
+# Aynı format çiftleri; koordinatlar değişmez ama doğrulama modu yine uygulanır.
+# Pascal VOC ve COCO'da boyut isteğe bağlıdır; verilirse görüntü sınırları da kontrol edilir.
+_IDENTITY: Dict[str, _Step] = {
+    'pascal': _Step(validate_pascal, validate_pascal_batch, True),
+    'coco': _Step(validate_coco, validate_coco_batch, True),
+    'yolo': _Step(validate_yolo, validate_yolo_batch, False),
+}
+
+def _row_wise(func: Callable, needs_size: bool) -> Callable:
+    def run(boxes, size=None, out=None, return_mask=False, **options):
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        if out is None:
+            out = np.empty(boxes.shape, dtype=np.float64)
+        if needs_size and np.ndim(size) == 2:
+            args = ((*row, tuple(s)) for row, s in zip(boxes.tolist(), np.asarray(size).tolist()))
+        elif needs_size:
+            args = ((*row, size) for row in boxes.tolist())
+        else:
+            args = boxes.tolist()
+        invalid = np.zeros(len(boxes), dtype=bool)
+        for i, row in enumerate(args):
+            try:
+                out[i] = func(*row, **options)
+            except ValueError:
+                if not return_mask:
+                    raise
+                invalid[i] = True
+                out[i] = np.nan
+        return (out, invalid) if return_mask else out
+    return run
+
+def register_format(name: str, to_pascal: Callable, from_pascal: Callable, needs_size: bool = False,
+                    to_pascal_batch: Optional[Callable] = None, from_pascal_batch: Optional[Callable] = None) -> None:
+    """
+    Yeni bir bounding box formatı kaydeder.
+
+    Yalnızca Pascal VOC'a ve Pascal VOC'tan dönüşümler gereklidir; diğer
+    formatlarla dönüşümler Pascal VOC üzerinden zincirlenir. Toplu
+    sürümler verilmezse skaler fonksiyonlar satır satır uygulanır.
+    Yerleşik bir format (örn. 'coco') yeniden kaydedilirse o formatın doğrudan
+    dönüşümleri ve aynı format doğrulaması bırakılır; yeni fonksiyonlar kullanılır.
+
+    Args:
+        name (str): Format adı.
+        to_pascal (callable): (a, b, c, d[, size]) -> [x_min, y_min, x_max, y_max].
+        from_pascal (callable): (x_min, y_min, x_max, y_max[, size]) -> [a, b, c, d].
+        needs_size (bool): Fonksiyonlar son argüman olarak görüntü boyutu alıyorsa True.
+        to_pascal_batch (callable, optional): (boxes[, size], out=None) -> (N, 4) dizi.
+        from_pascal_batch (callable, optional): (boxes[, size], out=None) -> (N, 4) dizi.
+
+    Raises:
+        ValueError: Eğer ad 'pascal' ise; tüm dönüşümler Pascal VOC üzerinden zincirlenir.
+    """
+    if _ALIASES.get(name, name) == 'pascal':
+        raise ValueError("Pascal VOC is the conversion hub and cannot be re-registered.")
+    for pair in [pair for pair in _DIRECT if name in pair]:
+        del _DIRECT[pair]
+    _IDENTITY.pop(name, None)
+    _add_format(name, to_pascal, from_pascal, needs_size, to_pascal_batch, from_pascal_batch)
+
+def _add_format(name: str, to_pascal: Optional[Callable], from_pascal: Optional[Callable], needs_size: bool,
+                to_pascal_batch: Optional[Callable], from_pascal_batch: Optional[Callable]) -> None:
+    _FORMATS[name] = BoxFormat(
+        name, to_pascal, from_pascal, needs_size,
+        to_pascal_batch or _row_wise(to_pascal, needs_size),
+        from_pascal_batch or _row_wise(from_pascal, needs_size),
+    )
+    _resolve_steps.cache_clear()
+    _cached_plan.cache_clear()
+
+def available_formats() -> List[str]:
+    return sorted(list(_FORMATS) + list(_ALIASES))
+
+@lru_cache(maxsize=None)
+def _resolve_steps(from_format: str, to_format: str) -> Tuple[_Step, ...]:
+    source = _FORMATS.get(_ALIASES.get(from_format, from_format))
+    target = _FORMATS.get(_ALIASES.get(to_format, to_format))
+    if source is None or target is None:
+        raise ValueError(f"Unsupported conversion: {from_format} to {to_format}")
+    if source.name == target.name:
+        identity = _IDENTITY.get(source.name)
+        return () if identity is None else (identity,)
+    direct = _DIRECT.get((source.name, target.name))
+    if direct is not None:
+        return (direct,)
+    steps = []
+    if source.name != 'pascal':
+        steps.append(_Step(source.to_pascal, source.to_pascal_batch, source.needs_size))
+    if target.name != 'pascal':
+        steps.append(_Step(target.from_pascal, target.from_pascal_batch, target.needs_size))
+    return tuple(steps)
+
+class ConversionPlan:
+    """
+    Bir (kaynak, hedef, seçenekler) üçlüsü için önceden çözülmüş dönüşüm.
+
+    Plan, doğrudan dönüşüm fonksiyonunu veya Pascal VOC üzerinden
+    zincirlenmiş adımları tutar; çağrı sırasında sözlük araması veya
+    format adı çözümlemesi yapılmaz. Aynı formatlar arasındaki plan
+    koordinatları dönüştürmez; yerleşik formatlarda (pascal, coco, yolo)
+    kutular yine de doğrulama moduna göre kontrol edilir veya kırpılır.
+    """
+    def __init__(self, from_format: str, to_format: str, steps: Tuple[_Step, ...], size=None,
+                 validation: str = 'strict'):
+        self.from_format = from_format
+        self.to_format = to_format
+        self.steps = steps
+        self.size = size
+        self.validation = validation
+        self.needs_size = any(step.needs_size for step in steps)
+        # 'strict' varsayılandır; kayıtlı formatlar validation argümanını desteklemek zorunda değildir.
+        self._options = {} if validation == 'strict' else {'validation': validation}
+
+    def __repr__(self) -> str:
+        return (f"ConversionPlan({self.from_format!r} -> {self.to_format!r}, steps={len(self.steps)}, "
+                f"validation={self.validation!r})")
+
+    def __call__(self, *coords, size=None):
+        """
+        Tek bir kutuyu dönüştürür.
+
+        Args:
+            *coords: Dört koordinat; eski kullanım için beşinci argüman olarak size verilebilir.
+            size (tuple, optional): Görüntü boyutu; verilmezse planın boyutu kullanılır.
+
+        Returns:
+            list: Dönüştürülmüş bounding box koordinatları.
+        """
+        if len(coords) == 5 and size is None:
+            size = coords[4]
+            coords = coords[:4]
+        if size is None:
+            size = self.size
+        values = coords
+        for step in self.steps:
+            if step.needs_size:
+                values = step.func(*values, size, **self._options)
+            else:
+                values = step.func(*values, **self._options)
+        return list(values)
+
+    def batch(self, boxes, size=None, out=None, return_mask: bool = False):
+        """
+        (N, 4) kutu dizisini dönüştürür.
+
+        Args:
+            boxes (array-like): (N, 4) bounding box dizisi.
+            size (array-like, optional): Ortak (width, height) veya (N, 2) görüntü boyutu.
+            out (np.ndarray, optional): Sonuçların yazılacağı (N, 4) tampon.
+            return_mask (bool): True ise hata fırlatılmaz; herhangi bir adımda geçersiz
+                bulunan satırlar NaN yapılır ve (N,) bool maske de döndürülür.
+
+        Returns:
+            np.ndarray: Dönüştürülmüş (N, 4) dizi.
+            tuple: return_mask True ise (out, invalid_mask).
+        """
+        if not metrics.ENABLED:
+            return self._batch(boxes, size, out, return_mask)
+        try:
+            with metrics.timer('convert.batch'):
+                result = self._batch(boxes, size, out, return_mask)
+        except ValueError:
+            metrics.count('convert.validation_failures')
+            raise
+        if return_mask:
+            metrics.count('convert.boxes', len(result[0]))
+            metrics.count('convert.invalid', int(result[1].sum()))
+        else:
+            metrics.count('convert.boxes', len(result))
+        return result
+
+    def _batch(self, boxes, size, out, return_mask: bool):
+        if size is None:
+            size = self.size
+        if not self.steps:
+            boxes, out = _as_boxes(boxes, out)
+            out[...] = boxes
+            return (out, np.zeros(len(out), dtype=bool)) if return_mask else out
+        options = dict(self._options, return_mask=True) if return_mask else self._options
+        values = boxes
+        invalid = None
+        last = len(self.steps) - 1
+        for i, step in enumerate(self.steps):
+            target = out if i == last else None
+            if step.needs_size:
+                values = step.batch_func(values, size, out=target, **options)
+            else:
+                values = step.batch_func(values, out=target, **options)
+            if return_mask:
+                values, mask = values
+                invalid = mask if invalid is None else invalid | mask
+        if return_mask:
+            values[invalid] = np.nan
+            return values, invalid
+        return values
+
+def get_plan(from_format: str, to_format: str, size=None, validation: str = 'strict') -> ConversionPlan:
+    """
+    Bir dönüşüm planını çözer ve önbelleğe alır.
+
+    Args:
+        from_format (str): Kaynak format.
+        to_format (str): Hedef format.
+        size (array-like, optional): Plana bağlanacak varsayılan (width, height) görüntü boyutu;
+            önbellek anahtarı için tuple'a çevrilir.
+        validation (str): 'strict' (geçersiz kutuda hata), 'clip' (görüntü sınırlarına kırpar)
+            veya 'trusted' (hiç kontrol yapılmaz).
+
+    Returns:
+        ConversionPlan: Tekrar tekrar çağrılabilen dönüşüm planı.
+
+    Raises:
+        ValueError: Desteklenmeyen bir dönüşüm veya bilinmeyen bir doğrulama modu istendiğinde.
+    """
+    if size is not None and not isinstance(size, tuple):
+        size = tuple(np.asarray(size).tolist())
+    return _cached_plan(from_format, to_format, size, validation)
+
+@lru_cache(maxsize=1024)
+def _cached_plan(from_format: str, to_format: str, size: Optional[Tuple[float, float]],
+                 validation: str) -> ConversionPlan:
+    if validation != 'trusted':
+        is_clip_mode(validation)
+    return ConversionPlan(from_format, to_format, _resolve_steps(from_format, to_format), size, validation)
+
+_add_format('pascal', None, None, False, None, None)
+_add_format('coco', coco_to_pascal, pascal_to_coco, False,
+            coco_to_pascal_batch, pascal_to_coco_batch)
+_add_format('yolo', yolo_to_pascal, pascal_to_yolo, True,
+            yolo_to_pascal_batch, pascal_to_yolo_batch)
+_add_format('cxcywh', cxcywh_to_pascal, pascal_to_cxcywh, False,
+            cxcywh_to_pascal_batch, pascal_to_cxcywh_batch)
+_add_format('pascal_norm', pascal_norm_to_pascal, pascal_to_pascal_norm, True,
+            pascal_norm_to_pascal_batch, pascal_to_pascal_norm_batch)
@@ -1,13 +1,325 @@
 # pyprocess/pyprocess/main.py
+import argparse
+import json
+import os
 import sys
+import time
+from itertools import count, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from pyprocess.utils.display import warning
+IMAGE_EXTENSIONS = ('.bmp', '.jpeg', '.jpg', '.png', '.tif', '.tiff', '.webp')
+HANDEDNESS = ('Left', 'Right')
+DEFAULT_CHUNK_SIZE = {'convert': 512, 'detect-hands': 32}
 
+def _log(message: str) -> None:
+    print(message, file=sys.stderr, flush=True)
 
-def main():
-    # Placeholder for future functionality
-    warning("This is a placeholder for the main functionality. Future implementation will be added here.")
+def _read_classes(value: Optional[str], src: str, src_format: str) -> Optional[List[str]]:
+    """
+    Sınıf listesini bir dosyadan, virgülle ayrılmış metinden veya YOLO
+    kaynağındaki `classes.txt`'den okur.
+    """
+    if value is None and src_format == 'yolo' and os.path.isfile(os.path.join(src, 'classes.txt')):
+        value = os.path.join(src, 'classes.txt')
+    if value is None:
+        return None
+    if os.path.isfile(value):
+        with open(value) as file:
+            return [line.strip() for line in file if line.strip()]
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+def run_convert(args: argparse.Namespace) -> int:
+    """
+    Anotasyon ağacını `convert_dataset_parallel` ile dönüştürür.
+
+    YOLO ve VOC hedeflerinde görüntü başına dosyalar yazıldıkça diske düşer;
+    `--resume` ile mevcut dosyalar atlanır. COCO hedefi geçici bir dosyaya
+    yazılır ve yalnızca başarıyla bitince yerine taşınır, böylece yarıda
+    kalmış bir çalışma tamamlanmış bir çıktı gibi görünmez. Tek parça
+    yazıldığından COCO'da `--resume` kısmi ilerlemeyi kullanamaz: çıktı varsa
+    iş tamamlanmış sayılır, yoksa dönüşüm baştan yapılır. Depo
+    (store) dosyası okunan veya yazılan dönüşümler tek süreçte akış halinde
+    yapılır; depo dosyası da yalnızca tamamlanınca yerine taşınır.
+    """
+    from pyprocess.convert import convert_dataset, convert_dataset_parallel
+
+    classes = _read_classes(args.classes, args.src, args.src_format)
+    if 'store' in (args.src_format, args.dst_format):
+        if args.resume and args.dst_format == 'store' and os.path.exists(args.dst):
+            _log(f"{args.dst} is already complete; nothing to resume.")
+            return 0
+        stats = convert_dataset(args.src, args.src_format, args.dst, args.dst_format, size_of=args.images,
+                                size_cache=args.size_cache, classes=classes, image_ext=args.image_ext,
+                                validation=args.validation)
+        print(json.dumps(stats))
+        return 0
+    if args.dst_format == 'coco' and args.resume and os.path.exists(args.dst):
+        _log(f"{args.dst} is already complete; nothing to resume.")
+        return 0
+
+    def progress(state) -> None:
+        _log(f"shards {state.shards_done}  images {state.images}  boxes {state.boxes}  invalid {state.invalid}  "
+             f"skipped {state.skipped}  {state.images_per_second:.1f} images/s")
+
+    stats = convert_dataset_parallel(args.src, args.src_format, args.dst, args.dst_format, size_of=args.images,
+                                     size_cache=args.size_cache, classes=classes, image_ext=args.image_ext,
+                                     workers=args.workers,
+                                     chunk_size=args.chunk_size or DEFAULT_CHUNK_SIZE['convert'],
+                                     progress=progress if args.progress else None, validation=args.validation,
+                                     resume=args.resume and args.dst_format != 'coco')
+    print(json.dumps(stats))
+    return 0
+
+def _iter_jobs(inputs: Sequence[str]) -> Iterator[Tuple[str, Dict[str, Any], Any]]:
+    """
+    Girdileri (ad, tanım, kaynak) işlerine ayırır: her dizin sıralı bir görüntü
+    listesi, her video dosyası tek bir iş olur; tek tek verilen görüntüler
+    'images' adlı tek işte toplanır. Tanım, devam ettirmede işin
+    değişmediğini doğrulamak için manifest'e yazılır.
+    """
+    loose = []
+    for path in inputs:
+        name = os.path.splitext(os.path.basename(os.path.normpath(path)))[0]
+        if os.path.isdir(path):
+            files = sorted(entry.path for entry in os.scandir(path)
+                           if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS))
+            yield name, {'source': path, 'kind': 'images', 'total': len(files)}, files
+        elif path.lower().endswith(IMAGE_EXTENSIONS):
+            loose.append(path)
+        elif os.path.isfile(path):
+            yield name, {'source': path, 'kind': 'video'}, path
+        else:
+            raise OSError(f"Input not found: {path}")
+    if loose:
+        yield 'images', {'source': loose, 'kind': 'images', 'total': len(loose)}, loose
+
+def _detect_in_process(items: Iterable, read: Callable[[Any], Any], detector_kwargs: Dict[str, Any]) -> Iterator:
+    # Tek işçide süreç havuzu kurulmaz; aynı HandResult'lar bu süreçte üretilir.
+    from pyprocess.mp_utils.hand_detector import HandDetector, results_to_arrays
+    from pyprocess.mp_utils.pool import HandResult
+
+    detector = HandDetector(mode=True, **detector_kwargs)
+    for item in items:
+        img = read(item)
+        if img is None:
+            yield HandResult(*results_to_arrays(None), (0, 0))
+            continue
+        detector.process(img, copy=False)
+        yield HandResult(*detector.arrays(), (img.shape[1], img.shape[0]))
+
+def _write_shard(path: str, names: List[str], results: List, fmt: str) -> None:
+    """
+    Bir parçanın sonuçlarını atomik olarak yazar; yarım kalan parça dosyası oluşmaz.
+    """
+    import numpy as np
+
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as file:
+        if fmt == 'npz':
+            # Eller tüm parça için birleştirilir; 'counts' her öğenin el sayısıdır.
+            np.savez(file, names=np.array(names), sizes=np.array([r.size for r in results], np.int32),
+                     counts=np.array([len(r.handedness) for r in results], np.int32),
+                     landmarks=np.concatenate([r.landmarks for r in results]),
+                     handedness=np.concatenate([r.handedness for r in results]),
+                     scores=np.concatenate([r.scores for r in results]))
+        else:
+            items = [{'name': name, 'size': list(result.size),
+                      'hands': [{'handedness': HANDEDNESS[side], 'score': round(score, 6),
+                                 'landmarks': landmarks.round(6).tolist()}
+                                for landmarks, side, score in zip(result.landmarks, result.handedness.tolist(),
+                                                                  result.scores.tolist())]}
+                     for name, result in zip(names, results)]
+            file.write(json.dumps(items).encode())
+    os.replace(tmp, path)
+
+def _shard_items(path: str, fmt: str) -> int:
+    """
+    Bir parça dosyasındaki öğe sayısı.
+    """
+    import numpy as np
+
+    if fmt == 'npz':
+        with np.load(path) as data:
+            return len(data['names'])
+    with open(path) as file:
+        return len(json.load(file))
+
+def _prepare_job_dir(job_dir: str, manifest: Dict[str, Any], resume: bool) -> Tuple[int, int, Optional[int]]:
+    """
+    İş dizinini hazırlar ve kaç parçanın ve öğenin atlanacağını döndürür.
+
+    Son parça dışındaki parçalar tam `chunk_size` öğe içerir; girdinin sonunda
+    yazılmış kısa bir son parça olabileceğinden yalnızca onun öğeleri sayılır.
+
+    Returns:
+        tuple: (tamamlanmış parça sayısı, bu parçalardaki öğe sayısı, iş önceden bitmişse
+        işlenen öğe sayısı, değilse None).
+
+    Raises:
+        ValueError: Eğer devam ettirilen işin parametreleri değişmişse.
+    """
+    manifest_path = os.path.join(job_dir, 'manifest.json')
+    os.makedirs(job_dir, exist_ok=True)
+    shards = sorted(name for name in os.listdir(job_dir) if name.startswith('shard-'))
+    if resume and os.path.exists(manifest_path):
+        with open(manifest_path) as file:
+            previous = json.load(file)
+        for key, value in manifest.items():
+            if previous.get(key) != value:
+                raise ValueError(f"Cannot resume {job_dir}: {key} changed ({previous.get(key)!r} -> {value!r}).")
+        done = 0
+        while f"shard-{done:06d}.{manifest['format']}" in shards:
+            done += 1
+        stored = 0
+        if done:
+            last = os.path.join(job_dir, f"shard-{done - 1:06d}.{manifest['format']}")
+            stored = (done - 1) * manifest['chunk_size'] + _shard_items(last, manifest['format'])
+        return done, stored, previous['items'] if previous.get('complete') else None
+    for name in shards:
+        os.remove(os.path.join(job_dir, name))
+    with open(manifest_path, 'w') as file:
+        json.dump(dict(manifest, complete=False), file)
+    return 0, 0, None
+
+def run_detect_hands(args: argparse.Namespace) -> int:
+    """
+    Görüntü dizinlerinde veya video dosyalarında el algılar.
+
+    Sonuçlar her girdi için `<output>/<ad>/shard-NNNNNN.<format>` dosyalarına
+    `--chunk-size` öğelik parçalar halinde yazılır. Her parça atomik
+    yazıldığından `--resume` tamamlanmış parçaları atlayıp kalan öğelerden devam eder.
+    """
+    import cv2
+    from pyprocess.mp_utils.pool import HandDetectorPool, iter_video
+
+    chunk_size = args.chunk_size or DEFAULT_CHUNK_SIZE['detect-hands']
+    detector_kwargs = {'max_hands': args.max_hands, 'model_complexity': args.model_complexity,
+                       'detection_conf': args.detection_conf}
+    workers = args.workers or os.cpu_count() or 1
+    pool = HandDetectorPool(workers=workers, chunk_size=chunk_size, **detector_kwargs) if workers > 1 else None
+    summary = {}
+    try:
+        for name, job, source in _iter_jobs(args.inputs):
+            job_dir = os.path.join(args.output, name)
+            manifest = dict(job, chunk_size=chunk_size, format=args.format)
+            done, skip, finished = _prepare_job_dir(job_dir, manifest, args.resume)
+            if finished is not None:
+                summary[name] = {'items': 0, 'hands': 0, 'skipped': finished}
+                continue
+            if job['kind'] == 'images':
+                items = source[skip:]
+                names = iter([os.path.basename(path) for path in items])
+                results = pool.map_files(items) if pool else _detect_in_process(items, cv2.imread, detector_kwargs)
+            else:
+                # Video kareleri sırayla çözülür; tamamlanmış parçaların kareleri okunup atlanır.
+                frames = islice(iter_video(source), skip, args.max_frames)
+                names = (str(index) for index in count(skip))
+                results = pool.map_frames(frames) if pool else _detect_in_process(frames, lambda f: f, detector_kwargs)
+            items_done = hands = 0
+            started = time.perf_counter()
+            shard = done
+            while True:
+                batch = list(islice(results, chunk_size))
+                if not batch:
+                    break
+                batch_names = list(islice(names, len(batch)))
+                _write_shard(os.path.join(job_dir, f"shard-{shard:06d}.{args.format}"), batch_names, batch,
+                             args.format)
+                shard += 1
+                items_done += len(batch)
+                hands += sum(len(result.handedness) for result in batch)
+                if args.progress:
+                    rate = items_done / max(time.perf_counter() - started, 1e-9)
+                    _log(f"{name}: shards {shard}  items {skip + items_done}  hands {hands}  {rate:.1f} items/s")
+            with open(os.path.join(job_dir, 'manifest.json'), 'w') as file:
+                json.dump(dict(manifest, complete=True, items=skip + items_done, shards=shard), file)
+            summary[name] = {'items': items_done, 'hands': hands, 'skipped': skip}
+    finally:
+        if pool is not None:
+            pool.close()
+    print(json.dumps(summary))
+    return 0
+
+def run_bench(args: argparse.Namespace) -> int:
+    from pyprocess.bench.runner import run_from_args
+
+    return run_from_args(args)
+
+def _shared_options() -> argparse.ArgumentParser:
+    shared = argparse.ArgumentParser(add_help=False)
+    shared.add_argument('--workers', type=int, help="Worker processes (default: CPU count).")
+    shared.add_argument('--chunk-size', type=int,
+                        help="Items per work unit and output shard (default: convert 512, detect-hands 32).")
+    shared.add_argument('--progress', action='store_true', help="Report progress on stderr after each chunk.")
+    shared.add_argument('--resume', action='store_true',
+                        help="Continue an interrupted run, skipping finished output. COCO output is a single file: "
+                             "an existing one is kept as complete, otherwise the conversion starts over.")
+    return shared
+
+def build_parser() -> argparse.ArgumentParser:
+    from pyprocess.bench.runner import build_parser as build_bench_parser
+
+    parser = argparse.ArgumentParser(prog='pyprocess', description="Batch jobs for annotations and hand landmarks.")
+    parser.add_argument('--metrics', metavar='FILE',
+                        help="Enable instrumentation and write Prometheus text metrics to FILE on exit.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    shared = _shared_options()
+
+    convert = commands.add_parser('convert', parents=[shared], help="Convert an annotation tree between formats.")
+    convert.add_argument('src', help="Source label directory, COCO JSON file or store file.")
+    convert.add_argument('dst', help="Destination directory (YOLO/VOC), JSON file (COCO) or store file.")
+    convert.add_argument('--from', dest='src_format', required=True, choices=('yolo', 'coco', 'voc', 'store'))
+    convert.add_argument('--to', dest='dst_format', required=True, choices=('yolo', 'coco', 'voc', 'store'))
+    convert.add_argument('--classes', help="Class names: a file with one name per line or a comma-separated list "
+                                           "(default: classes.txt of a YOLO source).")
+    convert.add_argument('--images', help="Image directory used to read sizes for a YOLO source.")
+    convert.add_argument('--size-cache', metavar='FILE',
+                         help="Persistent image size cache file, reused across runs (default: none).")
+    convert.add_argument('--image-ext', default='.jpg', help="Image extension for YOLO sources.")
+    convert.add_argument('--validation', default='strict', choices=('strict', 'clip', 'trusted'))
+    convert.set_defaults(func=run_convert)
+
+    detect = commands.add_parser('detect-hands', parents=[shared],
+                                 help="Detect hand landmarks in image directories or video files.")
+    detect.add_argument('inputs', nargs='+', help="Image directories, image files or video files.")
+    detect.add_argument('--output', '-o', required=True, help="Output directory; one subdirectory per input.")
+    detect.add_argument('--format', default='npz', choices=('npz', 'json'))
+    detect.add_argument('--max-frames', type=int, help="Stop each video after this many frames.")
+    detect.add_argument('--max-hands', type=int, default=2)
+    detect.add_argument('--model-complexity', type=int, default=1, choices=(0, 1))
+    detect.add_argument('--detection-conf', type=float, default=0.5)
+    detect.set_defaults(func=run_detect_hands)
+
+    bench = commands.add_parser('bench', help="Run benchmarks on synthetic data.")
+    build_bench_parser(bench)
+    bench.set_defaults(func=run_bench)
+    return parser
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    `pyprocess` komut satırı girişi.
+
+    Returns:
+        int: Çıkış kodu; hata durumunda 2, benchmark gerilemesinde 1.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'convert' and args.src_format == 'yolo' and args.images is None:
+        parser.error("convert --from yolo needs --images to read image sizes.")
+    if args.metrics:
+        from pyprocess.utils import metrics
+        metrics.enable()
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as error:
+        _log(f"pyprocess: error: {error}")
+        return 2
+    except KeyboardInterrupt:
+        _log("pyprocess: interrupted; rerun with --resume to continue.")
+        return 130
+    finally:
+        if args.metrics:
+            metrics.write_prometheus(args.metrics)
 
 if __name__ == '__main__':
-    if sys.argv[1]:
-        main()
\ No newline at end of file
+    sys.exit(main())
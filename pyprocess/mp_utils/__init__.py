@@ -1,3 +1,37 @@
-from pyprocess.mp_utils.hand_detector import HandDetector
+import importlib
 
-__all__ = ['HandDetector']
\ No newline at end of file
+# Sınıflar ilk erişimde yüklenir; MediaPipe yalnızca HandDetector gerçekten kullanıldığında içe aktarılır.
+_LAZY_ATTRS = {
+	'AsyncHandDetector': 'pyprocess.mp_utils.async_detector',
+	'HandDetector': 'pyprocess.mp_utils.hand_detector',
+	'results_to_arrays': 'pyprocess.mp_utils.hand_detector',
+	'DropOldestQueue': 'pyprocess.mp_utils.pipeline',
+	'HandPipeline': 'pyprocess.mp_utils.pipeline',
+	'PipelineResult': 'pyprocess.mp_utils.pipeline',
+	'ResultCache': 'pyprocess.mp_utils.result_cache',
+	'frame_key': 'pyprocess.mp_utils.result_cache',
+	'HandDetectorPool': 'pyprocess.mp_utils.pool',
+	'HandResult': 'pyprocess.mp_utils.pool',
+	'StreamResult': 'pyprocess.mp_utils.scheduler',
+	'StreamScheduler': 'pyprocess.mp_utils.scheduler',
+	'ROITracker': 'pyprocess.mp_utils.roi_tracker',
+	'TrackResult': 'pyprocess.mp_utils.roi_tracker',
+	'OneEuroFilter': 'pyprocess.mp_utils.temporal',
+	'TemporalHandDetector': 'pyprocess.mp_utils.temporal',
+	'TemporalResult': 'pyprocess.mp_utils.temporal',
+}
+
+__all__ = ['HandDetector', 'HandPipeline', 'PipelineResult', 'DropOldestQueue', 'HandDetectorPool', 'HandResult',
+           'results_to_arrays', 'ROITracker', 'TrackResult', 'TemporalHandDetector', 'TemporalResult', 'OneEuroFilter',
+           'StreamScheduler', 'StreamResult', 'AsyncHandDetector',
+           'ResultCache', 'frame_key']
+
+def __getattr__(name):
+	if name in _LAZY_ATTRS:
+		value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+		globals()[name] = value
+		return value
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+	return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,154 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
+
+def _find_hands(detector, img: np.ndarray, draw: bool) -> Tuple[np.ndarray, List[Dict]]:
+	return detector.find_hands(img, draw=draw)
+
+def _arrays(detector, img: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+	detector.process(img, copy=False)
+	return detector.arrays()
+
+async def _iter_frames(source: Any) -> AsyncIterator[np.ndarray]:
+	# Asenkron yineleyiciler, `read()` sağlayan yakalayıcılar (okuma ayrı iş parçacığında) ve düz yineleyiciler.
+	if hasattr(source, '__aiter__'):
+		async for frame in source:
+			yield frame
+	elif hasattr(source, 'read'):
+		while True:
+			ok, frame = await asyncio.to_thread(source.read)
+			if not ok:
+				return
+			yield frame
+	else:
+		for frame in source:
+			yield frame
+
+class AsyncHandDetector:
+	"""
+	`HandDetector` için asyncio arayüzü.
+
+	Çıkarım, algılayıcı sayısı kadar iş parçacığı olan sınırlı bir havuzda
+	çalışır; olay döngüsü bloklanmaz. Her algılayıcı aynı anda yalnızca bir
+	kareyi işler ve boştaki algılayıcı yoksa çağıranlar bekler (geri basınç).
+	Bekleyen bir çağrı iptal edildiğinde kare hiç işlenmez; çalışmakta olan
+	çıkarım ise tamamlanır ve algılayıcı ancak o zaman havuza döner.
+
+	Kullanım:
+		async with AsyncHandDetector(workers=2) as detector:
+			img, hands = await detector.afind_hands(frame)
+			async for img, hands in detector.stream(capture):
+				...
+	"""
+	def __init__(self, detectors: Optional[List[Any]] = None, workers: int = 1, **detector_kwargs):
+		"""
+		Args:
+			detectors (list, optional): `find_hands`, `process(img, copy=False)` ve `arrays()` sağlayan
+				algılayıcılar. Verilmezse `workers` adet `HandDetector` oluşturulur.
+			workers (int): Oluşturulacak algılayıcı (ve iş parçacığı) sayısı.
+			**detector_kwargs: `HandDetector` argümanları; varsayılan olarak `mode=True` (algılayıcılar
+				farklı istemcilerin karelerini sırayla işlediği için takip yerine her karede algılama).
+		"""
+		if detectors is None:
+			from pyprocess.mp_utils.hand_detector import HandDetector
+			detector_kwargs.setdefault('mode', True)
+			detectors = [HandDetector(**detector_kwargs) for _ in range(max(1, workers))]
+		if not detectors:
+			raise ValueError("At least one detector is required.")
+		self.detectors = detectors
+		self.executor = ThreadPoolExecutor(max_workers=len(detectors), thread_name_prefix='hand-detector')
+		self.idle: Optional[asyncio.Queue] = None
+		self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+	async def __aenter__(self) -> 'AsyncHandDetector':
+		return self
+
+	async def __aexit__(self, exc_type, exc, tb) -> None:
+		await asyncio.to_thread(self.close)
+
+	def close(self) -> None:
+		self.executor.shutdown(wait=True, cancel_futures=True)
+
+	def _idle(self) -> asyncio.Queue:
+		# asyncio.Queue ilk kullanıldığı döngüye bağlanır; döngü değişirse havuz yeniden kurulur.
+		loop = asyncio.get_running_loop()
+		if self.loop is not loop:
+			self.loop = loop
+			self.idle = asyncio.Queue()
+			for detector in self.detectors:
+				self.idle.put_nowait(detector)
+		return self.idle
+
+	def _release(self, idle: asyncio.Queue, loop: asyncio.AbstractEventLoop, detector) -> None:
+		# İşçi iş parçacığından çağrılır.
+		try:
+			loop.call_soon_threadsafe(idle.put_nowait, detector)
+		except RuntimeError:
+			pass  # Döngü kapanmış.
+
+	async def _run(self, func, *args):
+		idle, loop = self._idle(), self.loop
+		detector = await idle.get()
+		try:
+			future = self.executor.submit(func, detector, *args)
+		except BaseException:
+			idle.put_nowait(detector)
+			raise
+		# Algılayıcı, asyncio tarafı iptal edilse bile iş parçacığı gerçekten bitince geri verilir.
+		future.add_done_callback(lambda _: self._release(idle, loop, detector))
+		return await asyncio.wrap_future(future)
+
+	async def afind_hands(self, img: np.ndarray, draw: bool = True) -> Tuple[np.ndarray, List[Dict]]:
+		"""
+		`HandDetector.find_hands`'in olay döngüsünü bloklamayan karşılığı.
+
+		Args:
+			img (np.ndarray): BGR görüntü.
+			draw (bool): Landmark'ların görüntünün bir kopyasına çizilip çizilmeyeceği.
+
+		Returns:
+			tuple: (görüntü, eller) `find_hands` ile aynı biçimde.
+		"""
+		return await self._run(_find_hands, img, draw)
+
+	async def aprocess(self, img: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+		"""
+		Kareyi işler ve kompakt dizileri döndürür.
+
+		Returns:
+			tuple: `HandDetector.arrays()` ile aynı (landmarks, handedness, scores).
+		"""
+		return await self._run(_arrays, img)
+
+	async def stream(self, source: Any, draw: bool = False,
+					 concurrency: Optional[int] = None) -> AsyncIterator[Tuple[np.ndarray, List[Dict]]]:
+		"""
+		Bir kare kaynağı üzerinde sırayı koruyarak `afind_hands` sonuçları üretir.
+
+		En fazla `concurrency` kare aynı anda işlenir; bu sınıra ulaşıldığında
+		kaynaktan yeni kare okunmaz. Yineleme erken bırakılırsa veya iptal
+		edilirse bekleyen kareler iptal edilir.
+
+		Args:
+			source: Asenkron yineleyici, `read()` -> (ok, frame) sağlayan yakalayıcı veya kare yineleyicisi.
+			draw (bool): Landmark'ların çizilip çizilmeyeceği.
+			concurrency (int, optional): Aynı anda işlenen kare sayısı; varsayılan algılayıcı sayısı.
+
+		Yields:
+			tuple: Her kare için girdi sırasıyla (görüntü, eller).
+		"""
+		concurrency = concurrency or len(self.detectors)
+		pending = deque()
+		try:
+			async for img in _iter_frames(source):
+				pending.append(asyncio.ensure_future(self.afind_hands(img, draw)))
+				if len(pending) >= concurrency:
+					yield await pending.popleft()
+			while pending:
+				yield await pending.popleft()
+		finally:
+			for task in pending:
+				task.cancel()
@@ -1,10 +1,75 @@
 import cv2
 import numpy as np
 import mediapipe as mp
-from typing import List, Tuple, Optional, Dict
+from mediapipe.framework.formats import classification_pb2, landmark_pb2
+from typing import List, NamedTuple, Tuple, Optional, Dict
+
+from pyprocess.mp_utils.result_cache import ResultCache, frame_key
+from pyprocess.shapes.overlay import text_size
+from pyprocess.utils import metrics
+
+NUM_LANDMARKS = 21
+HANDEDNESS_LABELS = ('Left', 'Right')
+FINGERTIP_IDS = (4, 8, 12, 16, 20)
+
+def results_to_arrays(results) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+	"""
+	MediaPipe sonuçlarını kompakt NumPy dizilerine çevirir.
+
+	Returns:
+		tuple: (hands, 21, 3) float32 normalize landmark'lar, (hands,) int8 el tarafı
+		(0 = Left, 1 = Right) ve (hands,) float32 skorlar.
+	"""
+	if results is None or not results.multi_hand_landmarks:
+		return (np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32),
+				np.empty(0, dtype=np.int8), np.empty(0, dtype=np.float32))
+	landmarks = np.array([[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in results.multi_hand_landmarks],
+						 dtype=np.float32)
+	classes = [info.classification[0] for info in results.multi_handedness]
+	handedness = np.array([HANDEDNESS_LABELS.index(c.label) for c in classes], dtype=np.int8)
+	scores = np.array([c.score for c in classes], dtype=np.float32)
+	return landmarks, handedness, scores
+
+class CachedResults(NamedTuple):
+	"""
+	Önbellekten gelen sonuçların MediaPipe sonuçlarıyla aynı alanlara sahip karşılığı.
+	"""
+	multi_hand_landmarks: Optional[List[landmark_pb2.NormalizedLandmarkList]]
+	multi_handedness: Optional[List[classification_pb2.ClassificationList]]
+
+def arrays_to_results(landmarks: np.ndarray, handedness: np.ndarray, scores: np.ndarray) -> CachedResults:
+	"""
+	`results_to_arrays` çıktısını çizim ve `find_hands` için MediaPipe protobuf'larına geri çevirir.
+	"""
+	if not len(landmarks):
+		return CachedResults(None, None)
+	hands = [landmark_pb2.NormalizedLandmarkList(
+				landmark=[landmark_pb2.NormalizedLandmark(x=x, y=y, z=z) for x, y, z in hand.tolist()])
+			 for hand in landmarks]
+	infos = [classification_pb2.ClassificationList(
+				classification=[classification_pb2.Classification(index=side, score=score,
+																  label=HANDEDNESS_LABELS[side])])
+			 for side, score in zip(handedness.tolist(), scores.tolist())]
+	return CachedResults(hands, infos)
 
 class HandDetector:
-	def __init__(self, mode: bool = False, max_hands: int = 2, model_complexity: int = 1, detection_conf: float = 0.5, track_conf: float = 0.5):
+	def __init__(self, mode: bool = False, max_hands: int = 2, model_complexity: int = 1, detection_conf: float = 0.5, track_conf: float = 0.5,
+				 cache: Optional[ResultCache] = None):
+		"""
+		Args:
+			mode (bool): True ise her kare bağımsız işlenir (static_image_mode).
+			max_hands (int): En fazla el sayısı.
+			model_complexity (int): MediaPipe model karmaşıklığı (0 veya 1).
+			detection_conf (float): En düşük algılama güveni.
+			track_conf (float): En düşük takip güveni.
+			cache (ResultCache, optional): Aynı görüntülerin yeniden işlenmesini önleyen sonuç önbelleği.
+				Takip modunda sonuç önceki karelere bağlı olduğundan yalnızca mode=True ile kullanılabilir.
+
+		Raises:
+			ValueError: Eğer cache mode=False ile verilirse.
+		"""
+		if cache is not None and not mode:
+			raise ValueError("Result cache requires static image mode (mode=True).")
 		self.mode = mode
 		self.max_hands = max_hands
 		self.detection_conf = detection_conf
@@ -21,26 +86,87 @@ class HandDetector:
 		)
 		self.mp_draw = mp.solutions.drawing_utils
 		self.results = None
+		# Çözünürlük başına yeniden kullanılan BGR->RGB dönüşüm tamponları.
+		self._rgb_buffers: Dict[Tuple[int, ...], np.ndarray] = {}
+		# results_to_arrays çıktısı; her kare için bir kez hesaplanır.
+		self._arrays_source = None
+		self._arrays = results_to_arrays(None)
+		self.cache = cache
+		self._cache_params = (max_hands, model_complexity, detection_conf, track_conf, mp.__version__)
 
-	def retrieve(self, img: np.ndarray) -> Tuple[Optional[mp.solutions.hands.HandLandmark], np.ndarray]:
-		curr_img = self.process(img)
+	def retrieve(self, img: np.ndarray, rgb: bool = False) -> Tuple[Optional[mp.solutions.hands.HandLandmark], np.ndarray]:
+		curr_img = self.process(img, rgb=rgb)
 		return self.results, curr_img
 
-	def process(self, img: np.ndarray) -> mp.solutions.hands.HandLandmark:
-		img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-		self.results = self.hands.process(img_rgb)
-		img_bgr = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2BGR)
-		return img_bgr
+	def _to_rgb(self, img: np.ndarray) -> np.ndarray:
+		buffer = self._rgb_buffers.get(img.shape)
+		if buffer is None:
+			if len(self._rgb_buffers) >= 4:
+				self._rgb_buffers.clear()
+			buffer = self._rgb_buffers[img.shape] = np.empty(img.shape, dtype=img.dtype)
+		return cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=buffer)
 
-	def find_hands(self, img: np.ndarray, draw: bool = True) -> Tuple[np.ndarray, List[Dict]]:
-		img = self.process(img)
+	def process(self, img: np.ndarray, rgb: bool = False, copy: bool = True) -> np.ndarray:
+		"""
+		Kare üzerinde el algılamayı çalıştırır ve sonucu `self.results`'a yazar.
+
+		Args:
+			img (np.ndarray): BGR (veya rgb=True ise RGB) görüntü.
+			rgb (bool): Girdi zaten RGB ise True; renk dönüşümü yapılmaz.
+			copy (bool): True ise girdinin bir kopyası, False ise girdinin kendisi döndürülür.
+
+		Returns:
+			np.ndarray: Girdiyle aynı renk düzenindeki görüntü.
+		"""
+		key = None
+		if self.cache is not None:
+			key = frame_key(img, self._cache_params + (rgb,))
+			arrays = self.cache.get(key)
+			if arrays is not None:
+				self.results = arrays_to_results(*arrays)
+				self._arrays, self._arrays_source = arrays, self.results
+				if metrics.ENABLED:
+					metrics.count('hand_detector.frames')
+					metrics.count('hand_detector.cache_hits')
+					metrics.count('hand_detector.hands', len(arrays[0]))
+				return img.copy() if copy else img
+		# BGR girdi çözünürlük başına bir kez ayrılan tampona dönüştürülür; ikinci (RGB->BGR)
+		# dönüşüm yapılmaz, çünkü sonuç girdinin kendisiyle aynıdır.
+		frame = img
+		if not rgb:
+			with metrics.timer('hand_detector.color'):
+				frame = self._to_rgb(img)
+		with metrics.timer('hand_detector.inference'):
+			self.results = self.hands.process(frame)
+		if metrics.ENABLED:
+			metrics.count('hand_detector.frames')
+			metrics.count('hand_detector.hands', len(self.results.multi_hand_landmarks or ()))
+		if key is not None:
+			self.cache.put(key, self.arrays())
+		return img.copy() if copy else img
+
+	def find_hands(self, img: np.ndarray, draw: bool = True, rgb: bool = False,
+				   inplace: bool = False) -> Tuple[np.ndarray, List[Dict]]:
+		"""
+		Args:
+			img (np.ndarray): BGR (veya rgb=True ise RGB) görüntü.
+			draw (bool): Landmark'ların çizilip çizilmeyeceği.
+			rgb (bool): Girdi zaten RGB ise True.
+			inplace (bool): True ise çizim doğrudan img üzerine yapılır ve kopya oluşturulmaz.
+
+		Returns:
+			tuple: (görüntü, eller). draw=False veya inplace=True ise görüntü girdinin kendisidir.
+		"""
+		img = self.process(img, rgb=rgb, copy=draw and not inplace)
 		
 		all_hands = []
 		if self.results.multi_hand_landmarks:
+			if draw:
+				with metrics.timer('hand_detector.draw'):
+					for hand_landmarks in self.results.multi_hand_landmarks:
+						self.mp_draw.draw_landmarks(img, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+
 			for hand_landmarks, hand_info in zip(self.results.multi_hand_landmarks, self.results.multi_handedness):
-				if draw:
-					self.mp_draw.draw_landmarks(img, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-				
 				hand_info_dict = {
 					'landmarks': hand_landmarks,
 					'label': hand_info.classification[0].label,
@@ -50,33 +176,96 @@ class HandDetector:
 		
 		return img, all_hands
 	
+	def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+		"""
+		Son karenin landmark, el tarafı ve skor dizileri.
+
+		Diziler her kare için yalnızca bir kez çıkarılır ve sonraki çağrılarda
+		önbellekten döner.
+
+		Returns:
+			tuple: (hands, 21, 3) float32 normalize landmark'lar, (hands,) int8 el tarafı
+			(0 = Left, 1 = Right) ve (hands,) float32 skorlar.
+		"""
+		if self._arrays_source is not self.results:
+			with metrics.timer('hand_detector.landmarks'):
+				self._arrays = results_to_arrays(self.results)
+			self._arrays_source = self.results
+		return self._arrays
+
+	@property
+	def landmarks(self) -> np.ndarray:
+		return self.arrays()[0]
+
+	@property
+	def handedness(self) -> np.ndarray:
+		return self.arrays()[1]
+
+	@property
+	def scores(self) -> np.ndarray:
+		return self.arrays()[2]
+
+	def pixel_landmarks(self, img: np.ndarray) -> np.ndarray:
+		"""
+		Tüm ellerin landmark'larını piksel koordinatlarına çevirir.
+
+		Returns:
+			np.ndarray: (hands, 21, 2) int32 [x, y] koordinatları.
+		"""
+		h, w = img.shape[:2]
+		# float64'te çarpılır ki int(lm.x * w) ile birebir aynı sonuç elde edilsin.
+		return (self.landmarks[..., :2].astype(np.float64) * (w, h)).astype(np.int32)
+
 	def find_positions(self, img: np.ndarray, hand_no: int = 0, draw: bool = True) -> List[List[int]]:
-		lm_list = []
-		if self.results.multi_hand_landmarks and hand_no < len(self.results.multi_hand_landmarks):
-			my_hand = self.results.multi_hand_landmarks[hand_no]
-			for id, lm in enumerate(my_hand.landmark):
-				h, w, _ = img.shape
-				cx, cy = int(lm.x * w), int(lm.y * h)
-				lm_list.append([id, cx, cy])
-				if draw:
+		landmarks = self.landmarks
+		if hand_no >= len(landmarks):
+			return []
+		points = self.pixel_landmarks(img)[hand_no]
+		if draw:
+			with metrics.timer('hand_detector.draw'):
+				for cx, cy in points.tolist():
 					cv2.circle(img, (cx, cy), 5, (255, 0, 255), cv2.FILLED)
-		return lm_list
+		return np.column_stack([np.arange(NUM_LANDMARKS), points]).tolist()
+
+	def bounding_boxes(self, img: np.ndarray, margin: int = 10) -> np.ndarray:
+		"""
+		Tüm ellerin sınırlayıcı kutularını tek seferde hesaplar.
+
+		Returns:
+			np.ndarray: (hands, 4) int32 [x, y, width, height] kutuları.
+		"""
+		landmarks = self.landmarks
+		if not len(landmarks):
+			return np.empty((0, 4), dtype=np.int32)
+		h, w = img.shape[:2]
+		scale = np.array([w, h], dtype=np.float64)
+		top_left = (landmarks[..., :2].min(axis=1).astype(np.float64) * scale).astype(np.int32) - margin
+		bottom_right = (landmarks[..., :2].max(axis=1).astype(np.float64) * scale).astype(np.int32) + margin
+		return np.hstack([top_left, bottom_right - top_left])
 
 	def get_bounding_box(self, img: np.ndarray, hand_no: int = 0, margin=10) -> Optional[Tuple[int, int, int, int]]:
-		if self.results.multi_hand_landmarks and hand_no < len(self.results.multi_hand_landmarks):
-			my_hand = self.results.multi_hand_landmarks[hand_no]
-			x_coordinates = [lm.x for lm in my_hand.landmark]
-			y_coordinates = [lm.y for lm in my_hand.landmark]
-			
-			x_min, x_max = min(x_coordinates), max(x_coordinates)
-			y_min, y_max = min(y_coordinates), max(y_coordinates)
-			
-			h, w, _ = img.shape
-			x_min, y_min = int(x_min * w) - margin, int(y_min * h) - margin
-			x_max, y_max = int(x_max * w) + margin, int(y_max * h) + margin
-			
-			return (x_min, y_min, x_max - x_min, y_max - y_min)
-		return None
+		boxes = self.bounding_boxes(img, margin)
+		if hand_no >= len(boxes):
+			return None
+		return tuple(boxes[hand_no].tolist())
+
+	def fingertip_distances(self, img: Optional[np.ndarray] = None) -> np.ndarray:
+		"""
+		Her el için parmak uçları arasındaki ikili mesafeleri hesaplar.
+
+		Args:
+			img (np.ndarray, optional): Verilirse mesafeler piksel cinsinden, verilmezse
+				normalize koordinatlarda hesaplanır.
+
+		Returns:
+			np.ndarray: (hands, 5, 5) float32 mesafe matrisleri (başparmak, işaret, orta, yüzük, serçe).
+		"""
+		tips = self.landmarks[:, FINGERTIP_IDS, :2]
+		if img is not None:
+			h, w = img.shape[:2]
+			tips = tips * np.array([w, h], dtype=np.float32)
+		diff = tips[:, :, None, :] - tips[:, None, :, :]
+		return np.sqrt((diff ** 2).sum(axis=-1))
 
 	def draw_bounding_box(self, 
                       img: np.ndarray, 
@@ -89,35 +278,36 @@ class HandDetector:
                       font_thickness: int = 1,
                       text_position: str = 'left',
                       padding: int = 0) -> np.ndarray:
-		x, y, w, h = bbox
-		img = cv2.rectangle(img, (x, y), (x+w, y+h), color, thickness)
+		with metrics.timer('hand_detector.draw'):
+			x, y, w, h = bbox
+			img = cv2.rectangle(img, (x, y), (x+w, y+h), color, thickness)
 		
-		if text:
-			text_size, _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, font_thickness)
+			if text:
+				(text_w, text_h), _ = text_size(text, font_scale, font_thickness)
 			
 			
 			
-			if text_position.lower() == 'left':
-				text_x = x
-			elif text_position.lower() == 'right':
-				text_x = x + w - text_size[0] - 2 * padding
-			elif text_position.lower() == 'center':
-				text_x = x + (w - text_size[0] - 2 * padding) // 2
-			else:  # Default to left if invalid position is given
-				text_x = x
+				if text_position.lower() == 'left':
+					text_x = x
+				elif text_position.lower() == 'right':
+					text_x = x + w - text_w - 2 * padding
+				elif text_position.lower() == 'center':
+					text_x = x + (w - text_w - 2 * padding) // 2
+				else:  # Default to left if invalid position is given
+					text_x = x
 			
-			text_y = y
+				text_y = y
 			
-			# Arka plan dikdörtgeni çiz (padding ile)
-			bg_rect = (text_x, text_y - text_size[1] - padding, 
-					   text_size[0] + 2*padding, text_size[1] + 2*padding)
-			cv2.rectangle(img, (bg_rect[0], bg_rect[1]), 
-						  (bg_rect[0] + bg_rect[2], bg_rect[1] + bg_rect[3]), 
-						  color, cv2.FILLED)
+				# Arka plan dikdörtgeni çiz (padding ile)
+				bg_rect = (text_x, text_y - text_h - padding, 
+						   text_w + 2*padding, text_h + 2*padding)
+				cv2.rectangle(img, (bg_rect[0], bg_rect[1]), 
+							  (bg_rect[0] + bg_rect[2], bg_rect[1] + bg_rect[3]), 
+							  color, cv2.FILLED)
 			
-			# Metni yaz (padding ile)
-			cv2.putText(img, text, (text_x + padding, text_y + padding), cv2.FONT_HERSHEY_SIMPLEX, 
-						font_scale, text_color, font_thickness, cv2.LINE_AA)
+				# Metni yaz (padding ile)
+				cv2.putText(img, text, (text_x + padding, text_y + padding), cv2.FONT_HERSHEY_SIMPLEX, 
+							font_scale, text_color, font_thickness, cv2.LINE_AA)
 		
 		return img
 
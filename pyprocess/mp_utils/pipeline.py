@@ -0,0 +1,309 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import cv2
+import numpy as np
+
+class Frame(NamedTuple):
+	"""
+	Boru hattında taşınan kare.
+
+	Attributes:
+		index (int): Kaynaktan okunma sırası.
+		captured (float): Okunma zamanı (`time.perf_counter`).
+		image (np.ndarray): BGR görüntü.
+	"""
+	index: int
+	captured: float
+	image: np.ndarray
+
+class PipelineResult(NamedTuple):
+	"""
+	Çıkarım aşamasının tek bir kare için sonucu.
+
+	Attributes:
+		frame (Frame): İşlenen kare.
+		image (np.ndarray): Çizim yapılmış (draw=True ise) görüntü.
+		hands (list): `HandDetector.find_hands` tarafından döndürülen eller.
+	"""
+	frame: Frame
+	image: np.ndarray
+	hands: List[Dict]
+
+class DropOldestQueue:
+	"""
+	Sınırlı kapasiteli, dolduğunda en eski öğeyi atan iş parçacığı güvenli kuyruk.
+
+	Gerçek zamanlı akışta eski bir kareyi beklemek yerine en yenisini işlemek
+	tercih edilir; atılan öğeler `dropped` sayacında tutulur.
+	"""
+	def __init__(self, maxsize: int = 2):
+		if maxsize < 1:
+			raise ValueError("maxsize must be at least 1.")
+		self.items = deque(maxlen=maxsize)
+		self.dropped = 0
+		self.closed = False
+		self.cond = threading.Condition()
+
+	def __len__(self) -> int:
+		return len(self.items)
+
+	def put(self, item) -> None:
+		with self.cond:
+			if len(self.items) == self.items.maxlen:
+				self.dropped += 1
+			self.items.append(item)
+			self.cond.notify()
+
+	def get(self, timeout: Optional[float] = None):
+		# Kuyruk kapatılmış ve boşsa None döner.
+		with self.cond:
+			if not self.cond.wait_for(lambda: self.items or self.closed, timeout):
+				return None
+			return self.items.popleft() if self.items else None
+
+	def close(self) -> None:
+		with self.cond:
+			self.closed = True
+			self.cond.notify_all()
+
+class StageStats:
+	"""
+	Bir aşamanın gecikme istatistikleri (milisaniye).
+	"""
+	def __init__(self, name: str, window: int = 120):
+		self.name = name
+		self.count = 0
+		self.total = 0.0
+		self.last = 0.0
+		self.max = 0.0
+		self.recent = deque(maxlen=window)
+		self.lock = threading.Lock()
+
+	def add(self, seconds: float) -> None:
+		ms = seconds * 1000.0
+		with self.lock:
+			self.count += 1
+			self.total += ms
+			self.last = ms
+			self.max = max(self.max, ms)
+			self.recent.append(ms)
+
+	@property
+	def mean_ms(self) -> float:
+		return self.total / self.count if self.count else 0.0
+
+	@property
+	def recent_ms(self) -> float:
+		with self.lock:
+			return sum(self.recent) / len(self.recent) if self.recent else 0.0
+
+	def as_dict(self) -> Dict[str, float]:
+		return {
+			'count': self.count,
+			'mean_ms': self.mean_ms,
+			'recent_ms': self.recent_ms,
+			'last_ms': self.last,
+			'max_ms': self.max,
+		}
+
+def open_source(source: Any):
+	"""
+	Bir kare kaynağını açar.
+
+	Args:
+		source: Kamera numarası, video yolu/URL'si veya `read()` -> (ok, frame) sağlayan bir nesne.
+
+	Returns:
+		`read()` sağlayan nesne; nesne verildiyse kendisi.
+
+	Raises:
+		IOError: Eğer kaynak açılamazsa.
+	"""
+	if hasattr(source, 'read'):
+		return source
+	capture = cv2.VideoCapture(source)
+	if not capture.isOpened():
+		raise IOError(f"Could not open video source: {source}")
+	return capture
+
+class HandPipeline:
+	"""
+	`HandDetector` etrafında çok iş parçacıklı yakalama -> çıkarım -> tüketici boru hattı.
+
+	Kamera okuma, el algılama ve sonuç işleme ayrı iş parçacıklarında çalışır;
+	aşamalar arasındaki kuyruklar sınırlıdır ve dolduklarında en eski kareyi
+	atar. Böylece yavaş bir aşama gecikmeyi biriktirmez, her zaman en güncel
+	kare işlenir.
+
+	Kullanım:
+		with HandPipeline(0, on_result=callback) as pipeline:
+			pipeline.wait()
+	"""
+	def __init__(self, source: Any = 0, detector=None, on_result: Optional[Callable[[PipelineResult], None]] = None,
+	             draw: bool = True, queue_size: int = 2, max_frames: Optional[int] = None):
+		"""
+		Args:
+			source: Kamera numarası, video yolu/URL'si veya `read()` -> (ok, frame) sağlayan bir nesne.
+			detector: `find_hands(img, draw)` sağlayan algılayıcı; verilmezse `HandDetector()` oluşturulur.
+			on_result (callable, optional): Her sonuç için tüketici iş parçacığında çağrılır. Verilmezse
+				sonuçlar `read()` ile alınır.
+			draw (bool): Landmark'ların görüntüye çizilip çizilmeyeceği.
+			queue_size (int): Aşamalar arası kuyruk kapasitesi.
+			max_frames (int, optional): Okunacak en fazla kare sayısı.
+		"""
+		if detector is None:
+			from pyprocess.mp_utils.hand_detector import HandDetector
+			detector = HandDetector()
+		self.detector = detector
+		self.on_result = on_result
+		self.draw = draw
+		self.max_frames = max_frames
+		self.source = source
+		self.capture = None
+		self.frames = DropOldestQueue(queue_size)
+		self.results = DropOldestQueue(queue_size)
+		self.stats = {name: StageStats(name) for name in ('capture', 'inference', 'consumer', 'end_to_end')}
+		self.error: Optional[BaseException] = None
+		self.stop_event = threading.Event()
+		self.threads: List[threading.Thread] = []
+		self.started = 0.0
+		self.processed = 0
+
+	def __enter__(self) -> 'HandPipeline':
+		return self.start()
+
+	def __exit__(self, exc_type, exc, tb) -> None:
+		self.stop()
+
+	def start(self) -> 'HandPipeline':
+		self.capture = open_source(self.source)
+		self.started = time.perf_counter()
+		stages = [self._capture_loop, self._inference_loop]
+		if self.on_result is not None:
+			stages.append(self._consumer_loop)
+		self.threads = [threading.Thread(target=self._guard, args=(stage,), daemon=True) for stage in stages]
+		for thread in self.threads:
+			thread.start()
+		return self
+
+	def _guard(self, stage: Callable[[], None]) -> None:
+		# Bir aşamadaki hata tüm boru hattını durdurur ve wait/read sırasında yeniden fırlatılır.
+		try:
+			stage()
+		except BaseException as error:
+			self.error = error
+			self.stop_event.set()
+			self.frames.close()
+			self.results.close()
+
+	def _capture_loop(self) -> None:
+		index = 0
+		try:
+			while not self.stop_event.is_set():
+				if self.max_frames is not None and index >= self.max_frames:
+					break
+				start = time.perf_counter()
+				ok, image = self.capture.read()
+				if not ok:
+					break
+				now = time.perf_counter()
+				self.stats['capture'].add(now - start)
+				self.frames.put(Frame(index, now, image))
+				index += 1
+		finally:
+			self.frames.close()
+
+	def _inference_loop(self) -> None:
+		try:
+			while True:
+				frame = self.frames.get()
+				if frame is None:
+					break
+				start = time.perf_counter()
+				image, hands = self.detector.find_hands(frame.image, draw=self.draw)
+				self.stats['inference'].add(time.perf_counter() - start)
+				self.results.put(PipelineResult(frame, image, hands))
+		finally:
+			self.results.close()
+
+	def _consumer_loop(self) -> None:
+		while True:
+			result = self.results.get()
+			if result is None:
+				break
+			self._consume(result)
+
+	def _consume(self, result: PipelineResult) -> None:
+		start = time.perf_counter()
+		if self.on_result is not None:
+			self.on_result(result)
+		end = time.perf_counter()
+		self.stats['consumer'].add(end - start)
+		self.stats['end_to_end'].add(end - result.frame.captured)
+		self.processed += 1
+
+	def read(self, timeout: Optional[float] = None) -> Optional[PipelineResult]:
+		"""
+		`on_result` verilmediğinde bir sonraki sonucu döndürür.
+
+		Returns:
+			PipelineResult or None: Akış bittiğinde veya zaman aşımında None.
+		"""
+		result = self.results.get(timeout)
+		self._raise_error()
+		if result is not None:
+			self.stats['end_to_end'].add(time.perf_counter() - result.frame.captured)
+			self.processed += 1
+		return result
+
+	def __iter__(self):
+		while True:
+			result = self.read()
+			if result is None:
+				return
+			yield result
+
+	def wait(self, timeout: Optional[float] = None) -> None:
+		# Kaynak bitene (veya stop çağrılana) kadar bekler.
+		deadline = None if timeout is None else time.perf_counter() + timeout
+		for thread in self.threads:
+			thread.join(None if deadline is None else max(0.0, deadline - time.perf_counter()))
+		self._raise_error()
+
+	def stop(self) -> None:
+		self.stop_event.set()
+		self.frames.close()
+		for thread in self.threads:
+			if thread is not threading.current_thread():
+				thread.join(timeout=5)
+		self.results.close()
+		if self.capture is not None and self.capture is not self.source and hasattr(self.capture, 'release'):
+			self.capture.release()
+		self.capture = None
+
+	def _raise_error(self) -> None:
+		if self.error is not None:
+			error, self.error = self.error, None
+			raise error
+
+	@property
+	def fps(self) -> float:
+		elapsed = time.perf_counter() - self.started if self.started else 0.0
+		return self.processed / elapsed if elapsed > 0 else 0.0
+
+	def report(self) -> Dict[str, Any]:
+		"""
+		Aşama başına gecikme, atılan kare sayıları ve verim.
+
+		Returns:
+			dict: 'capture', 'inference', 'consumer', 'end_to_end' istatistikleri,
+			'dropped' (kuyruk başına) ve 'fps'.
+		"""
+		report: Dict[str, Any] = {name: stats.as_dict() for name, stats in self.stats.items()}
+		report['dropped'] = {'frames': self.frames.dropped, 'results': self.results.dropped}
+		report['processed'] = self.processed
+		report['fps'] = self.fps
+		return report
@@ -0,0 +1,176 @@
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+import cv2
+import numpy as np
+
+class HandResult(NamedTuple):
+	"""
+	Tek bir kare için kompakt el algılama sonucu.
+
+	Attributes:
+		landmarks (np.ndarray): (hands, 21, 3) float32 normalize landmark'lar.
+		handedness (np.ndarray): (hands,) int8; 0 = Left, 1 = Right.
+		scores (np.ndarray): (hands,) float32 el tarafı skorları.
+		size (tuple): Karenin (width, height) boyutu; dosya okunamadıysa (0, 0).
+	"""
+	landmarks: np.ndarray
+	handedness: np.ndarray
+	scores: np.ndarray
+	size: tuple
+
+# Her işçi sürecinde bir kez oluşturulan algılayıcı; MediaPipe grafiği işler arasında yeniden kullanılır.
+_DETECTOR = None
+
+def _init_worker(detector_kwargs: Dict[str, Any]) -> None:
+	global _DETECTOR
+	# İşçi başına tek çekirdek: OpenCV'nin kendi iş parçacıkları süreçlerle yarışmasın.
+	cv2.setNumThreads(1)
+	from pyprocess.mp_utils.hand_detector import HandDetector
+	_DETECTOR = HandDetector(**detector_kwargs)
+
+def _detect(img: Optional[np.ndarray]) -> HandResult:
+	from pyprocess.mp_utils.hand_detector import results_to_arrays
+	if img is None:
+		landmarks, handedness, scores = results_to_arrays(None)
+		return HandResult(landmarks, handedness, scores, (0, 0))
+	_DETECTOR.process(img, copy=False)
+	landmarks, handedness, scores = _DETECTOR.arrays()
+	return HandResult(landmarks, handedness, scores, (img.shape[1], img.shape[0]))
+
+def _detect_frames(frames: List[np.ndarray]) -> List[HandResult]:
+	return [_detect(img) for img in frames]
+
+def _detect_files(paths: List[str]) -> List[HandResult]:
+	return [_detect(cv2.imread(path)) for path in paths]
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+	iterator = iter(items)
+	while True:
+		chunk = list(islice(iterator, size))
+		if not chunk:
+			return
+		yield chunk
+
+class HandDetectorPool:
+	"""
+	Her biri kendi `HandDetector` (MediaPipe grafiği) örneğini tutan işçi süreç havuzu.
+
+	Kareler veya dosyalar `chunk_size`'lık parçalar halinde işçilere dağıtılır,
+	sonuçlar girdi sırasıyla ve protobuf yerine NumPy dizileri olarak döner.
+	İşçiler havuz kapatılana kadar yaşar; grafik başlatma maliyeti her iş
+	için tekrar ödenmez.
+
+	Kullanım:
+		with HandDetectorPool(workers=4) as pool:
+			for result in pool.map_files(paths):
+				...
+	"""
+	def __init__(self, workers: Optional[int] = None, chunk_size: int = 8, start_method: str = 'spawn',
+				 **detector_kwargs):
+		"""
+		Args:
+			workers (int, optional): İşçi süreç sayısı; varsayılan `os.cpu_count()`.
+			chunk_size (int): İşçiye tek seferde gönderilen kare veya dosya sayısı.
+			start_method (str): Süreç başlatma yöntemi. MediaPipe grafikleri ve iş parçacıkları
+				fork sonrası güvenli olmadığından varsayılan 'spawn'dır.
+			**detector_kwargs: `HandDetector` argümanları; varsayılan olarak `mode=True`
+				(kareler farklı işçilere dağıldığı için takip yerine her karede algılama).
+		"""
+		detector_kwargs.setdefault('mode', True)
+		self.workers = workers or os.cpu_count() or 1
+		self.chunk_size = chunk_size
+		self.start_method = start_method
+		self.detector_kwargs = detector_kwargs
+		self.executor: Optional[ProcessPoolExecutor] = None
+
+	def __enter__(self) -> 'HandDetectorPool':
+		return self.start()
+
+	def __exit__(self, exc_type, exc, tb) -> None:
+		self.close()
+
+	def start(self) -> 'HandDetectorPool':
+		if self.executor is None:
+			self.executor = ProcessPoolExecutor(max_workers=self.workers,
+												mp_context=multiprocessing.get_context(self.start_method),
+												initializer=_init_worker, initargs=(self.detector_kwargs,))
+		return self
+
+	def close(self) -> None:
+		if self.executor is not None:
+			self.executor.shutdown()
+			self.executor = None
+
+	def _map(self, func, items: Iterable) -> Iterator[HandResult]:
+		# Aynı anda en fazla 2 * workers parça işlemdedir; sonuçlar sırayla verilir.
+		self.start()
+		chunks = _chunks(items, self.chunk_size)
+		pending = deque()
+		while True:
+			while len(pending) < 2 * self.workers:
+				chunk = next(chunks, None)
+				if chunk is None:
+					break
+				pending.append(self.executor.submit(func, chunk))
+			if not pending:
+				return
+			yield from pending.popleft().result()
+
+	def map_frames(self, frames: Iterable[np.ndarray]) -> Iterator[HandResult]:
+		"""
+		BGR kareleri işler.
+
+		Args:
+			frames: BGR görüntüler (liste, üreteç veya video okuyucu).
+
+		Yields:
+			HandResult: Her kare için girdi sırasıyla bir sonuç.
+		"""
+		return self._map(_detect_frames, frames)
+
+	def map_files(self, paths: Iterable[str]) -> Iterator[HandResult]:
+		"""
+		Görüntü dosyalarını işler; dosyalar işçilerde okunur, böylece ana süreç
+		piksel verisi taşımaz.
+
+		Args:
+			paths: Görüntü dosyası yolları.
+
+		Yields:
+			HandResult: Her dosya için girdi sırasıyla bir sonuç; okunamayan dosyalarda boş sonuç.
+		"""
+		return self._map(_detect_files, paths)
+
+	def map_video(self, path: str, max_frames: Optional[int] = None) -> Iterator[HandResult]:
+		"""
+		Bir video dosyasını ana süreçte çözer ve kareleri işçilere dağıtır.
+
+		Args:
+			path (str): Video dosyası.
+			max_frames (int, optional): İşlenecek en fazla kare sayısı.
+
+		Yields:
+			HandResult: Her kare için sırayla bir sonuç.
+
+		Raises:
+			IOError: Eğer video açılamazsa.
+		"""
+		return self._map(_detect_frames, islice(iter_video(path), max_frames))
+
+def iter_video(path: str) -> Iterator[np.ndarray]:
+	capture = cv2.VideoCapture(path)
+	if not capture.isOpened():
+		raise IOError(f"Could not open video source: {path}")
+	try:
+		while True:
+			ok, frame = capture.read()
+			if not ok:
+				return
+			yield frame
+	finally:
+		capture.release()
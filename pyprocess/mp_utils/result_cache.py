@@ -0,0 +1,171 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+Arrays = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+def frame_key(img: np.ndarray, params: Tuple = ()) -> str:
+	"""
+	Bir karenin içeriğinden ve algılayıcı parametrelerinden önbellek anahtarı üretir.
+
+	Args:
+		img (np.ndarray): Görüntü.
+		params (tuple): Sonucu etkileyen parametreler (örn. max_hands, model_complexity, eşikler).
+
+	Returns:
+		str: 32 karakterlik onaltılık özet.
+	"""
+	digest = hashlib.blake2b(digest_size=16)
+	digest.update(repr((img.shape, img.dtype.str, params)).encode())
+	digest.update(memoryview(np.ascontiguousarray(img)).cast('B'))
+	return digest.hexdigest()
+
+class ResultCache:
+	"""
+	Statik görüntüler için içerik adresli el algılama sonuç önbelleği.
+
+	Sonuçlar kompakt (landmarks, handedness, scores) dizileri olarak iki
+	katmanda tutulur: en fazla `max_items` girdilik bellek içi LRU ve
+	isteğe bağlı, `max_disk_bytes` ile sınırlanan disk katmanı. Disk
+	katmanında en uzun süredir kullanılmayan dosyalar önce silinir; dosyalar
+	atomik yazıldığından aynı dizini birden çok süreç paylaşabilir.
+	Önbellek süreçlere (örn. `HandDetectorPool` işçilerine) aktarılabilir;
+	her süreç kendi bellek katmanıyla başlar.
+	"""
+	def __init__(self, max_items: int = 1024, cache_dir: Optional[str] = None,
+				 max_disk_bytes: Optional[int] = 256 * 1024 * 1024):
+		"""
+		Args:
+			max_items (int): Bellek katmanındaki en fazla sonuç sayısı; 0 bellek katmanını kapatır.
+			cache_dir (str, optional): Disk katmanı dizini; verilmezse yalnızca bellek kullanılır.
+			max_disk_bytes (int, optional): Disk katmanının boyut sınırı; None sınırsız.
+		"""
+		self.max_items = max_items
+		self.cache_dir = cache_dir
+		self.max_disk_bytes = max_disk_bytes
+		self.hits = 0
+		self.misses = 0
+		self._init_state()
+
+	def _init_state(self) -> None:
+		self.memory: 'OrderedDict[str, Arrays]' = OrderedDict()
+		self.lock = threading.Lock()
+		self.disk_bytes = 0
+		if self.cache_dir is not None:
+			os.makedirs(self.cache_dir, exist_ok=True)
+			self.disk_bytes = sum(entry.stat().st_size for entry in os.scandir(self.cache_dir)
+								  if entry.name.endswith('.npz'))
+
+	def __getstate__(self) -> Dict[str, Any]:
+		return {'max_items': self.max_items, 'cache_dir': self.cache_dir, 'max_disk_bytes': self.max_disk_bytes,
+				'hits': 0, 'misses': 0}
+
+	def __setstate__(self, state: Dict[str, Any]) -> None:
+		self.__dict__.update(state)
+		self._init_state()
+
+	def __len__(self) -> int:
+		return len(self.memory)
+
+	def _path(self, key: str) -> str:
+		return os.path.join(self.cache_dir, f"{key}.npz")
+
+	def get(self, key: str) -> Optional[Arrays]:
+		"""
+		Anahtarın sonucunu döndürür; diskte bulunan sonuç belleğe de alınır.
+
+		Returns:
+			tuple or None: (landmarks, handedness, scores) veya bulunamazsa None.
+		"""
+		with self.lock:
+			arrays = self.memory.get(key)
+			if arrays is not None:
+				self.memory.move_to_end(key)
+				self.hits += 1
+				return arrays
+		arrays = self._load(key) if self.cache_dir is not None else None
+		with self.lock:
+			if arrays is None:
+				self.misses += 1
+				return None
+			self.hits += 1
+			self._remember(key, arrays)
+		return arrays
+
+	def put(self, key: str, arrays: Arrays) -> None:
+		landmarks, handedness, scores = arrays
+		arrays = (np.ascontiguousarray(landmarks, dtype=np.float32), np.ascontiguousarray(handedness, dtype=np.int8),
+				  np.ascontiguousarray(scores, dtype=np.float32))
+		for array in arrays:
+			array.flags.writeable = False
+		with self.lock:
+			self._remember(key, arrays)
+		if self.cache_dir is not None:
+			self._store(key, arrays)
+
+	def _remember(self, key: str, arrays: Arrays) -> None:
+		if self.max_items <= 0:
+			return
+		self.memory[key] = arrays
+		self.memory.move_to_end(key)
+		while len(self.memory) > self.max_items:
+			self.memory.popitem(last=False)
+
+	def _load(self, key: str) -> Optional[Arrays]:
+		path = self._path(key)
+		try:
+			with np.load(path) as data:
+				arrays = (data['landmarks'], data['handedness'], data['scores'])
+			os.utime(path)
+		except (OSError, KeyError, ValueError):
+			return None
+		for array in arrays:
+			array.flags.writeable = False
+		return arrays
+
+	def _store(self, key: str, arrays: Arrays) -> None:
+		path = self._path(key)
+		if os.path.exists(path):
+			return
+		landmarks, handedness, scores = arrays
+		fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+		with os.fdopen(fd, 'wb') as f:
+			np.savez(f, landmarks=landmarks, handedness=handedness, scores=scores)
+		size = os.path.getsize(tmp)
+		os.replace(tmp, path)
+		with self.lock:
+			self.disk_bytes += size
+			if self.max_disk_bytes is not None and self.disk_bytes > self.max_disk_bytes:
+				self._evict_disk()
+
+	def _evict_disk(self) -> None:
+		# Kilit altında çağrılır; sınırın %90'ına inene kadar en eski erişimli dosyalar silinir.
+		entries = sorted((entry.stat().st_mtime, entry.stat().st_size, entry.path)
+						 for entry in os.scandir(self.cache_dir) if entry.name.endswith('.npz'))
+		self.disk_bytes = sum(size for _, size, _ in entries)
+		target = self.max_disk_bytes * 0.9
+		for _, size, path in entries:
+			if self.disk_bytes <= target:
+				break
+			try:
+				os.remove(path)
+			except FileNotFoundError:
+				pass
+			self.disk_bytes -= size
+
+	def clear(self) -> None:
+		with self.lock:
+			self.memory.clear()
+			if self.cache_dir is not None:
+				for entry in os.scandir(self.cache_dir):
+					if entry.name.endswith('.npz'):
+						os.remove(entry.path)
+				self.disk_bytes = 0
+
+	def stats(self) -> Dict[str, int]:
+		return {'hits': self.hits, 'misses': self.misses, 'items': len(self.memory), 'disk_bytes': self.disk_bytes}
@@ -0,0 +1,160 @@
+from typing import NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from pyprocess.mp_utils.hand_detector import NUM_LANDMARKS
+
+class TrackResult(NamedTuple):
+	"""
+	Bir karenin ROI takip sonucu.
+
+	Attributes:
+		landmarks (np.ndarray): (hands, 21, 3) float32, tam kareye göre normalize landmark'lar.
+		handedness (np.ndarray): (hands,) int8; 0 = Left, 1 = Right.
+		scores (np.ndarray): (hands,) float32 skorlar.
+		roi (tuple or None): Çıkarımın yapıldığı (x, y, width, height) bölge; tam kare ise None.
+	"""
+	landmarks: np.ndarray
+	handedness: np.ndarray
+	scores: np.ndarray
+	roi: Optional[Tuple[int, int, int, int]]
+
+def roi_from_landmarks(landmarks: np.ndarray, frame_size: Tuple[int, int], margin: float = 0.25,
+					   min_side: int = 96) -> Tuple[int, int, int, int]:
+	"""
+	Tüm ellerin landmark'larını kapsayan, kenar payı eklenmiş kare bölgeyi hesaplar.
+
+	Args:
+		landmarks (np.ndarray): (hands, 21, 3) tam kareye göre normalize landmark'lar.
+		frame_size (tuple): Karenin (width, height) boyutu.
+		margin (float): Kutunun uzun kenarına oranla her yöne eklenecek pay.
+		min_side (int): Bölgenin en küçük kenar uzunluğu (piksel).
+
+	Returns:
+		tuple: Kareye kırpılmış (x0, y0, x1, y1) piksel sınırları.
+	"""
+	w, h = frame_size
+	points = landmarks[..., :2].reshape(-1, 2).astype(np.float64) * (w, h)
+	(x_min, y_min), (x_max, y_max) = points.min(axis=0), points.max(axis=0)
+	side = max(x_max - x_min, y_max - y_min) * (1 + 2 * margin)
+	side = min(max(side, min_side), max(w, h))
+	cx, cy = (x_min + x_max) / 2, (y_min + y_max) / 2
+	x0 = int(np.clip(cx - side / 2, 0, max(w - side, 0)))
+	y0 = int(np.clip(cy - side / 2, 0, max(h - side, 0)))
+	return x0, y0, min(int(x0 + side), w), min(int(y0 + side), h)
+
+def map_to_frame(landmarks: np.ndarray, roi: Tuple[int, int, int, int], frame_size: Tuple[int, int]) -> np.ndarray:
+	"""
+	ROI'ye göre normalize landmark'ları tam kareye göre normalize koordinatlara çevirir.
+
+	Args:
+		landmarks (np.ndarray): (hands, 21, 3) ROI'ye göre normalize landmark'lar.
+		roi (tuple): (x0, y0, x1, y1) bölge sınırları.
+		frame_size (tuple): Karenin (width, height) boyutu.
+
+	Returns:
+		np.ndarray: (hands, 21, 3) float32 landmark'lar.
+	"""
+	w, h = frame_size
+	x0, y0, x1, y1 = roi
+	scale = np.array([(x1 - x0) / w, (y1 - y0) / h, (x1 - x0) / w], dtype=np.float64)
+	offset = np.array([x0 / w, y0 / h, 0.0], dtype=np.float64)
+	return (landmarks.astype(np.float64) * scale + offset).astype(np.float32)
+
+class ROITracker:
+	"""
+	Önceki karedeki ellerin çevresini kırpıp küçülterek çıkarım yapan takip modu.
+
+	İlk karede veya takip kaybolduğunda tam kare (en fazla `max_side`
+	piksele küçültülerek) işlenir. Sonraki karelerde yalnızca önceki
+	ellerin kenar paylı sınırlayıcı bölgesi kırpılır; kırpma bir görünüm
+	(view) olduğundan kopyalanmaz ve büyükse `max_side`'a küçültülür.
+	Bölgede el bulunamazsa, skor `min_score`'un altına düşerse veya el bölge
+	kenarına dayanırsa aynı kare tam kare olarak yeniden işlenir.
+	Yeni giren elleri yakalamak için her `full_every` karede bir tam kare
+	işlenir. Landmark'lar her zaman tam kareye göre normalize döndürülür.
+	"""
+	def __init__(self, detector=None, margin: float = 0.25, max_side: int = 640, min_score: float = 0.6,
+				 edge: float = 0.02, max_hands: int = 2, full_every: int = 30):
+		"""
+		Args:
+			detector: `process(img, copy=False)` ve `arrays()` sağlayan algılayıcı. Verilmezse kırpılan
+				bölgeler kareden kareye kaydığı için statik modda bir `HandDetector` oluşturulur.
+			margin (float): ROI kenar payı (kutunun uzun kenarına oranla).
+			max_side (int): Çıkarıma verilen görüntünün en uzun kenarı.
+			min_score (float): Bu skorun altındaki eller takibi bırakır.
+			edge (float): Landmark'lar ROI kenarına bu oran kadar yaklaşırsa takip bırakılır.
+			max_hands (int): Varsayılan algılayıcı için en fazla el sayısı.
+			full_every (int): Takip sürerken bile tam kare işlenme aralığı.
+		"""
+		if detector is None:
+			from pyprocess.mp_utils.hand_detector import HandDetector
+			detector = HandDetector(mode=True, max_hands=max_hands)
+		self.detector = detector
+		self.margin = margin
+		self.max_side = max_side
+		self.min_score = min_score
+		self.edge = edge
+		self.full_every = full_every
+		self.since_full = 0
+		self.previous: Optional[np.ndarray] = None
+		self.full_frames = 0
+		self.roi_frames = 0
+
+	def reset(self) -> None:
+		self.previous = None
+
+	def _infer(self, img: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+		h, w = img.shape[:2]
+		scale = self.max_side / max(h, w)
+		if scale < 1:
+			img = cv2.resize(img, (max(1, round(w * scale)), max(1, round(h * scale))), interpolation=cv2.INTER_AREA)
+		self.detector.process(img, copy=False)
+		return self.detector.arrays()
+
+	def _confident(self, landmarks: np.ndarray, scores: np.ndarray) -> bool:
+		if not len(landmarks) or scores.min() < self.min_score:
+			return False
+		xy = landmarks[..., :2]
+		return bool((xy > self.edge).all() and (xy < 1 - self.edge).all())
+
+	def process(self, img: np.ndarray) -> TrackResult:
+		"""
+		Bir kareyi işler.
+
+		Args:
+			img (np.ndarray): BGR görüntü.
+
+		Returns:
+			TrackResult: Tam kareye göre normalize sonuçlar.
+		"""
+		h, w = img.shape[:2]
+		if self.previous is not None and self.since_full < self.full_every:
+			x0, y0, x1, y1 = roi = roi_from_landmarks(self.previous, (w, h), self.margin)
+			landmarks, handedness, scores = self._infer(img[y0:y1, x0:x1])
+			if self._confident(landmarks, scores):
+				self.roi_frames += 1
+				self.since_full += 1
+				landmarks = map_to_frame(landmarks, roi, (w, h))
+				self.previous = landmarks
+				return TrackResult(landmarks, handedness, scores, (x0, y0, x1 - x0, y1 - y0))
+		self.full_frames += 1
+		self.since_full = 0
+		landmarks, handedness, scores = self._infer(img)
+		keep = scores >= self.min_score
+		self.previous = landmarks[keep] if keep.any() else None
+		return TrackResult(landmarks, handedness, scores, None)
+
+	@property
+	def roi_ratio(self) -> float:
+		# Karelerin ne kadarının yalnızca ROI ile işlendiği.
+		total = self.full_frames + self.roi_frames
+		return self.roi_frames / total if total else 0.0
+
+	@staticmethod
+	def pixel_landmarks(result: TrackResult, img: np.ndarray) -> np.ndarray:
+		h, w = img.shape[:2]
+		if not len(result.landmarks):
+			return np.empty((0, NUM_LANDMARKS, 2), dtype=np.int32)
+		return (result.landmarks[..., :2].astype(np.float64) * (w, h)).astype(np.int32)
@@ -0,0 +1,303 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from pyprocess.mp_utils.pipeline import Frame, StageStats, open_source
+
+class StreamResult(NamedTuple):
+	"""
+	Zamanlayıcının bir akıştan işlediği tek kare için sonuç.
+
+	Attributes:
+		stream (str): Akış adı.
+		frame (Frame): İşlenen kare.
+		landmarks (np.ndarray): (hands, 21, 3) float32 normalize landmark'lar.
+		handedness (np.ndarray): (hands,) int8; 0 = Left, 1 = Right.
+		scores (np.ndarray): (hands,) float32 skorlar.
+	"""
+	stream: str
+	frame: Frame
+	landmarks: np.ndarray
+	handedness: np.ndarray
+	scores: np.ndarray
+
+class _Stream:
+	def __init__(self, name: str, source: Any, priority: float, latency_budget: Optional[float],
+				 on_result: Optional[Callable[[StreamResult], None]], max_frames: Optional[int]):
+		if priority <= 0:
+			raise ValueError("priority must be positive.")
+		self.name = name
+		self.source = source
+		self.priority = priority
+		self.latency_budget = latency_budget
+		self.on_result = on_result
+		self.max_frames = max_frames
+		self.capture = None
+		self.thread: Optional[threading.Thread] = None
+		# En güncel ve henüz işlenmemiş kare; yenisi gelince eskisinin üzerine yazılır.
+		self.pending: Optional[Frame] = None
+		self.vtime = 0.0
+		self.done = False
+		self.captured = 0
+		self.processed = 0
+		self.dropped = 0
+		self.stale = 0
+		self.latency = StageStats('latency')
+		self.inference = StageStats('inference')
+
+	def deadline(self) -> float:
+		if self.latency_budget is None:
+			return float('inf')
+		return self.pending.captured + self.latency_budget
+
+	def as_dict(self, elapsed: float) -> Dict[str, Any]:
+		return {
+			'priority': self.priority,
+			'captured': self.captured,
+			'processed': self.processed,
+			'dropped': self.dropped,
+			'stale': self.stale,
+			'fps': self.processed / elapsed if elapsed > 0 else 0.0,
+			'latency': self.latency.as_dict(),
+			'inference': self.inference.as_dict(),
+		}
+
+class StreamScheduler:
+	"""
+	Birden çok kamera akışını sabit sayıda algılayıcı örneğiyle işleyen zamanlayıcı.
+
+	Her akış kendi yakalama iş parçacığında okunur ve yalnızca en güncel
+	karesini tutar; işçi iş parçacıkları (algılayıcı başına bir tane) sıradaki
+	kareyi ağırlıklı adil sıralamayla seçer: her işlenen kare akışın sanal
+	zamanını `1 / priority` kadar ilerletir ve en geride kalan akış önce
+	işlenir. Eşitlikte gecikme bütçesi en erken dolan kare seçilir. Beklerken
+	`latency_budget`'ı aşan kareler işlenmeden atılır. Akış sayısı çekirdek
+	sayısını aştığında toplam verim algılayıcı sayısıyla sınırlı kalır,
+	akışlar arasında adilce paylaştırılır.
+
+	Kullanım:
+		with StreamScheduler(workers=4, on_result=callback) as scheduler:
+			scheduler.add_stream(0, priority=2)
+			scheduler.add_stream('rtsp://...', latency_budget=0.2)
+			scheduler.wait()
+	"""
+	def __init__(self, detectors: Optional[List[Any]] = None, workers: Optional[int] = None,
+				 on_result: Optional[Callable[[StreamResult], None]] = None, **detector_kwargs):
+		"""
+		Args:
+			detectors (list, optional): `process(img, copy=False)` ve `arrays()` sağlayan algılayıcılar.
+				Verilmezse `workers` adet `HandDetector` oluşturulur.
+			workers (int, optional): Oluşturulacak algılayıcı sayısı; varsayılan `os.cpu_count()`.
+			on_result (callable, optional): Akışa özel geri çağırma yoksa her sonuç için çağrılır.
+			**detector_kwargs: `HandDetector` argümanları; varsayılan olarak `mode=True` (bir algılayıcı
+				farklı akışların karelerini sırayla işlediği için takip yerine her karede algılama).
+		"""
+		if detectors is None:
+			from pyprocess.mp_utils.hand_detector import HandDetector
+			detector_kwargs.setdefault('mode', True)
+			detectors = [HandDetector(**detector_kwargs) for _ in range(workers or os.cpu_count() or 1)]
+		if not detectors:
+			raise ValueError("At least one detector is required.")
+		self.detectors = detectors
+		self.on_result = on_result
+		self.streams: Dict[str, _Stream] = {}
+		self.cond = threading.Condition()
+		self.stop_event = threading.Event()
+		self.workers: List[threading.Thread] = []
+		self.error: Optional[BaseException] = None
+		self.started = 0.0
+
+	def __enter__(self) -> 'StreamScheduler':
+		return self.start()
+
+	def __exit__(self, exc_type, exc, tb) -> None:
+		self.stop()
+
+	def add_stream(self, source: Any, name: Optional[str] = None, priority: float = 1.0,
+				   latency_budget: Optional[float] = None, on_result: Optional[Callable[[StreamResult], None]] = None,
+				   max_frames: Optional[int] = None) -> str:
+		"""
+		Bir akış ekler; zamanlayıcı çalışıyorsa akış hemen okunmaya başlar.
+
+		Args:
+			source: Kamera numarası, video yolu/URL'si veya `read()` -> (ok, frame) sağlayan bir nesne.
+			name (str, optional): Akış adı; varsayılan 'stream-<n>'.
+			priority (float): Göreli pay; 2 olan akış 1 olana göre yük altında iki kat kare alır.
+			latency_budget (float, optional): Saniye cinsinden; yakalamadan bu kadar sonra hâlâ
+				işlenmemiş kareler atılır.
+			on_result (callable, optional): Bu akışın sonuçları için geri çağırma.
+			max_frames (int, optional): Okunacak en fazla kare sayısı.
+
+		Returns:
+			str: Akış adı.
+
+		Raises:
+			ValueError: Eğer ad zaten kullanılıyorsa veya priority pozitif değilse.
+		"""
+		name = name if name is not None else f"stream-{len(self.streams)}"
+		stream = _Stream(name, source, priority, latency_budget, on_result, max_frames)
+		with self.cond:
+			if name in self.streams:
+				raise ValueError(f"Stream already exists: {name}")
+			active = [s.vtime for s in self.streams.values() if not s.done]
+			# Sonradan katılan akış biriken payı bir anda talep etmesin.
+			stream.vtime = min(active) if active else 0.0
+			self.streams[name] = stream
+		if self.workers:
+			self._start_stream(stream)
+		return name
+
+	def start(self) -> 'StreamScheduler':
+		if self.workers:
+			return self
+		self.started = time.perf_counter()
+		for stream in list(self.streams.values()):
+			self._start_stream(stream)
+		self.workers = [threading.Thread(target=self._guard, args=(self._worker_loop, detector), daemon=True)
+						for detector in self.detectors]
+		for thread in self.workers:
+			thread.start()
+		return self
+
+	def _start_stream(self, stream: _Stream) -> None:
+		stream.capture = open_source(stream.source)
+		stream.thread = threading.Thread(target=self._guard, args=(self._capture_loop, stream), daemon=True)
+		stream.thread.start()
+
+	def _guard(self, stage: Callable, arg: Any) -> None:
+		# Bir iş parçacığındaki hata zamanlayıcıyı durdurur ve wait sırasında yeniden fırlatılır.
+		try:
+			stage(arg)
+		except BaseException as error:
+			self.error = error
+			self.stop_event.set()
+			with self.cond:
+				self.cond.notify_all()
+
+	def _capture_loop(self, stream: _Stream) -> None:
+		try:
+			while not self.stop_event.is_set():
+				if stream.max_frames is not None and stream.captured >= stream.max_frames:
+					break
+				ok, image = stream.capture.read()
+				if not ok:
+					break
+				frame = Frame(stream.captured, time.perf_counter(), image)
+				with self.cond:
+					if stream.pending is not None:
+						stream.dropped += 1
+					stream.pending = frame
+					stream.captured += 1
+					self.cond.notify()
+		finally:
+			with self.cond:
+				stream.done = True
+				self.cond.notify_all()
+
+	def _finished(self) -> bool:
+		if self.stop_event.is_set():
+			return True
+		streams = self.streams.values()
+		return bool(streams) and all(s.done and s.pending is None for s in streams)
+
+	def _select(self) -> Optional[Tuple[_Stream, Frame]]:
+		# Kilit altında çağrılır.
+		now = time.perf_counter()
+		best = None
+		for stream in self.streams.values():
+			if stream.pending is None:
+				continue
+			if stream.deadline() < now:
+				stream.stale += 1
+				stream.pending = None
+				continue
+			if best is None or (stream.vtime, stream.deadline()) < (best.vtime, best.deadline()):
+				best = stream
+		if best is None:
+			return None
+		frame, best.pending = best.pending, None
+		best.vtime += 1.0 / best.priority
+		return best, frame
+
+	def _next(self) -> Optional[Tuple[_Stream, Frame]]:
+		with self.cond:
+			while True:
+				if self.stop_event.is_set():
+					return None
+				item = self._select()
+				if item is not None:
+					return item
+				if self._finished():
+					self.cond.notify_all()
+					return None
+				self.cond.wait()
+
+	def _worker_loop(self, detector) -> None:
+		while True:
+			item = self._next()
+			if item is None:
+				return
+			stream, frame = item
+			start = time.perf_counter()
+			detector.process(frame.image, copy=False)
+			landmarks, handedness, scores = detector.arrays()
+			stream.inference.add(time.perf_counter() - start)
+			result = StreamResult(stream.name, frame, landmarks, handedness, scores)
+			callback = stream.on_result or self.on_result
+			if callback is not None:
+				callback(result)
+			stream.latency.add(time.perf_counter() - frame.captured)
+			with self.cond:
+				stream.processed += 1
+
+	def wait(self, timeout: Optional[float] = None) -> None:
+		# Tüm akışlar bitip bekleyen kareler işlenene (veya stop çağrılana) kadar bekler.
+		# Akış yoksa beklenecek iş yoktur; işçiler sonradan eklenecek akışlar için çalışmaya devam eder.
+		with self.cond:
+			if not self.streams:
+				self._raise_error()
+				return
+		deadline = None if timeout is None else time.perf_counter() + timeout
+		for thread in self.workers:
+			thread.join(None if deadline is None else max(0.0, deadline - time.perf_counter()))
+		self._raise_error()
+
+	def stop(self) -> None:
+		self.stop_event.set()
+		with self.cond:
+			self.cond.notify_all()
+		threads = self.workers + [s.thread for s in self.streams.values() if s.thread is not None]
+		for thread in threads:
+			if thread is not threading.current_thread():
+				thread.join(timeout=5)
+		for stream in self.streams.values():
+			if stream.capture is not None and stream.capture is not stream.source and hasattr(stream.capture, 'release'):
+				stream.capture.release()
+			stream.capture = None
+
+	def _raise_error(self) -> None:
+		if self.error is not None:
+			error, self.error = self.error, None
+			raise error
+
+	def report(self) -> Dict[str, Any]:
+		"""
+		Akış başına verim ve gecikme istatistikleri.
+
+		Returns:
+			dict: 'streams' (ad -> 'captured', 'processed', 'dropped', 'stale', 'fps', 'latency',
+			'inference'), toplam 'processed', 'fps' ve 'workers'.
+		"""
+		elapsed = time.perf_counter() - self.started if self.started else 0.0
+		with self.cond:
+			streams = {name: stream.as_dict(elapsed) for name, stream in self.streams.items()}
+		processed = sum(s['processed'] for s in streams.values())
+		return {
+			'streams': streams,
+			'processed': processed,
+			'fps': processed / elapsed if elapsed > 0 else 0.0,
+			'workers': len(self.detectors),
+		}
@@ -0,0 +1,193 @@
+import math
+import time
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+class TemporalResult(NamedTuple):
+	"""
+	Zamansal katmanın tek bir kare için sonucu.
+
+	Attributes:
+		landmarks (np.ndarray): (hands, 21, 3) float32 yumuşatılmış veya tahmin edilmiş landmark'lar.
+		handedness (np.ndarray): (hands,) int8; 0 = Left, 1 = Right.
+		scores (np.ndarray): (hands,) float32 skorlar.
+		detected (bool): Bu karede çıkarım yapıldıysa True, tahmin edildiyse False.
+	"""
+	landmarks: np.ndarray
+	handedness: np.ndarray
+	scores: np.ndarray
+	detected: bool
+
+def _smoothing_factor(dt: float, cutoff):
+	r = 2 * math.pi * cutoff * dt
+	return r / (r + 1)
+
+class OneEuroFilter:
+	"""
+	Landmark dizileri için vektörel One-Euro filtresi.
+
+	Yavaş hareketlerde titremeyi güçlü biçimde bastırır, hızlı hareketlerde
+	kesim frekansını artırarak gecikmeyi azaltır. Her eleman bağımsız
+	filtrelenir; girdi herhangi bir şekilde olabilir.
+	"""
+	def __init__(self, min_cutoff: float = 1.0, beta: float = 0.05, d_cutoff: float = 1.0):
+		self.min_cutoff = min_cutoff
+		self.beta = beta
+		self.d_cutoff = d_cutoff
+		self.x: Optional[np.ndarray] = None
+		self.dx: Optional[np.ndarray] = None
+		self.t: Optional[float] = None
+
+	def reset(self) -> None:
+		self.x = self.dx = self.t = None
+
+	def __call__(self, x: np.ndarray, t: float) -> np.ndarray:
+		x = np.asarray(x, dtype=np.float64)
+		if self.x is None or self.x.shape != x.shape:
+			self.x, self.dx, self.t = x, np.zeros_like(x), t
+			return x
+		dt = max(t - self.t, 1e-6)
+		a_d = _smoothing_factor(dt, self.d_cutoff)
+		self.dx = a_d * (x - self.x) / dt + (1 - a_d) * self.dx
+		cutoff = self.min_cutoff + self.beta * np.abs(self.dx)
+		a = _smoothing_factor(dt, cutoff)
+		self.x = a * x + (1 - a) * self.x
+		self.t = t
+		return self.x
+
+	@property
+	def velocity(self) -> Optional[np.ndarray]:
+		return self.dx
+
+class ConstantVelocityFilter:
+	"""
+	Son iki gözlemden hız hesaplayıp ileriye doğru doğrusal tahmin yapan filtre.
+
+	Gözlemleri yumuşatmaz; `alpha` < 1 verilirse hız üstel olarak ortalanır.
+	"""
+	def __init__(self, alpha: float = 1.0):
+		self.alpha = alpha
+		self.x: Optional[np.ndarray] = None
+		self.dx: Optional[np.ndarray] = None
+		self.t: Optional[float] = None
+
+	def reset(self) -> None:
+		self.x = self.dx = self.t = None
+
+	def __call__(self, x: np.ndarray, t: float) -> np.ndarray:
+		x = np.asarray(x, dtype=np.float64)
+		if self.x is None or self.x.shape != x.shape:
+			self.x, self.dx, self.t = x, np.zeros_like(x), t
+			return x
+		dt = max(t - self.t, 1e-6)
+		self.dx = self.alpha * (x - self.x) / dt + (1 - self.alpha) * self.dx
+		self.x, self.t = x, t
+		return x
+
+	@property
+	def velocity(self) -> Optional[np.ndarray]:
+		return self.dx
+
+_FILTERS = {
+	'one_euro': OneEuroFilter,
+	'constant_velocity': ConstantVelocityFilter,
+}
+
+class TemporalHandDetector:
+	"""
+	`HandDetector` üzerinde kare atlama, ara kare tahmini ve yumuşatma katmanı.
+
+	Çıkarım her `every` karede bir yapılır. `adaptive=True` ise aralık
+	hareket hızına göre ayarlanır: eller yavaşken `max_every`'ye kadar
+	uzar, hızlanınca her kareye iner. Atlanan karelerde landmark'lar son
+	yumuşatılmış konum ve hızdan doğrusal olarak tahmin edilir; gerçek
+	algılamalar da aynı filtreden geçirilerek titreme bastırılır.
+	"""
+	def __init__(self, detector=None, every: int = 2, adaptive: bool = True, max_every: int = 4,
+				 motion_threshold: float = 0.5, smoothing: str = 'one_euro', **filter_kwargs):
+		"""
+		Args:
+			detector: `process(img, copy=False)` ve `arrays()` sağlayan algılayıcı; verilmezse `HandDetector()`.
+			every (int): Sabit modda çıkarım aralığı (kare); adaptif modda başlangıç aralığı.
+			adaptive (bool): Aralığın hareket hızına göre ayarlanıp ayarlanmayacağı.
+			max_every (int): Adaptif modda en uzun aralık.
+			motion_threshold (float): Saniyede görüntü genişliği oranı cinsinden hız eşiği; en hızlı
+				landmark bu hızın üstündeyse her karede çıkarım yapılır.
+			smoothing (str): 'one_euro' veya 'constant_velocity'.
+			**filter_kwargs: Filtre parametreleri (örn. min_cutoff, beta).
+		"""
+		if smoothing not in _FILTERS:
+			raise ValueError(f"Unsupported smoothing filter: {smoothing}")
+		if detector is None:
+			from pyprocess.mp_utils.hand_detector import HandDetector
+			detector = HandDetector()
+		self.detector = detector
+		self.every = max(1, every)
+		self.adaptive = adaptive
+		self.max_every = max(self.every, max_every)
+		self.motion_threshold = motion_threshold
+		self.filter = _FILTERS[smoothing](**filter_kwargs)
+		self.interval = self.every
+		self.since_detection = 0
+		self.last: Optional[TemporalResult] = None
+		self.detections = 0
+		self.predictions = 0
+
+	def reset(self) -> None:
+		self.filter.reset()
+		self.last = None
+		self.since_detection = 0
+		self.interval = self.every
+
+	def _should_detect(self) -> bool:
+		return self.last is None or not len(self.last.landmarks) or self.since_detection >= self.interval
+
+	def _update_interval(self) -> None:
+		velocity = self.filter.velocity
+		if not self.adaptive or velocity is None or not velocity.size:
+			return
+		speed = float(np.abs(velocity[..., :2]).max())
+		if speed > self.motion_threshold:
+			self.interval = 1
+		elif speed < self.motion_threshold / 2:
+			self.interval = min(self.interval + 1, self.max_every)
+
+	def process(self, img: np.ndarray, timestamp: Optional[float] = None) -> TemporalResult:
+		"""
+		Bir kareyi işler; gerekirse çıkarım yapar, aksi halde tahmin eder.
+
+		Args:
+			img (np.ndarray): BGR görüntü.
+			timestamp (float, optional): Kare zamanı (saniye); verilmezse `time.perf_counter()`.
+
+		Returns:
+			TemporalResult: Yumuşatılmış veya tahmin edilmiş landmark'lar.
+		"""
+		t = time.perf_counter() if timestamp is None else timestamp
+		if not self._should_detect():
+			self.since_detection += 1
+			self.predictions += 1
+			dt = t - self.filter.t
+			predicted = (self.filter.x + self.filter.velocity * dt).astype(np.float32)
+			return TemporalResult(predicted, self.last.handedness, self.last.scores, False)
+
+		self.detector.process(img, copy=False)
+		landmarks, handedness, scores = self.detector.arrays()
+		order = np.argsort(handedness, kind='stable')
+		landmarks, handedness, scores = landmarks[order], handedness[order], scores[order]
+		if self.last is None or not np.array_equal(handedness, self.last.handedness):
+			# El sayısı veya tarafı değişti; eski hız bilgisi geçersiz.
+			self.filter.reset()
+		smoothed = self.filter(landmarks, t).astype(np.float32) if len(landmarks) else landmarks
+		self._update_interval()
+		self.since_detection = 1
+		self.detections += 1
+		self.last = TemporalResult(smoothed, handedness, scores, True)
+		return self.last
+
+	@property
+	def detection_ratio(self) -> float:
+		# Karelerin ne kadarında gerçekten çıkarım yapıldığı.
+		total = self.detections + self.predictions
+		return self.detections / total if total else 0.0
@@ -1,3 +1,6 @@
 from .draw import Shape, Rect, Circle, Triangle
+from .overlay import OverlayRenderer, draw_points, text_size
+from .renderer import IncrementalRenderer
+from .scene import Scene
 
-__all__ = ['Shape', 'Rect', 'Circle', 'Triangle']
\ No newline at end of file
+__all__ = ['Shape', 'Rect', 'Circle', 'Triangle', 'OverlayRenderer', 'draw_points', 'text_size', 'Scene', 'IncrementalRenderer']
\ No newline at end of file
@@ -0,0 +1,191 @@
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from cv2 import (
+    FILLED as CV_FILLED,
+    FONT_HERSHEY_SIMPLEX as CV_FONT,
+    LINE_AA as CV_LINE_AA,
+    addWeighted as cv_addWeighted,
+    circle as cv_circle,
+    getTextSize as cv_getTextSize,
+    polylines as cv_polylines,
+    putText as cv_putText,
+    rectangle as cv_rectangle
+)
+
+import numpy as np
+
+Color = Tuple[int, int, int]
+Colors = Union[Color, Sequence[Color], np.ndarray]
+
+@lru_cache(maxsize=4096)
+def text_size(text: str, font_scale: float = 1, thickness: int = 1, font: int = CV_FONT) -> Tuple[Tuple[int, int], int]:
+    """
+    `cv2.getTextSize` sonucunu (metin, ölçek, kalınlık, yazı tipi) başına önbelleğe alır.
+
+    :param text: Ölçülecek metin
+    :param font_scale: Yazı ölçeği
+    :param thickness: Yazı kalınlığı
+    :param font: OpenCV yazı tipi
+    :return: ((genişlik, yükseklik), taban çizgisi)
+    """
+    return cv_getTextSize(text, font, font_scale, thickness)
+
+@lru_cache(maxsize=64)
+def _disc_offsets(radius: int) -> np.ndarray:
+    # cv2.circle(FILLED) ile birebir aynı pikselleri veren merkez göreli (dy, dx) kaydırmaları.
+    side = 2 * radius + 1
+    stamp = np.zeros((side, side), dtype=np.uint8)
+    cv_circle(stamp, (radius, radius), radius, 1, CV_FILLED)
+    offsets = np.argwhere(stamp) - radius
+    offsets.flags.writeable = False
+    return offsets
+
+def draw_points(img: np.ndarray, points: np.ndarray, color: Color = (255, 0, 255), radius: int = 5) -> np.ndarray:
+    """
+    Tüm noktaları tek bir NumPy atamasıyla dolu daire olarak çizer.
+
+    Sonuç, her nokta için `cv2.circle(img, p, radius, color, cv2.FILLED)` çağrısıyla aynıdır.
+
+    :param img: Üzerine çizim yapılacak görüntü
+    :param points: (..., 2) tamsayı [x, y] noktaları, örn. (hands, 21, 2)
+    :param color: Nokta rengi
+    :param radius: Daire yarıçapı
+    :return: Güncellenmiş görüntü
+    """
+    points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+    if not len(points):
+        return img
+    offsets = _disc_offsets(radius)
+    h, w = img.shape[:2]
+    x, y = points[:, 0], points[:, 1]
+    # Bitişik olmayan görünümlerde (örn. frame[:, 50:150]) reshape bir kopya döndürür;
+    # bu durumda iki boyutlu indeksleme ile doğrudan görünüme yazılır.
+    contiguous = img.flags.c_contiguous
+    if contiguous and x.min() >= radius and y.min() >= radius and x.max() < w - radius and y.max() < h - radius:
+        # Tüm daireler görüntünün içinde: sınır denetimi olmadan düz indeksleme.
+        img.reshape(h * w, -1)[((y * w + x)[:, None] + (offsets[:, 0] * w + offsets[:, 1])).ravel()] = color
+        return img
+    ys = (y[:, None] + offsets[:, 0]).ravel()
+    xs = (x[:, None] + offsets[:, 1]).ravel()
+    inside = (ys >= 0) & (ys < h) & (xs >= 0) & (xs < w)
+    if contiguous:
+        img.reshape(h * w, -1)[ys[inside] * w + xs[inside]] = color
+    else:
+        img[ys[inside], xs[inside]] = color
+    return img
+
+def _box_corners(boxes: np.ndarray) -> np.ndarray:
+    # (N, 4) [x, y, w, h] -> (N, 4, 2) köşe noktaları.
+    x, y, w, h = boxes.T
+    return np.stack([np.stack([x, y], 1), np.stack([x + w, y], 1),
+                     np.stack([x + w, y + h], 1), np.stack([x, y + h], 1)], axis=1).astype(np.int32)
+
+def _group_by_color(colors: np.ndarray) -> Dict[Color, np.ndarray]:
+    groups: Dict[Color, List[int]] = {}
+    for i, color in enumerate(map(tuple, colors.tolist())):
+        groups.setdefault(color, []).append(i)
+    return {color: np.array(indices) for color, indices in groups.items()}
+
+class OverlayRenderer:
+    """
+    Bir karedeki tüm kutu, etiket ve noktaları toplu çizen katman.
+
+    Kutu çerçeveleri renk başına tek bir `cv2.polylines` çağrısıyla,
+    noktalar tek bir NumPy atamasıyla çizilir; etiket arka planları, üst
+    üste binen aynı renkli etiketlerde delik kalmaması için tek tek
+    doldurulur; metin boyutları önbellekten gelir. `alpha` 1 ise
+    çizim doğrudan kareye yapılır, değilse kare başına yeniden kullanılan
+    bir katmana çizilip tek bir `cv2.addWeighted` ile birleştirilir.
+    Çakışmayan kutularda çıktı, her kutu için `HandDetector.draw_bounding_box`
+    çağrısıyla aynıdır.
+    """
+    def __init__(self, font_scale: float = 1, font_thickness: int = 1, thickness: int = 2,
+                 text_color: Color = (255, 255, 255), text_position: str = 'left', padding: int = 0,
+                 point_radius: int = 5):
+        """
+        :param font_scale: Etiket yazı ölçeği
+        :param font_thickness: Etiket yazı kalınlığı
+        :param thickness: Kutu çerçeve kalınlığı
+        :param text_color: Etiket yazı rengi
+        :param text_position: Etiketin kutuya göre konumu ('left', 'right', 'center')
+        :param padding: Etiket arka planı iç boşluğu
+        :param point_radius: Nokta yarıçapı
+        """
+        self.font_scale = font_scale
+        self.font_thickness = font_thickness
+        self.thickness = thickness
+        self.text_color = text_color
+        self.text_position = text_position.lower()
+        self.padding = padding
+        self.point_radius = point_radius
+        self._layers: Dict[Tuple[int, ...], np.ndarray] = {}
+
+    def _layer(self, img: np.ndarray) -> np.ndarray:
+        layer = self._layers.get(img.shape)
+        if layer is None:
+            if len(self._layers) >= 4:
+                self._layers.clear()
+            layer = self._layers[img.shape] = np.empty_like(img)
+        np.copyto(layer, img)
+        return layer
+
+    def _label_origins(self, boxes: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+        x, w = boxes[:, 0], boxes[:, 2]
+        if self.text_position == 'right':
+            return x + w - sizes[:, 0] - 2 * self.padding
+        if self.text_position == 'center':
+            return x + (w - sizes[:, 0] - 2 * self.padding) // 2
+        return x
+
+    def draw(self, img: np.ndarray, boxes: Optional[np.ndarray] = None, labels: Optional[Iterable[Optional[str]]] = None,
+             colors: Colors = (0, 0, 0), points: Optional[np.ndarray] = None, point_color: Color = (255, 0, 255),
+             alpha: float = 1.0) -> np.ndarray:
+        """
+        Kutuları, etiketleri ve noktaları tek geçişte çizer.
+
+        :param img: Üzerine çizim yapılacak görüntü (yerinde değiştirilir)
+        :param boxes: (N, 4) [x, y, width, height] kutuları
+        :param labels: Kutu başına etiket; None veya boş metin etiket çizilmez
+        :param colors: Tüm kutular için tek renk veya (N, 3) kutu başına renkler
+        :param points: (..., 2) [x, y] piksel noktaları, örn. `HandDetector.pixel_landmarks` çıktısı
+        :param point_color: Nokta rengi
+        :param alpha: Katman opaklığı; 1 ise doğrudan çizilir
+        :return: Güncellenmiş görüntü
+        """
+        target = img if alpha >= 1 else self._layer(img)
+        if boxes is not None and len(boxes):
+            self._draw_boxes(target, np.asarray(boxes, dtype=np.int64).reshape(-1, 4), labels, colors)
+        if points is not None:
+            draw_points(target, points, point_color, self.point_radius)
+        if target is not img:
+            cv_addWeighted(target, alpha, img, 1 - alpha, 0, dst=img)
+        return img
+
+    def _draw_boxes(self, img: np.ndarray, boxes: np.ndarray, labels, colors: Colors) -> None:
+        colors = np.broadcast_to(np.asarray(colors, dtype=np.int64), (len(boxes), 3))
+        groups = _group_by_color(colors)
+        corners = _box_corners(boxes)
+        for color, indices in groups.items():
+            cv_polylines(img, list(corners[indices]), True, color, self.thickness)
+        if labels is None:
+            return
+
+        labels = list(labels)
+        drawn = np.array([bool(text) for text in labels])
+        if not drawn.any():
+            return
+        sizes = np.array([text_size(text, self.font_scale, self.font_thickness)[0] if text else (0, 0)
+                          for text in labels], dtype=np.int64)
+        text_x = self._label_origins(boxes, sizes)
+        text_y = boxes[:, 1]
+        pad = self.padding
+        # Tek bir fillPoly çağrısı çakışan çokgenleri çift-tek kuralıyla boyar ve kesişimi boş bırakır.
+        x0, y0 = text_x.tolist(), (text_y - sizes[:, 1] - pad).tolist()
+        x1, y1 = (text_x + sizes[:, 0] + 2 * pad).tolist(), (text_y + pad).tolist()
+        color_rows = colors.tolist()
+        for i in np.flatnonzero(drawn).tolist():
+            cv_rectangle(img, (x0[i], y0[i]), (x1[i], y1[i]), color_rows[i], CV_FILLED)
+        for i in np.flatnonzero(drawn).tolist():
+            cv_putText(img, labels[i], (int(text_x[i]) + pad, int(text_y[i]) + pad), CV_FONT,
+                       self.font_scale, self.text_color, self.font_thickness, CV_LINE_AA)
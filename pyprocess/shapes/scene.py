@@ -0,0 +1,231 @@
+from typing import Dict, List, Optional
+
+from cv2 import (
+    circle as cv_circle,
+    fillPoly as cv_fillPoly
+)
+
+import numpy as np
+
+from .draw import Circle, Color, Rect, Shape, Triangle
+
+RECT, CIRCLE, TRIANGLE = 0, 1, 2
+_KINDS = {Rect: RECT, Circle: CIRCLE, Triangle: TRIANGLE}
+_CLASSES = {kind: cls for cls, kind in _KINDS.items()}
+
+def _cross(ax, ay, bx, by, px, py):
+    # (b - a) x (p - a); işaret p'nin ab kenarının hangi tarafında olduğunu verir.
+    return (bx - ax) * (py - ay) - (by - ay) * (px - ax)
+
+def draw_rows(img: np.ndarray, kinds: np.ndarray, points: np.ndarray, sizes: np.ndarray,
+              colors: np.ndarray) -> np.ndarray:
+    """
+    Dizi olarak verilen şekilleri sırayla dolu olarak çizer.
+
+    Köşe noktaları tek seferde hesaplanır. `cv2.fillPoly` birden çok çokgende
+    çakışan bölgeleri boş bıraktığından her şekil ayrı çağrıyla çizilir.
+
+    :param img: Üzerine çizim yapılacak görüntü
+    :param kinds: (n,) şekil türleri (RECT, CIRCLE, TRIANGLE)
+    :param points: (n, 2) sol üst köşeler
+    :param sizes: (n, 2) genişlik ve yükseklikler
+    :param colors: (n, 3) renkler
+    :return: Güncellenmiş görüntü
+    """
+    x, y = points[:, 0], points[:, 1]
+    w, h = sizes[:, 0], sizes[:, 1]
+    rects = np.stack([np.stack([x, y], 1), np.stack([x + w, y], 1),
+                      np.stack([x + w, y + h], 1), np.stack([x, y + h], 1)], axis=1).astype(np.int32)
+    triangles = np.stack([np.stack([x + w // 2, y], 1), np.stack([x, y + h], 1),
+                          np.stack([x + w, y + h], 1)], axis=1).astype(np.int32)
+    centers = np.stack([x + w // 2, y + h // 2], 1).tolist()
+    radii = (np.minimum(w, h) // 2).tolist()
+    colors = [tuple(c) for c in np.asarray(colors).tolist()]
+    for i, kind in enumerate(np.asarray(kinds).tolist()):
+        if kind == CIRCLE:
+            cv_circle(img, centers[i], radii[i], colors[i], -1)
+        else:
+            cv_fillPoly(img, [rects[i] if kind == RECT else triangles[i]], colors[i])
+    return img
+
+class Scene:
+    """
+    Şekilleri bitişik dizilerde (nokta, boyut, renk, tür) tutan koleksiyon.
+
+    Bir veya birden çok imlecin (örn. tüm parmak uçları) tüm şekillerle
+    çarpışması tek bir NumPy geçişinde hesaplanır. Dikdörtgenler kutu,
+    daireler merkez-yarıçap, üçgenler kenar işaretleriyle sınanır. Sürükleme
+    durumu imleç başına tutulur; her karede yalnızca sürüklenen şekillerin
+    satırları değişir.
+    """
+    def __init__(self, shapes: Optional[List[Shape]] = None, color: Color = (255, 0, 255),
+                 active_color: Color = (0, 255, 0), capacity: int = 64):
+        """
+        :param shapes: Başlangıç şekilleri (Rect, Circle, Triangle)
+        :param color: Sürüklenmeyen şekillerin rengi
+        :param active_color: Sürüklenen şekillerin rengi
+        :param capacity: Başlangıç dizi kapasitesi
+        """
+        self.color: Color = color
+        self.active_color: Color = active_color
+        self.count = 0
+        self.points = np.zeros((capacity, 2), dtype=np.int64)
+        self.sizes = np.zeros((capacity, 2), dtype=np.int64)
+        self.colors = np.zeros((capacity, 3), dtype=np.int64)
+        self.kinds = np.zeros(capacity, dtype=np.int8)
+        # imleç numarası -> sürüklenen şekil indeksi
+        self.dragging: Dict[int, int] = {}
+        for shape in shapes or []:
+            self.add(shape)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _grow(self) -> None:
+        capacity = max(2 * len(self.kinds), 1)
+        for name in ('points', 'sizes', 'colors', 'kinds'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, shape: Shape) -> int:
+        """
+        Bir şekli sahneye ekler; sonradan eklenen şekil üstte kabul edilir.
+
+        :param shape: Rect, Circle veya Triangle
+        :return: Şeklin indeksi
+        """
+        kind = _KINDS.get(type(shape))
+        if kind is None:
+            raise TypeError(f"Unsupported shape type: {type(shape).__name__}")
+        if self.count == len(self.kinds):
+            self._grow()
+        i = self.count
+        self.points[i] = shape.point
+        self.sizes[i] = shape.size
+        self.colors[i] = shape.color
+        self.kinds[i] = kind
+        self.count += 1
+        return i
+
+    def remove(self, index: int) -> None:
+        """
+        Bir şekli siler; sonraki şekillerin indeksleri bir azalır.
+
+        :param index: Silinecek şeklin indeksi
+        """
+        if not 0 <= index < self.count:
+            raise IndexError(f"Shape index out of range: {index}")
+        for array in (self.points, self.sizes, self.colors, self.kinds):
+            array[index:self.count - 1] = array[index + 1:self.count].copy()
+        self.count -= 1
+        self.dragging = {cursor: i - (i > index) for cursor, i in self.dragging.items() if i != index}
+
+    def shape(self, index: int) -> Shape:
+        """
+        Bir satırın güncel durumunu şekil nesnesi olarak döndürür.
+        """
+        cls = _CLASSES[int(self.kinds[index])]
+        return cls(tuple(self.points[index].tolist()), tuple(self.sizes[index].tolist()),
+                   tuple(self.colors[index].tolist()))
+
+    def shapes(self) -> List[Shape]:
+        return [self.shape(i) for i in range(self.count)]
+
+    def hit_test(self, cursors: np.ndarray) -> np.ndarray:
+        """
+        İmleçlerin hangi şekillerin içinde olduğunu hesaplar.
+
+        :param cursors: Tek bir (x, y) imleç veya (k, 2) imleçler
+        :return: Tek imleçte (n,), birden çoğunda (k, n) bool matris
+        """
+        cursors = np.asarray(cursors, dtype=np.int64)
+        single = cursors.ndim == 1
+        cursors = cursors.reshape(-1, 2)
+        n = self.count
+        x, y = self.points[:n, 0], self.points[:n, 1]
+        w, h = self.sizes[:n, 0], self.sizes[:n, 1]
+        cx, cy = cursors[:, 0, None], cursors[:, 1, None]
+        kinds = self.kinds[:n]
+
+        # Dikdörtgen: Shape.update ile aynı açık aralık.
+        inside = (x < cx) & (cx < x + w) & (y < cy) & (cy < y + h)
+
+        # Daire: Circle.draw ile aynı merkez ve yarıçap.
+        radius = np.minimum(w, h) // 2
+        dx, dy = cx - (x + w // 2), cy - (y + h // 2)
+        in_circle = dx * dx + dy * dy <= radius * radius
+
+        # Üçgen: Triangle.draw ile aynı köşeler; nokta üç kenarın da aynı tarafında olmalı.
+        ax, ay = x + w // 2, y
+        bx, by = x, y + h
+        qx, qy = x + w, y + h
+        d1 = _cross(ax, ay, bx, by, cx, cy)
+        d2 = _cross(bx, by, qx, qy, cx, cy)
+        d3 = _cross(qx, qy, ax, ay, cx, cy)
+        in_triangle = ~(((d1 < 0) | (d2 < 0) | (d3 < 0)) & ((d1 > 0) | (d2 > 0) | (d3 > 0)))
+
+        inside = np.where(kinds == CIRCLE, in_circle, np.where(kinds == TRIANGLE, in_triangle, inside))
+        return inside[0] if single else inside
+
+    def topmost(self, cursors: np.ndarray) -> np.ndarray:
+        """
+        Her imlecin altındaki en üstteki (en son eklenen) şeklin indeksi.
+
+        :param cursors: Tek bir (x, y) imleç veya (k, 2) imleçler
+        :return: (k,) indeksler; imleç hiçbir şeyin üstünde değilse -1
+        """
+        hits = np.atleast_2d(self.hit_test(np.asarray(cursors).reshape(-1, 2)))
+        if not self.count:
+            return np.full(len(hits), -1)
+        last = self.count - 1 - np.argmax(hits[:, ::-1], axis=1)
+        return np.where(hits.any(axis=1), last, -1)
+
+    def update(self, cursors: np.ndarray, pressed: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Sürükle-bırak durumunu imleçlere göre günceller.
+
+        Basılı bir imleç zaten bir şekli sürüklüyorsa şekil imlece ortalanır;
+        sürüklemiyorsa altındaki en üstteki boş şekli yakalar. Basılı olmayan
+        veya artık verilmeyen imleçler şekillerini bırakır.
+
+        :param cursors: (k, 2) imleçler; k'inci satır k numaralı imleçtir
+        :param pressed: (k,) bool; verilmezse tüm imleçler basılı kabul edilir
+        :return: (k,) her imlecin sürüklediği şeklin indeksi veya -1
+        """
+        cursors = np.asarray(cursors, dtype=np.int64).reshape(-1, 2)
+        pressed = np.ones(len(cursors), dtype=bool) if pressed is None else np.asarray(pressed, dtype=bool)
+        for cursor in [c for c in self.dragging if c >= len(cursors) or not pressed[c]]:
+            self.colors[self.dragging.pop(cursor)] = self.color
+
+        free = [c for c in np.flatnonzero(pressed).tolist() if c not in self.dragging]
+        if free:
+            hits = np.atleast_2d(self.hit_test(cursors[free]))
+            if self.dragging:
+                hits[:, list(self.dragging.values())] = False
+            for row, cursor in enumerate(free):
+                candidates = np.flatnonzero(hits[row])
+                if len(candidates):
+                    index = int(candidates[-1])
+                    self.dragging[cursor] = index
+                    hits[:, index] = False
+                    self.colors[index] = self.active_color
+
+        grabbed = np.full(len(cursors), -1)
+        if self.dragging:
+            order = list(self.dragging)
+            indices = np.array([self.dragging[c] for c in order])
+            self.points[indices] = cursors[order] - self.sizes[indices] // 2
+            grabbed[order] = indices
+        return grabbed
+
+    def draw(self, img: np.ndarray) -> np.ndarray:
+        """
+        Tüm şekilleri ekleme sırasıyla dolu olarak çizer.
+
+        :param img: Üzerine çizim yapılacak görüntü
+        :return: Güncellenmiş görüntü
+        """
+        n = self.count
+        return draw_rows(img, self.kinds[:n], self.points[:n], self.sizes[:n], self.colors[:n])
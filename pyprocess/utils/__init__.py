@@ -1 +1,2 @@
-from pyprocess.utils.display import warning
\ No newline at end of file
+from pyprocess.utils.display import warning
+from pyprocess.utils.image_size import ImageSizeIndex, read_image_size
\ No newline at end of file
@@ -0,0 +1,187 @@
+import json
+import os
+import struct
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+Size = Tuple[int, int]
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.gif')
+
+# Boyut bilgisi taşıyan JPEG SOF işaretleri (DHT, JPG ve DAC hariç).
+_JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+def _read_exact(file, n: int) -> bytes:
+    data = file.read(n)
+    if len(data) != n:
+        raise ValueError("JPEG ended inside a marker segment.")
+    return data
+
+def _jpeg_size(file) -> Size:
+    file.seek(2)
+    while True:
+        byte = file.read(1)
+        while byte and byte != b'\xff':
+            byte = file.read(1)
+        while byte == b'\xff':
+            byte = file.read(1)
+        if not byte:
+            raise ValueError("JPEG ended before a SOF marker.")
+        marker = byte[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            continue
+        length = struct.unpack('>H', _read_exact(file, 2))[0]
+        if length < 2:
+            raise ValueError(f"Invalid JPEG segment length: {length}")
+        if marker in _JPEG_SOF:
+            height, width = struct.unpack('>xHH', _read_exact(file, 5))
+            return width, height
+        file.seek(length - 2, os.SEEK_CUR)
+
+def read_image_size(path: str) -> Size:
+    """
+    Görüntünün boyutunu pikselleri çözmeden, yalnızca başlık baytlarından okur.
+
+    JPEG için SOF işareti, PNG için IHDR bloğu, GIF ve BMP için sabit başlık
+    alanları kullanılır. EXIF yönlendirmesi uygulanmaz; dosyada saklanan
+    boyut döndürülür.
+
+    Args:
+        path (str): Görüntü dosyası.
+
+    Returns:
+        tuple: (width, height).
+
+    Raises:
+        ValueError: Eğer format desteklenmiyorsa veya başlık bozuksa.
+    """
+    with open(path, 'rb') as file:
+        try:
+            size = _header_size(file)
+        except struct.error:
+            # Kısa (kesilmiş) başlıklar struct hatası verir; belgelenen hata türüne çevrilir.
+            size = None
+    if size is None:
+        raise ValueError(f"Unsupported or corrupt image header: {path}")
+    return size
+
+def _header_size(file) -> Optional[Size]:
+    head = file.read(26)
+    if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+        return struct.unpack('>II', head[16:24])
+    if head[:2] == b'\xff\xd8':
+        return _jpeg_size(file)
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return struct.unpack('<HH', head[6:10])
+    if head[:2] == b'BM' and len(head) >= 26:
+        width, height = struct.unpack('<ii', head[18:26])
+        return width, abs(height)
+    return None
+
+class ImageSizeIndex:
+    """
+    Görüntü boyutları için kalıcı önbellek.
+
+    Kayıtlar dosya yolu ve değişiklik zamanı (mtime) ile anahtarlanır; dosya
+    değişirse boyut yeniden okunur. Önbellek bellekte bir sözlük olarak
+    tutulur, bu yüzden aramalar O(1)'dir. `save` çağrısı (veya `with` bloğu)
+    önbelleği JSON olarak diske yazar.
+    """
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Args:
+            cache_path (str, optional): Önbellek dosyası; verilmezse yalnızca bellekte tutulur.
+        """
+        self.cache_path = cache_path
+        self.entries: Dict[str, Tuple[int, int, int]] = {}
+        # `directory` taramasında boyutu okunamayan görüntüler: yol -> hata mesajı.
+        self.failed: Dict[str, str] = {}
+        self.dirty = False
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, 'r') as file:
+                self.entries = {path: tuple(entry) for path, entry in json.load(file).items()}
+
+    def __enter__(self) -> 'ImageSizeIndex':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.save()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _lookup(self, path: str, mtime_ns: int) -> Size:
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == mtime_ns:
+            return entry[1], entry[2]
+        width, height = read_image_size(path)
+        self.entries[path] = (mtime_ns, width, height)
+        self.dirty = True
+        return width, height
+
+    def get(self, path: str) -> Size:
+        """
+        Görüntünün boyutunu önbellekten veya başlığından döndürür.
+
+        Args:
+            path (str): Görüntü dosyası.
+
+        Returns:
+            tuple: (width, height).
+        """
+        path = os.path.abspath(path)
+        return self._lookup(path, os.stat(path).st_mtime_ns)
+
+    def get_many(self, paths: Iterable[str]) -> np.ndarray:
+        """
+        Birden çok görüntünün boyutunu toplu dönüşümlerde kullanılmak üzere döndürür.
+
+        Args:
+            paths: Görüntü dosyaları.
+
+        Returns:
+            np.ndarray: (N, 2) int64 (width, height) dizisi.
+        """
+        return np.array([self.get(path) for path in paths], dtype=np.int64).reshape(-1, 2)
+
+    def directory(self, images_dir: str, extensions: Tuple[str, ...] = IMAGE_EXTENSIONS) -> Dict[str, Size]:
+        """
+        Bir dizindeki tüm görüntüler için uzantısız ad -> boyut sözlüğü oluşturur.
+
+        Dönen sözlük doğrudan `convert_dataset(..., size_of=...)` parametresine
+        verilebilir ve süreçler arasında aktarılabilir. Okunamayan veya bozuk
+        görüntüler taramayı durdurmaz; sözlüğe eklenmez ve `failed` içinde
+        hata mesajlarıyla raporlanır.
+
+        Args:
+            images_dir (str): Görüntü dizini.
+            extensions (tuple): Dikkate alınacak dosya uzantıları.
+
+        Returns:
+            dict: {stem: (width, height)}.
+        """
+        sizes: Dict[str, Size] = {}
+        root = os.path.abspath(images_dir)
+        with os.scandir(root) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext.lower() in extensions and entry.is_file():
+                    path = os.path.join(root, entry.name)
+                    try:
+                        sizes[stem] = self._lookup(path, entry.stat().st_mtime_ns)
+                    except (OSError, ValueError) as error:
+                        self.failed[path] = str(error)
+        return sizes
+
+    def save(self) -> None:
+        """
+        Önbellek değiştiyse diske atomik olarak yazar.
+        """
+        if not self.cache_path or not self.dirty:
+            return
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump(self.entries, file, separators=(',', ':'))
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
@@ -0,0 +1,284 @@
+"""
+İsteğe bağlı ölçüm katmanı: aşama zamanlayıcıları, sayaçlar ve histogramlar.
+
+Varsayılan olarak kapalıdır; `enable()` çağrılana veya ortamda
+`PYPROCESS_METRICS=1` tanımlanana kadar `timer()` paylaşılan boş bir bağlam
+döndürür ve `count()` / `observe()` hemen döner. Sıcak yollar ayrıca
+`if metrics.ENABLED:` ile korunur; kapalıyken maliyet bir öznitelik okumasıdır.
+
+Kullanım:
+    from pyprocess.utils import metrics
+
+    metrics.enable()
+    with metrics.timer('hand_detector.inference'):
+        ...
+    metrics.count('hand_detector.frames')
+    print(metrics.to_prometheus())
+"""
+import bisect
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Optional, Tuple
+
+ENABLED = os.environ.get('PYPROCESS_METRICS', '') not in ('', '0')
+
+# Saniye cinsinden üst sınırlar; 50 µs ile 10 s arası yaklaşık logaritmik.
+DEFAULT_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0)
+
+_NULL = nullcontext()
+_lock = threading.Lock()
+_local = threading.local()
+# İş parçacığı kimliği -> açık aşama yığını; örnekleyici başka iş parçacıklarının yığınını buradan okur.
+_stacks: Dict[int, List[str]] = {}
+_hooks: List[Callable[[str, float], None]] = []
+
+class Histogram:
+    """
+    Sabit kovalı, kümülatif olmayan sayaçlarla tutulan gecikme histogramı.
+    """
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        # Kova üst sınırından yaklaşık değer; son kovada en büyük sınır döner.
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.bounds[-1]
+
+    def as_dict(self) -> Dict:
+        cumulative, buckets = 0, []
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return {'count': self.count, 'sum': self.sum, 'mean': self.sum / self.count if self.count else 0.0,
+                'p50': self.quantile(0.5), 'p99': self.quantile(0.99), 'buckets': buckets}
+
+_counters: Dict[str, float] = {}
+_histograms: Dict[str, Histogram] = {}
+
+def enable() -> None:
+    global ENABLED
+    ENABLED = True
+
+def disable() -> None:
+    global ENABLED
+    ENABLED = False
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+def count(name: str, value: float = 1) -> None:
+    """
+    Bir sayacı artırır; ölçüm kapalıysa hiçbir şey yapmaz.
+    """
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+def observe(name: str, seconds: float) -> None:
+    """
+    Bir süreyi histograma ekler ve kayıtlı kancaları çağırır.
+    """
+    if not ENABLED:
+        return
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.observe(seconds)
+    for hook in _hooks:
+        hook(name, seconds)
+
+class _Timer:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> '_Timer':
+        stack = getattr(_local, 'stages', None)
+        if stack is None:
+            stack = _local.stages = []
+            with _lock:
+                _stacks[threading.get_ident()] = stack
+        stack.append(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        elapsed = time.perf_counter() - self.start
+        _local.stages.pop()
+        observe(self.name, elapsed)
+
+def timer(name: str):
+    """
+    Bir aşamayı süreleyen bağlam yöneticisi.
+
+    Ölçüm açıkken süre `name` histogramına eklenir ve aşama, örnekleyici
+    profiler'ın görebilmesi için iş parçacığının aşama yığınına konur.
+    Kapalıyken paylaşılan boş bir bağlam döner.
+    """
+    return _Timer(name) if ENABLED else _NULL
+
+def active_stages() -> Dict[int, Tuple[str, ...]]:
+    """
+    Her iş parçacığında o an açık olan aşama yığını (dıştan içe).
+
+    Örnekleyici profiler'lar için kancadır: `Sampler` bunu periyodik olarak okur.
+    """
+    alive = {thread.ident for thread in threading.enumerate()}
+    with _lock:
+        for ident in [ident for ident in _stacks if ident not in alive]:
+            del _stacks[ident]
+        return {ident: tuple(stack) for ident, stack in _stacks.items() if stack}
+
+def add_hook(hook: Callable[[str, float], None]) -> None:
+    """
+    Her tamamlanan aşama için (ad, saniye) ile çağrılacak bir fonksiyon ekler (örn. iz/trace aktarımı).
+    """
+    _hooks.append(hook)
+
+def remove_hook(hook: Callable[[str, float], None]) -> None:
+    _hooks.remove(hook)
+
+def snapshot() -> Dict[str, Dict]:
+    """
+    Tüm ölçümlerin anlık kopyası.
+
+    Returns:
+        dict: 'counters' (ad -> değer) ve 'histograms' (ad -> count, sum, mean, p50, p99, buckets).
+    """
+    with _lock:
+        return {'counters': dict(_counters),
+                'histograms': {name: histogram.as_dict() for name, histogram in _histograms.items()}}
+
+def _metric_name(name: str) -> str:
+    return 'pyprocess_' + ''.join(c if c.isalnum() else '_' for c in name)
+
+def to_prometheus() -> str:
+    """
+    Ölçümleri Prometheus metin biçiminde döndürür.
+
+    Sayaçlar `pyprocess_<ad>_total`, histogramlar `pyprocess_<ad>_seconds` olarak yazılır.
+    """
+    data = snapshot()
+    lines = []
+    for name, value in sorted(data['counters'].items()):
+        metric = _metric_name(name) + '_total'
+        lines += [f"# TYPE {metric} counter", f"{metric} {value:g}"]
+    for name, histogram in sorted(data['histograms'].items()):
+        metric = _metric_name(name) + '_seconds'
+        lines.append(f"# TYPE {metric} histogram")
+        for bound, cumulative in histogram['buckets']:
+            lines.append(f'{metric}_bucket{{le="{bound:g}"}} {cumulative}')
+        lines += [f'{metric}_bucket{{le="+Inf"}} {histogram["count"]}',
+                  f"{metric}_sum {histogram['sum']:.9g}", f"{metric}_count {histogram['count']}"]
+    return '\n'.join(lines) + '\n'
+
+def write_prometheus(path: str) -> None:
+    """
+    Prometheus metnini atomik olarak bir dosyaya yazar (node_exporter textfile toplayıcısı için).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(to_prometheus())
+    os.replace(tmp, path)
+
+def serve_prometheus(port: int = 9108, host: str = '127.0.0.1'):
+    """
+    `/metrics` yolunda Prometheus metni sunan bir HTTP sunucusunu arka planda başlatır.
+
+    Returns:
+        http.server.ThreadingHTTPServer: Durdurmak için `shutdown()` çağrılır.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/', '/metrics'):
+                self.send_error(404)
+                return
+            body = to_prometheus().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+class Sampler:
+    """
+    Aşama yığınlarını periyodik olarak örnekleyen hafif profiler.
+
+    Her örnekte açık olan en içteki aşama sayılır; sonuç, süre ölçümünden
+    bağımsız olarak zamanın hangi aşamalarda geçtiğinin oranını verir.
+
+    Kullanım:
+        with metrics.Sampler(interval=0.005) as sampler:
+            ...
+        print(sampler.profile())
+    """
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'Sampler':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def start(self) -> 'Sampler':
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def _run(self) -> None:
+        while not self.stop_event.wait(self.interval):
+            for stack in active_stages().values():
+                self.samples[stack[-1]] += 1
+
+    def profile(self) -> Dict[str, float]:
+        # Aşama -> örneklerin oranı.
+        total = sum(self.samples.values())
+        return {stage: n / total for stage, n in self.samples.most_common()} if total else {}
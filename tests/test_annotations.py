@@ -0,0 +1,187 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+
+from pyprocess.convert.annotations import (
+    ImageAnnotation,
+    convert_dataset,
+    convert_dataset_parallel,
+    iter_coco,
+    iter_yolo,
+    iter_voc,
+    write_coco,
+    write_voc,
+    write_yolo
+)
+from pyprocess.convert.annotations.coco import JsonStream
+
+class TestDatasetConversion(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        self.labels = os.path.join(self.root, 'labels')
+        os.makedirs(self.labels)
+        self.sizes = {'a': (200, 100), 'b': (640, 480), 'c': (320, 240)}
+        with open(os.path.join(self.labels, 'a.txt'), 'w') as file:
+            file.write("0 0.5 0.5 0.5 0.5\n1 0.25 0.25 0.5 0.5\n")
+        with open(os.path.join(self.labels, 'b.txt'), 'w') as file:
+            file.write("1 0.5 0.5 1.0 1.0\n")
+        open(os.path.join(self.labels, 'c.txt'), 'w').close()
+        self.classes = ['cat', 'dog']
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_yolo_coco_voc_roundtrip(self):
+        coco_path = os.path.join(self.root, 'coco.json')
+        stats = convert_dataset(self.labels, 'yolo', coco_path, 'coco', size_of=self.sizes, classes=self.classes)
+        self.assertEqual(stats, {'images': 3, 'boxes': 3, 'invalid': 0})
+        with open(coco_path) as file:
+            data = json.load(file)
+        self.assertEqual(data['annotations'][0]['bbox'], [50.0, 25.0, 100.0, 50.0])
+        self.assertEqual([c['name'] for c in data['categories']], self.classes)
+
+        voc_dir = os.path.join(self.root, 'voc')
+        convert_dataset(coco_path, 'coco', voc_dir, 'voc')
+        yolo_dir = os.path.join(self.root, 'yolo')
+        convert_dataset(voc_dir, 'voc', yolo_dir, 'yolo', classes=self.classes)
+
+        original = list(iter_yolo(self.labels, self.sizes, self.classes))
+        restored = list(iter_yolo(yolo_dir, self.sizes, self.classes))
+        self.assertEqual([r.labels for r in original], [r.labels for r in restored])
+        for a, b in zip(original, restored):
+            np.testing.assert_allclose(a.boxes, b.boxes, atol=1e-3)
+
+    def test_yolo_roundtrip_keeps_class_ids(self):
+        with open(os.path.join(self.labels, 'a.txt'), 'w') as file:
+            file.write("5 0.5 0.5 0.5 0.5\n2 0.25 0.25 0.5 0.5\n")
+        yolo_dir = os.path.join(self.root, 'yolo')
+        convert_dataset(self.labels, 'yolo', yolo_dir, 'yolo', size_of=self.sizes)
+        with open(os.path.join(yolo_dir, 'a.txt')) as file:
+            self.assertEqual([line.split()[0] for line in file], ['5', '2'])
+        with open(os.path.join(yolo_dir, 'b.txt')) as file:
+            self.assertEqual(file.read().split()[0], '1')
+        with open(os.path.join(yolo_dir, 'classes.txt')) as file:
+            self.assertEqual(file.read().split(), ['0', '1', '2', '3', '4', '5'])
+
+    def test_coco_bucketed_grouping(self):
+        coco_path = os.path.join(self.root, 'coco.json')
+        convert_dataset(self.labels, 'yolo', coco_path, 'coco', size_of=self.sizes, classes=self.classes)
+        in_memory = list(iter_coco(coco_path))
+        bucketed = list(iter_coco(coco_path, bucket_bytes=64))
+        self.assertEqual(sorted(r.file_name for r in in_memory), sorted(r.file_name for r in bucketed))
+        by_name = {r.file_name: r for r in bucketed}
+        for record in in_memory:
+            np.testing.assert_array_equal(record.boxes, by_name[record.file_name].boxes)
+
+    def test_voc_reader(self):
+        voc_dir = os.path.join(self.root, 'voc')
+        convert_dataset(self.labels, 'yolo', voc_dir, 'voc', size_of=self.sizes, classes=self.classes)
+        records = list(iter_voc(voc_dir))
+        self.assertEqual([r.file_name for r in records], ['a.jpg', 'b.jpg', 'c.jpg'])
+        np.testing.assert_array_equal(records[1].boxes, [[0, 0, 640, 480]])
+
+    def test_parallel_matches_serial(self):
+        serial_path = os.path.join(self.root, 'serial.json')
+        parallel_path = os.path.join(self.root, 'parallel.json')
+        convert_dataset(self.labels, 'yolo', serial_path, 'coco', size_of=self.sizes, classes=self.classes)
+        seen = []
+        stats = convert_dataset_parallel(self.labels, 'yolo', parallel_path, 'coco', size_of=self.sizes,
+                                         classes=self.classes, workers=2, chunk_size=1,
+                                         progress=lambda p: seen.append(p.shards_done))
+        with open(serial_path) as a, open(parallel_path) as b:
+            self.assertEqual(a.read(), b.read())
+        self.assertEqual(seen, [1, 2, 3])
+        self.assertEqual((stats['images'], stats['boxes']), (3, 3))
+
+        voc_dir = os.path.join(self.root, 'voc')
+        convert_dataset_parallel(serial_path, 'coco', voc_dir, 'voc', workers=2, chunk_size=2)
+        self.assertEqual(len(list(iter_voc(voc_dir))), 3)
+
+    def test_label_files_are_written_atomically(self):
+        records = list(iter_yolo(self.labels, self.sizes, self.classes))
+        out_dir = os.path.join(self.root, 'out')
+        with mock.patch('pyprocess.convert.annotations.record.os.replace', side_effect=OSError):
+            for writer in (write_yolo, write_voc):
+                with self.assertRaises(OSError):
+                    writer(records, out_dir, self.classes)
+        self.assertFalse([name for name in os.listdir(out_dir) if not name.endswith('.tmp')])
+
+        write_yolo(records, out_dir, self.classes, write_classes=False)
+        self.assertEqual(sorted(name for name in os.listdir(out_dir) if name.endswith('.txt')),
+                         ['a.txt', 'b.txt', 'c.txt'])
+        yolo_dir = os.path.join(self.root, 'yolo')
+        convert_dataset_parallel(self.labels, 'yolo', yolo_dir, 'yolo', size_of=self.sizes,
+                                 classes=self.classes, workers=2, chunk_size=1)
+        self.assertEqual(sorted(os.listdir(yolo_dir)), ['a.txt', 'b.txt', 'c.txt', 'classes.txt'])
+
+    def test_interrupted_coco_leaves_no_output(self):
+        coco_path = os.path.join(self.root, 'coco.json')
+        records = iter_yolo(self.labels, self.sizes, self.classes)
+
+        def interrupted():
+            yield next(records)
+            raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            write_coco(interrupted(), coco_path, self.classes)
+        self.assertEqual(os.listdir(self.root), ['labels'])
+
+        with open(os.path.join(self.labels, 'c.txt'), 'w') as file:
+            file.write("0 0.5 0.5 0.0 0.5\n")
+        with self.assertRaises(ValueError):
+            convert_dataset_parallel(self.labels, 'yolo', coco_path, 'coco', size_of=self.sizes,
+                                     classes=self.classes, workers=2, chunk_size=1)
+        self.assertEqual(os.listdir(self.root), ['labels'])
+
+    def test_validation_modes(self):
+        with open(os.path.join(self.labels, 'c.txt'), 'w') as file:
+            file.write("0 0.95 0.5 0.2 0.2\n1 0.5 0.5 0.0 0.5\n")
+        with self.assertRaises(ValueError):
+            convert_dataset(self.labels, 'yolo', os.path.join(self.root, 'strict'), 'yolo',
+                            size_of=self.sizes, classes=self.classes)
+
+        coco_path = os.path.join(self.root, 'clip.json')
+        stats = convert_dataset(self.labels, 'yolo', coco_path, 'coco', size_of=self.sizes,
+                                classes=self.classes, validation='clip')
+        self.assertEqual(stats, {'images': 3, 'boxes': 4, 'invalid': 1})
+        with open(coco_path) as file:
+            data = json.load(file)
+        self.assertEqual(data['annotations'][-1]['bbox'], [272.0, 96.0, 48.0, 48.0])
+
+        parallel_path = os.path.join(self.root, 'parallel.json')
+        stats = convert_dataset_parallel(self.labels, 'yolo', parallel_path, 'coco', size_of=self.sizes,
+                                         classes=self.classes, workers=2, chunk_size=1, validation='clip')
+        self.assertEqual((stats['boxes'], stats['invalid']), (4, 1))
+        with open(coco_path) as a, open(parallel_path) as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_voc_strict_rejects_invalid_boxes(self):
+        voc_dir = os.path.join(self.root, 'voc')
+        for boxes in ([[50, 10, 10, 20]], [[0, 0, 500, 500]]):
+            record = ImageAnnotation('bad.jpg', 100, 100, np.array(boxes, float), ['cat'])
+            with self.assertRaises(ValueError):
+                write_voc([record], voc_dir)
+            self.assertFalse(os.path.exists(os.path.join(voc_dir, 'bad.xml')))
+            stats = write_voc([record], voc_dir, validation='trusted')
+            self.assertEqual(stats['boxes'], 1)
+            os.remove(os.path.join(voc_dir, 'bad.xml'))
+
+    def test_json_stream_small_chunks(self):
+        data = {'info': {'x': [1, 2]}, 'images': [{'id': i, 'v': 12345.5} for i in range(20)]}
+        stream = JsonStream(io.StringIO(json.dumps(data)), chunk_size=3)
+        stream.expect('{')
+        self.assertEqual(stream.decode(), 'info')
+        stream.expect(':')
+        self.assertEqual(stream.decode(), {'x': [1, 2]})
+        stream.expect(',')
+        self.assertEqual(stream.decode(), 'images')
+        stream.expect(':')
+        self.assertEqual(list(stream.iter_array()), data['images'])
+
+if __name__ == '__main__':
+    unittest.main()
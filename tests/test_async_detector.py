@@ -0,0 +1,106 @@
+import asyncio
+import time
+import unittest
+import numpy as np
+
+from pyprocess.mp_utils import AsyncHandDetector
+
+class FakeDetector:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.busy = False
+        self.overlapped = False
+        self.calls = 0
+
+    def find_hands(self, img, draw=True):
+        if self.busy:
+            self.overlapped = True
+        self.busy = True
+        time.sleep(self.delay)
+        self.calls += 1
+        self.busy = False
+        return img, [{'label': 'Right', 'value': int(img[0, 0, 0])}]
+
+    def process(self, img, copy=True):
+        self.value = int(img[0, 0, 0])
+        return img
+
+    def arrays(self):
+        return np.full((1, 21, 3), self.value, np.float32), np.array([1], np.int8), np.array([0.9], np.float32)
+
+def frame(value):
+    return np.full((4, 4, 3), value, dtype=np.uint8)
+
+class FakeCapture:
+    def __init__(self, n):
+        self.n = n
+        self.i = 0
+
+    def read(self):
+        if self.i >= self.n:
+            return False, None
+        self.i += 1
+        return True, frame(self.i)
+
+class TestAsyncHandDetector(unittest.TestCase):
+    def test_concurrent_calls_do_not_block_loop(self):
+        detectors = [FakeDetector(delay=0.05), FakeDetector(delay=0.05)]
+
+        async def main():
+            ticks = 0
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.005)
+                    ticks += 1
+
+            async with AsyncHandDetector(detectors) as detector:
+                tick_task = asyncio.ensure_future(ticker())
+                results = await asyncio.gather(*(detector.afind_hands(frame(i)) for i in range(6)))
+                arrays = await detector.aprocess(frame(9))
+                tick_task.cancel()
+            return ticks, results, arrays
+
+        start = time.perf_counter()
+        ticks, results, arrays = asyncio.run(main())
+        elapsed = time.perf_counter() - start
+        self.assertEqual([hands[0]['value'] for _, hands in results], list(range(6)))
+        self.assertEqual(arrays[0][0, 0, 0], 9)
+        self.assertGreater(ticks, 10)
+        self.assertLess(elapsed, 0.3)
+        self.assertFalse(any(d.overlapped for d in detectors))
+        self.assertEqual(sum(d.calls for d in detectors), 6)
+
+    def test_stream_keeps_order_and_bounds_in_flight(self):
+        async def main():
+            async with AsyncHandDetector([FakeDetector(0.01) for _ in range(3)]) as detector:
+                from_capture = [hands[0]['value'] async for _, hands in detector.stream(FakeCapture(10))]
+                from_list = [hands[0]['value'] async for _, hands in detector.stream([frame(i) for i in range(5)])]
+            return from_capture, from_list
+
+        from_capture, from_list = asyncio.run(main())
+        self.assertEqual(from_capture, list(range(1, 11)))
+        self.assertEqual(from_list, list(range(5)))
+
+    def test_cancellation_returns_detector_to_pool(self):
+        slow = FakeDetector(delay=0.1)
+
+        async def main():
+            async with AsyncHandDetector([slow]) as detector:
+                running = asyncio.ensure_future(detector.afind_hands(frame(1)))
+                waiting = asyncio.ensure_future(detector.afind_hands(frame(2)))
+                await asyncio.sleep(0.02)
+                running.cancel()
+                waiting.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await running
+                _, hands = await asyncio.wait_for(detector.afind_hands(frame(3)), timeout=1)
+            return hands
+
+        hands = asyncio.run(main())
+        self.assertEqual(hands[0]['value'], 3)
+        self.assertEqual(slow.calls, 2)
+        self.assertFalse(slow.overlapped)
+
+if __name__ == '__main__':
+    unittest.main()
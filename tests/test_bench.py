@@ -0,0 +1,70 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from pyprocess.bench import compare, load_report, main, measure, run_benchmarks, save_report
+
+class TestBench(unittest.TestCase):
+    def test_measure_reports_per_call_time(self):
+        calls = []
+        result = measure(lambda: calls.append(1), repeat=3, min_time=0.001, items=10)
+        self.assertGreaterEqual(len(calls), 1 + 3 * result['number'])
+        self.assertGreater(result['items_per_s'], result['median_s'])
+        self.assertLessEqual(result['min_s'], result['median_s'])
+
+    def test_run_and_compare(self):
+        report = run_benchmarks(['convert'], quick=True, repeat=2)
+        self.assertIn('convert.pascal_to_yolo.batch[n=1000]', report['results'])
+        self.assertEqual(report['skipped'], {})
+        slower = json.loads(json.dumps(report))
+        name = 'convert.coco_to_pascal.scalar[n=1000]'
+        slower['results'][name]['median_s'] *= 2
+        rows = compare(slower, report, threshold=0.5)
+        self.assertEqual(rows[0]['name'], name)
+        self.assertTrue(rows[0]['regression'])
+        self.assertEqual(sum(row['regression'] for row in rows), 1)
+        self.assertFalse(any(row['missing'] for row in rows))
+
+        partial = json.loads(json.dumps(report))
+        del partial['results'][name]
+        rows = compare(partial, report)
+        self.assertEqual((rows[0]['name'], rows[0]['missing'], rows[0]['ratio']), (name, True, None))
+        self.assertEqual(len(rows), len(report['results']))
+        with self.assertRaises(ValueError):
+            run_benchmarks(['missing'])
+
+    def test_cli_writes_json_and_flags_regressions(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = os.path.join(tmp, 'baseline.json')
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(['--suite', 'convert', '--quick', '--repeat', '2', '--output', baseline]), 0)
+            report = load_report(baseline)
+            self.assertTrue(report['meta']['quick'])
+            for result in report['results'].values():
+                result['median_s'] /= 100
+            save_report(report, baseline)
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                status = main(['--suite', 'convert', '--quick', '--repeat', '2', '--compare', baseline])
+            self.assertEqual(status, 1)
+            self.assertIn('REGRESSION', out.getvalue())
+
+            report['meta']['quick'] = False
+            for result in report['results'].values():
+                result['median_s'] *= 1000
+            report['results']['geometry.skipped'] = {'median_s': 1.0}
+            save_report(report, baseline)
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                status = main(['--suite', 'convert', '--quick', '--repeat', '2', '--compare', baseline])
+            self.assertEqual(status, 1)
+            self.assertIn('geometry.skipped', out.getvalue())
+            self.assertIn('1 missing', out.getvalue())
+            self.assertIn('quick run against a full baseline', out.getvalue())
+            self.assertNotIn('REGRESSION', out.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
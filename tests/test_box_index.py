@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+
+from pyprocess.boxes import BoxIndex, box_distance
+
+class TestBoxIndex(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        xy = rng.uniform(0, 1000, (500, 2))
+        self.boxes = np.hstack([xy, xy + rng.uniform(1, 60, (500, 2))])
+        qxy = rng.uniform(0, 1000, (50, 2))
+        self.queries = np.hstack([qxy, qxy + rng.uniform(1, 150, (50, 2))])
+        self.index = BoxIndex(self.boxes, node_size=8)
+
+    def brute_pairs(self, predicate):
+        pairs = [(q, i) for q in range(len(self.queries)) for i in range(len(self.boxes))
+                 if predicate(self.queries[q], self.boxes[i])]
+        return [p[0] for p in pairs], [p[1] for p in pairs]
+
+    def test_overlaps(self):
+        q_idx, item = self.index.query_overlaps(self.queries, chunk_size=16)
+        expected = self.brute_pairs(lambda q, b: q[0] < b[2] and b[0] < q[2] and q[1] < b[3] and b[1] < q[3])
+        self.assertEqual((q_idx.tolist(), item.tolist()), expected)
+
+    def test_containment(self):
+        q_idx, item = self.index.query_within(self.queries)
+        expected = self.brute_pairs(lambda q, b: q[0] <= b[0] and q[1] <= b[1] and b[2] <= q[2] and b[3] <= q[3])
+        self.assertEqual((q_idx.tolist(), item.tolist()), expected)
+
+        point = self.boxes[[7]][:, [0, 1, 0, 1]] + 0.5
+        _, item = self.index.query_containing(point)
+        self.assertIn(7, item.tolist())
+
+    def test_nearest(self):
+        indices, distances = self.index.nearest(self.queries, k=3)
+        for q in range(len(self.queries)):
+            dist = box_distance(np.repeat(self.queries[q:q + 1], len(self.boxes), 0), self.boxes)
+            np.testing.assert_allclose(distances[q], np.sort(dist)[:3])
+            np.testing.assert_allclose(dist[indices[q]], distances[q])
+
+    def test_small_and_coco(self):
+        coco = np.array([[0, 0, 10, 10], [20, 20, 5, 5]])
+        index = BoxIndex(coco, fmt='coco')
+        q_idx, item = index.query_overlaps([[5, 5, 10, 10]])
+        self.assertEqual(item.tolist(), [0])
+        indices, distances = index.nearest([[0, 0, 1, 1]], k=3)
+        self.assertEqual(indices.tolist(), [[0, 1, -1]])
+        self.assertTrue(np.isinf(distances[0, 2]))
+
+    def test_nearest_non_finite(self):
+        queries = [[np.nan, 0, 1, 1], [0, 0, np.inf, 1], [5, 5, 6, 6]]
+        indices, distances = self.index.nearest(queries, k=2)
+        self.assertEqual(indices[:2].tolist(), [[-1, -1], [-1, -1]])
+        self.assertTrue(np.isinf(distances[:2]).all())
+        self.assertTrue((indices[2] >= 0).all())
+
+        boxes = np.vstack([self.boxes[:3], [[np.nan, 0, 1, 1]]])
+        indices, distances = BoxIndex(boxes).nearest([[0, 0, 1, 1]], k=4)
+        self.assertEqual(sorted(indices[0, :3].tolist()), [0, 1, 2])
+        self.assertEqual(indices[0, 3], -1)
+
+if __name__ == '__main__':
+    unittest.main()
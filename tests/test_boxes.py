@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from pyprocess.boxes import (
+    as_pascal,
+    box_iou,
+    generalized_box_iou,
+    distance_box_iou,
+    nms,
+    batched_nms,
+    soft_nms
+)
+
+def reference_iou(a, b):
+    ix = max(0.0, min(a[2], b[2]) - max(a[0], b[0]))
+    iy = max(0.0, min(a[3], b[3]) - max(a[1], b[1]))
+    inter = ix * iy
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union
+
+class TestBoxOps(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        xy = rng.uniform(0, 80, (40, 2))
+        self.boxes = np.hstack([xy, xy + rng.uniform(5, 30, (40, 2))])
+        self.scores = rng.uniform(0, 1, 40)
+
+    def test_iou_matches_reference(self):
+        iou = box_iou(self.boxes, self.boxes[:10])
+        expected = [[reference_iou(a, b) for b in self.boxes[:10]] for a in self.boxes]
+        np.testing.assert_allclose(iou, expected)
+        np.testing.assert_allclose(np.diag(iou[:10]), 1.0)
+
+    def test_formats_and_chunks(self):
+        coco = np.hstack([self.boxes[:, :2], self.boxes[:, 2:] - self.boxes[:, :2]])
+        np.testing.assert_allclose(box_iou(coco, coco, fmt='coco', chunk_size=7), box_iou(self.boxes, self.boxes))
+        with tempfile.TemporaryDirectory() as tmp:
+            out = np.memmap(os.path.join(tmp, 'iou.dat'), dtype=np.float32, mode='w+', shape=(40, 40))
+            box_iou(self.boxes, self.boxes, out=out, chunk_size=16)
+            np.testing.assert_allclose(out, box_iou(self.boxes, self.boxes), rtol=1e-6)
+
+    def test_giou_and_diou(self):
+        a = np.array([[0, 0, 10, 10]])
+        b = np.array([[20, 0, 30, 10]])
+        self.assertAlmostEqual(generalized_box_iou(a, b)[0, 0], -1 / 3)
+        self.assertAlmostEqual(distance_box_iou(a, b)[0, 0], -400 / 1000)
+        self.assertAlmostEqual(generalized_box_iou(a, a)[0, 0], 1.0)
+
+    def test_nms(self):
+        keep = nms(self.boxes, self.scores, 0.3)
+        self.assertTrue(np.all(np.diff(self.scores[keep]) <= 0))
+        iou = box_iou(self.boxes[keep], self.boxes[keep])
+        np.fill_diagonal(iou, 0)
+        self.assertLessEqual(iou.max(), 0.3)
+        suppressed = np.setdiff1d(np.arange(40), keep)
+        self.assertTrue(np.all(box_iou(self.boxes[suppressed], self.boxes[keep]).max(axis=1) > 0.3))
+
+    def test_batched_nms(self):
+        boxes = np.array([[0, 0, 10, 10], [1, 1, 10, 10], [0, 0, 10, 10]])
+        scores = np.array([0.9, 0.8, 0.7])
+        np.testing.assert_array_equal(batched_nms(boxes, scores, [0, 0, 1], 0.5), [0, 2])
+        np.testing.assert_array_equal(nms(boxes, scores, 0.5), [0])
+
+    def test_soft_nms(self):
+        boxes = np.array([[0, 0, 10, 10], [1, 1, 10, 10], [50, 50, 60, 60]])
+        keep, scores = soft_nms(boxes, [0.9, 0.8, 0.7])
+        self.assertEqual(sorted(keep.tolist()), [0, 1, 2])
+        self.assertLess(scores[list(keep).index(1)], 0.8)
+        keep, _ = soft_nms(boxes, [0.9, 0.8, 0.7], method='linear', iou_threshold=0.5, score_threshold=0.5)
+        np.testing.assert_array_equal(keep, [0, 2])
+        keep, _ = soft_nms(boxes, [0.9, 0.0005, 0.7])
+        np.testing.assert_array_equal(keep, [0, 2])
+
+    def test_formats_are_not_validated_by_default(self):
+        coco = np.array([[-0.5, 2, 10, 10], [0, 2, 10, 10]])
+        np.testing.assert_array_equal(nms(coco, [0.9, 0.8], 0.5, fmt='coco'), [0])
+        np.testing.assert_array_equal(as_pascal(coco, 'coco'), [[-0.5, 2, 9.5, 12], [0, 2, 10, 12]])
+        for fmt, boxes in (('pascal', [[10, 0, 5, 5]]), ('coco', [[-1, 0, 5, 5]])):
+            with self.assertRaises(ValueError):
+                as_pascal(boxes, fmt, validation='strict')
+        np.testing.assert_array_equal(as_pascal([[-1, 0, 5, 5]], 'pascal', validation='clip'), [[0, 0, 5, 5]])
+
+if __name__ == '__main__':
+    unittest.main()
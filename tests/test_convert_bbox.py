@@ -0,0 +1,184 @@
+import unittest
+import numpy as np
+
+from pyprocess.convert import (
+    convert_bbox,
+    convert_bbox_batch,
+    get_plan,
+    register_format,
+    pascal_to_coco_batch,
+    yolo_to_pascal_batch
+)
+from pyprocess.convert.bboxes import plan as plan_module
+
+class TestConvertBboxBatch(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.size = (640, 480)
+        x_min = rng.uniform(0, 300, 200)
+        y_min = rng.uniform(0, 200, 200)
+        self.pascal = np.stack([x_min, y_min,
+                                x_min + rng.uniform(1, 300, 200),
+                                y_min + rng.uniform(1, 250, 200)], axis=1)
+
+    def assert_matches_scalar(self, from_format, to_format, boxes, **kwargs):
+        result = convert_bbox_batch(from_format, to_format, boxes, **kwargs)
+        expected = [convert_bbox(from_format, to_format, *map(float, row), **kwargs) for row in boxes]
+        np.testing.assert_array_equal(result, np.array(expected))
+        return result
+
+    def test_matches_scalar_functions(self):
+        coco = self.assert_matches_scalar('pascal', 'coco', self.pascal)
+        yolo = self.assert_matches_scalar('pascal', 'yolo', self.pascal, size=self.size)
+        self.assert_matches_scalar('coco', 'pascal', coco)
+        self.assert_matches_scalar('coco', 'yolo', coco, size=self.size)
+        self.assert_matches_scalar('yolo', 'coco', yolo, size=self.size)
+        self.assert_matches_scalar('yolo', 'pascal', yolo, size=self.size)
+
+    def test_per_box_size(self):
+        sizes = np.tile([[640, 480]], (len(self.pascal), 1))
+        shared = convert_bbox_batch('pascal', 'yolo', self.pascal, size=self.size)
+        per_box = convert_bbox_batch('pascal', 'yolo', self.pascal, size=sizes)
+        np.testing.assert_array_equal(shared, per_box)
+
+    def test_out_buffer(self):
+        out = np.empty_like(self.pascal)
+        result = pascal_to_coco_batch(self.pascal, out=out)
+        self.assertIs(result, out)
+
+        in_place = self.pascal.copy()
+        yolo = convert_bbox_batch('pascal', 'yolo', self.pascal, size=self.size)
+        yolo_to_pascal_batch(yolo, self.size, out=yolo)
+        np.testing.assert_allclose(yolo, in_place)
+
+    def test_invalid_rows_raise(self):
+        boxes = self.pascal.copy()
+        boxes[5, 2] = 1000
+        with self.assertRaises(ValueError):
+            convert_bbox_batch('pascal', 'yolo', boxes, size=self.size)
+        with self.assertRaises(ValueError):
+            convert_bbox_batch('coco', 'pascal', [[-1, 0, 10, 10]])
+        with self.assertRaises(TypeError):
+            convert_bbox_batch('pascal', 'coco', [[0, 0, 10]])
+        with self.assertRaises(ValueError):
+            convert_bbox_batch('pascal', 'unknown', self.pascal)
+
+    def test_validation_modes(self):
+        boxes = self.pascal.copy()
+        boxes[3] = [-5, 10, 700, 50]
+        boxes[7] = [20, 20, 10, 30]
+        with self.assertRaises(ValueError):
+            convert_bbox_batch('pascal', 'yolo', boxes, size=self.size)
+
+        yolo, invalid = convert_bbox_batch('pascal', 'yolo', boxes, size=self.size, return_mask=True)
+        self.assertEqual(np.flatnonzero(invalid).tolist(), [3, 7])
+        self.assertTrue(np.isnan(yolo[invalid]).all())
+        np.testing.assert_array_equal(yolo[~invalid],
+                                      convert_bbox_batch('pascal', 'yolo', boxes[~invalid], size=self.size))
+
+        clipped, invalid = convert_bbox_batch('pascal', 'yolo', boxes, size=self.size,
+                                              validation='clip', return_mask=True)
+        self.assertEqual(np.flatnonzero(invalid).tolist(), [7])
+        self.assertEqual(clipped[3].tolist(), convert_bbox('pascal', 'yolo', 0, 10, 640, 50, size=self.size))
+        self.assertEqual(clipped[3].tolist(),
+                         convert_bbox('pascal', 'yolo', -5, 10, 700, 50, size=self.size, validation='clip'))
+        np.testing.assert_array_equal(clipped[~invalid][:3], convert_bbox_batch('pascal', 'yolo', self.pascal[:3],
+                                                                                  size=self.size))
+
+        trusted = convert_bbox_batch('pascal', 'coco', boxes, validation='trusted')
+        self.assertEqual(trusted[7].tolist(), [20, 20, -10, 10])
+        self.assertEqual(convert_bbox('coco', 'pascal', -2, 0, 10, 5, validation='trusted'), [-2, 0, 8, 5])
+        self.assertEqual(convert_bbox('coco', 'pascal', -2, 0, 10, 5, validation='clip'), [0, 0, 8, 5])
+        with self.assertRaises(ValueError):
+            convert_bbox('coco', 'pascal', 0, 0, 1, 1, validation='lenient')
+
+class TestConversionPlan(unittest.TestCase):
+    def test_plan_is_cached(self):
+        self.assertIs(get_plan('pascal', 'yolo'), get_plan('pascal', 'yolo'))
+        self.assertEqual(len(get_plan('coco', 'yolo').steps), 1)
+        self.assertEqual(len(get_plan('yolo', 'cxcywh').steps), 2)
+
+    def test_identity_and_bound_size(self):
+        self.assertEqual(convert_bbox('coco', 'coco', 1, 2, 3, 4), [1, 2, 3, 4])
+        plan = get_plan('pascal', 'yolo', size=(200, 200))
+        self.assertEqual(plan(50, 50, 150, 150), [0.5, 0.5, 0.5, 0.5])
+        self.assertEqual(convert_bbox('pascal', 'yolo', 50, 50, 150, 150, (200, 200)), [0.5, 0.5, 0.5, 0.5])
+
+    def test_identity_plans_validate(self):
+        with self.assertRaises(ValueError):
+            convert_bbox('pascal', 'pascal', 10, 10, 5, 5)
+        with self.assertRaises(ValueError):
+            convert_bbox('coco', 'coco', 0, 0, 50, 50, size=(40, 40))
+        self.assertEqual(convert_bbox('yolo', 'yolo', 0.5, 0.5, 1.2, 0.5, validation='clip'), [0.5, 0.5, 1.0, 0.5])
+        self.assertEqual(convert_bbox('pascal', 'pascal', 10, 10, 5, 5, validation='trusted'), [10, 10, 5, 5])
+
+        np.testing.assert_array_equal(convert_bbox_batch('pascal', 'pascal', [[-10, -10, 5, 5]], validation='clip'),
+                                      [[0, 0, 5, 5]])
+        np.testing.assert_array_equal(convert_bbox_batch('coco', 'coco', [[-10, 0, 30, 20]], validation='clip',
+                                                         size=(15, 15)), [[0, 0, 15, 15]])
+        for fmt, bad in (('pascal', [10, 10, 5, 5]), ('coco', [0, 0, -1, 5]), ('yolo', [2, 2, 5, 5])):
+            boxes = [[0.25, 0.25, 0.5, 0.5], bad]
+            with self.assertRaises(ValueError):
+                convert_bbox_batch(fmt, fmt, boxes)
+            out, mask = convert_bbox_batch(fmt, fmt, boxes, return_mask=True)
+            self.assertEqual(mask.tolist(), [False, True])
+            self.assertEqual(out[0].tolist(), [0.25, 0.25, 0.5, 0.5])
+            self.assertTrue(np.isnan(out[1]).all())
+            np.testing.assert_array_equal(convert_bbox_batch(fmt, fmt, boxes, validation='trusted'), boxes)
+
+    def test_new_formats(self):
+        self.assertEqual(convert_bbox('pascal', 'cxcywh', 50, 50, 150, 100), [100.0, 75.0, 100, 50])
+        self.assertEqual(convert_bbox('yolo', 'albumentations', 0.5, 0.5, 0.5, 0.5, size=(200, 100)),
+                         [0.25, 0.25, 0.75, 0.75])
+        self.assertEqual(convert_bbox('pascal_norm', 'coco', 0.25, 0.25, 0.75, 0.75, size=(200, 100)),
+                         [50.0, 25.0, 100.0, 50.0])
+        with self.assertRaises(ValueError):
+            convert_bbox('cxcywh', 'pascal', 10, 10, 0, 5)
+
+    def test_batch_chain_matches_scalar(self):
+        rng = np.random.default_rng(3)
+        xy = rng.uniform(0, 100, (50, 2))
+        pascal = np.hstack([xy, xy + rng.uniform(1, 100, (50, 2))])
+        size = (300, 300)
+        for fmt in ('cxcywh', 'pascal_norm'):
+            result = convert_bbox_batch('coco', fmt, convert_bbox_batch('pascal', 'coco', pascal), size=size)
+            expected = [convert_bbox('coco', fmt, *row, size=size)
+                        for row in convert_bbox_batch('pascal', 'coco', pascal).tolist()]
+            np.testing.assert_array_equal(result, expected)
+
+    def test_register_format(self):
+        register_format('xywh_swapped',
+                        lambda y, x, h, w: [x, y, x + w, y + h],
+                        lambda x1, y1, x2, y2: [y1, x1, y2 - y1, x2 - x1])
+        self.assertEqual(convert_bbox('xywh_swapped', 'coco', 2, 1, 4, 3), [1, 2, 3, 4])
+        np.testing.assert_array_equal(convert_bbox_batch('coco', 'xywh_swapped', [[1, 2, 3, 4]]), [[2, 1, 4, 3]])
+
+    def test_list_size_is_accepted(self):
+        plan = get_plan('pascal', 'yolo', size=[200, 200])
+        self.assertIs(plan, get_plan('pascal', 'yolo', size=(200, 200)))
+        self.assertEqual(plan(50, 50, 150, 150), [0.5, 0.5, 0.5, 0.5])
+
+    def test_overriding_builtin_format(self):
+        saved = (dict(plan_module._FORMATS), dict(plan_module._DIRECT), dict(plan_module._IDENTITY))
+
+        def restore():
+            for current, original in zip((plan_module._FORMATS, plan_module._DIRECT, plan_module._IDENTITY), saved):
+                current.clear()
+                current.update(original)
+            plan_module._resolve_steps.cache_clear()
+            plan_module._cached_plan.cache_clear()
+        self.addCleanup(restore)
+
+        get_plan('pascal', 'coco')
+        # COCO boxes stored as (x_min, y_min, width, height) in tenths of a pixel
+        register_format('coco',
+                        lambda x, y, w, h: [x / 10, y / 10, (x + w) / 10, (y + h) / 10],
+                        lambda x1, y1, x2, y2: [x1 * 10, y1 * 10, (x2 - x1) * 10, (y2 - y1) * 10])
+        self.assertEqual(convert_bbox('pascal', 'coco', 1, 2, 3, 4), [10, 20, 20, 20])
+        self.assertEqual(convert_bbox('coco', 'pascal', 10, 20, 20, 20), [1, 2, 3, 4])
+        np.testing.assert_array_equal(convert_bbox_batch('coco', 'coco', [[10, 20, 20, 20]]), [[10, 20, 20, 20]])
+        with self.assertRaises(ValueError):
+            register_format('pascal', lambda *box: list(box), lambda *box: list(box))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,20 @@
 # pyprocess/tests/test_hand_detector.py
 
 import unittest
+from types import SimpleNamespace
 import cv2
 import numpy as np
 from pyprocess.mp_utils import HandDetector
 
+def fake_results(seed, hands=2):
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(-0.05, 1.0, (hands, 21, 3)).astype(np.float32)
+    landmarks = [SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in hand])
+                 for hand in points]
+    handedness = [SimpleNamespace(classification=[SimpleNamespace(label=label, score=0.8)])
+                  for label in ['Left', 'Right'][:hands]]
+    return SimpleNamespace(multi_hand_landmarks=landmarks, multi_handedness=handedness)
+
 class TestHandDetector(unittest.TestCase):
     def setUp(self):
         self.detector = HandDetector()
@@ -26,6 +36,25 @@ class TestHandDetector(unittest.TestCase):
         self.assertIsNotNone(result_image)
         self.assertEqual(result_image.shape, dummy_image.shape)
 
+    def test_zero_copy_modes(self):
+        image = np.random.default_rng(0).integers(0, 255, (240, 320, 3), dtype=np.uint8)
+        original = image.copy()
+
+        result, _ = self.detector.find_hands(image, draw=False)
+        self.assertIs(result, image)
+        buffer = self.detector._rgb_buffers[image.shape]
+        self.detector.find_hands(image, draw=False)
+        self.assertIs(self.detector._rgb_buffers[image.shape], buffer)
+
+        result, _ = self.detector.find_hands(image, draw=True)
+        self.assertIsNot(result, image)
+        result, _ = self.detector.find_hands(image, draw=True, inplace=True)
+        self.assertIs(result, image)
+
+        results, copied = self.detector.retrieve(image[:, :, ::-1].copy(), rgb=True)
+        np.testing.assert_array_equal(copied[:, :, ::-1], original)
+        np.testing.assert_array_equal(image, original)
+
     def test_find_position(self):
         # Create a dummy image
         dummy_image = np.zeros((480, 640, 3), dtype=np.uint8)
@@ -38,5 +67,35 @@ class TestHandDetector(unittest.TestCase):
         self.assertIsInstance(lm_list, list)
         # Further checks can be added depending on the expected output
 
+    def test_landmark_arrays_match_loops(self):
+        img = np.zeros((480, 640, 3), dtype=np.uint8)
+        self.detector.results = fake_results(1)
+        landmarks = self.detector.landmarks
+        self.assertEqual(landmarks.shape, (2, 21, 3))
+        self.assertIs(self.detector.arrays()[0], landmarks)
+        self.assertEqual(self.detector.handedness.tolist(), [0, 1])
+
+        for hand_no, hand in enumerate(self.detector.results.multi_hand_landmarks):
+            expected = [[i, int(lm.x * 640), int(lm.y * 480)] for i, lm in enumerate(hand.landmark)]
+            self.assertEqual(self.detector.find_positions(img, hand_no, draw=False), expected)
+            xs = [lm.x for lm in hand.landmark]
+            ys = [lm.y for lm in hand.landmark]
+            x_min, y_min = int(min(xs) * 640) - 10, int(min(ys) * 480) - 10
+            x_max, y_max = int(max(xs) * 640) + 10, int(max(ys) * 480) + 10
+            self.assertEqual(self.detector.get_bounding_box(img, hand_no),
+                             (x_min, y_min, x_max - x_min, y_max - y_min))
+        self.assertIsNone(self.detector.get_bounding_box(img, 2))
+        self.assertEqual(self.detector.bounding_boxes(img).shape, (2, 4))
+
+        distances = self.detector.fingertip_distances(img)
+        tips = self.detector.pixel_landmarks(img)[0, [4, 8, 12, 16, 20]]
+        self.assertEqual(distances.shape, (2, 5, 5))
+        self.assertAlmostEqual(float(distances[0, 0, 1]),
+                               HandDetector.calculate_distance(tips[0], tips[1]), delta=1.5)
+
+        self.detector.results = fake_results(2, hands=0)
+        self.assertEqual(self.detector.landmarks.shape, (0, 21, 3))
+        self.assertEqual(self.detector.find_positions(img, draw=False), [])
+
 if __name__ == '__main__':
     unittest.main()
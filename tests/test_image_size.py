@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import cv2
+import numpy as np
+
+from pyprocess.convert.annotations import iter_yolo
+from pyprocess.convert.annotations import convert_dataset
+from pyprocess.utils.image_size import ImageSizeIndex, read_image_size
+
+class TestImageSize(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = {}
+        for name, (w, h) in {'a.jpg': (64, 48), 'b.png': (30, 70), 'c.bmp': (17, 9), 'p.jpg': (33, 21)}.items():
+            path = os.path.join(self.tmp.name, name)
+            params = [cv2.IMWRITE_JPEG_PROGRESSIVE, 1] if name == 'p.jpg' else []
+            cv2.imwrite(path, np.zeros((h, w, 3), dtype=np.uint8), params)
+            self.paths[name] = (path, (w, h))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_decoded_shape(self):
+        for path, size in self.paths.values():
+            self.assertEqual(tuple(read_image_size(path)), size)
+            h, w = cv2.imread(path).shape[:2]
+            self.assertEqual((w, h), size)
+
+    def test_unsupported_header(self):
+        path = os.path.join(self.tmp.name, 'x.txt')
+        with open(path, 'w') as file:
+            file.write('not an image')
+        with self.assertRaises(ValueError):
+            read_image_size(path)
+
+    def test_truncated_jpeg(self):
+        path, _ = self.paths['a.jpg']
+        with open(path, 'rb') as file:
+            data = file.read()
+        sof = data.index(b'\xff\xc0')
+        for end in (sof + 3, sof + 6):
+            with open(path, 'wb') as file:
+                file.write(data[:end])
+            with self.assertRaises(ValueError):
+                read_image_size(path)
+
+    def test_persistent_cache(self):
+        cache_path = os.path.join(self.tmp.name, 'sizes.json')
+        with ImageSizeIndex(cache_path) as index:
+            sizes = index.directory(self.tmp.name)
+        self.assertEqual(sizes, {'a': (64, 48), 'b': (30, 70), 'c': (17, 9), 'p': (33, 21)})
+
+        index = ImageSizeIndex(cache_path)
+        self.assertEqual(len(index), 4)
+        path, _ = self.paths['a.jpg']
+        self.assertEqual(index.get(path), (64, 48))
+        self.assertFalse(index.dirty)
+
+        cv2.imwrite(path, np.zeros((10, 20, 3), dtype=np.uint8))
+        os.utime(path, ns=(0, 123))
+        np.testing.assert_array_equal(index.get_many([path]), [[20, 10]])
+        self.assertTrue(index.dirty)
+
+    def test_dataset_sizes_from_directory(self):
+        labels = os.path.join(self.tmp.name, 'labels')
+        os.makedirs(labels)
+        with open(os.path.join(labels, 'b.txt'), 'w') as file:
+            file.write("0 0.5 0.5 1.0 1.0\n")
+        records = list(iter_yolo(labels, self.tmp.name))
+        np.testing.assert_array_equal(records[0].boxes, [[0, 0, 30, 70]])
+
+    def test_dataset_conversion_reuses_cache(self):
+        labels = os.path.join(self.tmp.name, 'labels')
+        os.makedirs(labels)
+        with open(os.path.join(labels, 'b.txt'), 'w') as file:
+            file.write("0 0.5 0.5 1.0 1.0\n")
+        dst = os.path.join(self.tmp.name, 'voc')
+        before = sorted(os.listdir(self.tmp.name))
+        convert_dataset(labels, 'yolo', dst, 'voc', size_of=self.tmp.name, classes=['hand'])
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), sorted(before + ['voc']))
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, 'sizes.json')
+            convert_dataset(labels, 'yolo', dst, 'voc', size_of=self.tmp.name, classes=['hand'],
+                            size_cache=cache_path)
+            self.assertEqual(len(ImageSizeIndex(cache_path)), 4)
+            with mock.patch('pyprocess.utils.image_size.read_image_size') as read:
+                convert_dataset(labels, 'yolo', dst, 'voc', size_of=self.tmp.name, classes=['hand'],
+                                size_cache=cache_path)
+            read.assert_not_called()
+
+    def test_unreadable_image_fails_only_when_needed(self):
+        with open(os.path.join(self.tmp.name, 'd.jpg'), 'wb') as file:
+            file.write(b'\xff\xd8\xff\xc0\x00')
+        index = ImageSizeIndex()
+        sizes = index.directory(self.tmp.name)
+        self.assertEqual(sorted(sizes), ['a', 'b', 'c', 'p'])
+        self.assertEqual(list(index.failed), [os.path.join(self.tmp.name, 'd.jpg')])
+
+        labels = os.path.join(self.tmp.name, 'labels')
+        os.makedirs(labels)
+        with open(os.path.join(labels, 'b.txt'), 'w') as file:
+            file.write("0 0.5 0.5 1.0 1.0\n")
+        self.assertEqual(len(list(iter_yolo(labels, self.tmp.name))), 1)
+        with open(os.path.join(labels, 'd.txt'), 'w') as file:
+            file.write("0 0.5 0.5 1.0 1.0\n")
+        with self.assertRaisesRegex(ValueError, "'d'"):
+            list(iter_yolo(labels, self.tmp.name))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+import unittest
+
+def run_isolated(code):
+    # Ayrı yorumlayıcı: bu süreçte zaten yüklenmiş modüller sonucu etkilemesin.
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+class TestLazyImports(unittest.TestCase):
+    def test_convert_does_not_load_mediapipe_or_cv2(self):
+        loaded = run_isolated("import sys, pyprocess.convert, pyprocess.utils.image_size\n"
+                              "print('mediapipe' in sys.modules, 'cv2' in sys.modules)")
+        self.assertEqual(loaded, ['False', 'False'])
+
+    def test_import_time_budget(self):
+        # numpy hariç tutulur; geriye yalnızca paketin kendi içe aktarma maliyeti kalır.
+        elapsed, = run_isolated("import time, numpy\n"
+                                "start = time.perf_counter()\n"
+                                "import pyprocess.convert\n"
+                                "print(time.perf_counter() - start)")
+        self.assertLess(float(elapsed), 0.1)
+
+    def test_subpackages_load_on_attribute_access(self):
+        loaded = run_isolated("import sys, pyprocess\n"
+                              "print('mediapipe' in sys.modules)\n"
+                              "print(pyprocess.shapes.Rect.__name__, 'mediapipe' in sys.modules)\n"
+                              "print(pyprocess.mp_utils.HandPipeline.__name__, 'mediapipe' in sys.modules)\n"
+                              "print(pyprocess.hand_detector.HandDetector.__name__, 'mediapipe' in sys.modules)\n"
+                              "print(callable(pyprocess.display.warning), 'convert' in dir(pyprocess))")
+        self.assertEqual(loaded, ['False', 'Rect', 'False', 'HandPipeline', 'False', 'HandDetector', 'True',
+                                  'True', 'True'])
+        with self.assertRaises(subprocess.CalledProcessError):
+            run_isolated("import pyprocess; pyprocess.missing")
+
+if __name__ == '__main__':
+    unittest.main()
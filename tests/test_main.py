@@ -0,0 +1,139 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+
+from pyprocess.convert import AnnotationStore
+from pyprocess.main import main
+from pyprocess.utils import metrics
+
+def run(argv):
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        status = main(argv)
+    return status, out.getvalue(), err.getvalue()
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        self.labels = os.path.join(self.root, 'labels')
+        self.images = os.path.join(self.root, 'images')
+        os.makedirs(self.labels)
+        os.makedirs(self.images)
+        for stem, (w, h) in {'a': (200, 100), 'b': (64, 48), 'c': (32, 24)}.items():
+            cv2.imwrite(os.path.join(self.images, stem + '.png'), np.zeros((h, w, 3), np.uint8))
+            with open(os.path.join(self.labels, stem + '.txt'), 'w') as file:
+                file.write("0 0.5 0.5 0.5 0.5\n")
+        with open(os.path.join(self.labels, 'classes.txt'), 'w') as file:
+            file.write("cat\ndog\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        metrics.disable()
+        metrics.reset()
+
+    def convert(self, dst, dst_format, *extra):
+        return run(['convert', self.labels, dst, '--from', 'yolo', '--to', dst_format, '--images', self.images,
+                    '--image-ext', '.png', '--workers', '2', '--chunk-size', '2', *extra])
+
+    def test_convert_resumes_per_image_output(self):
+        voc_dir = os.path.join(self.root, 'voc')
+        status, out, _ = self.convert(voc_dir, 'voc')
+        self.assertEqual(status, 0)
+        self.assertEqual(json.loads(out)['images'], 3)
+        os.remove(os.path.join(voc_dir, 'b.xml'))
+        status, out, err = self.convert(voc_dir, 'voc', '--resume', '--progress')
+        stats = json.loads(out)
+        self.assertEqual((stats['images'], stats['skipped']), (1, 2))
+        self.assertIn('skipped 2', err)
+        self.assertEqual(sorted(os.listdir(voc_dir)), ['a.xml', 'b.xml', 'c.xml'])
+
+    def test_convert_coco_is_atomic(self):
+        coco_path = os.path.join(self.root, 'coco.json')
+        metrics_path = os.path.join(self.root, 'metrics.prom')
+        status, _, _ = run(['--metrics', metrics_path, 'convert', self.labels, coco_path, '--from', 'yolo',
+                            '--to', 'coco', '--images', self.images, '--image-ext', '.png', '--workers', '1'])
+        self.assertEqual(status, 0)
+        self.assertFalse(os.path.exists(coco_path + '.tmp'))
+        with open(coco_path) as file:
+            self.assertEqual([c['name'] for c in json.load(file)['categories']], ['cat', 'dog'])
+        with open(metrics_path) as file:
+            self.assertIn('pyprocess_convert_images_total 3', file.read())
+        status, _, err = run(['convert', self.labels, coco_path, '--from', 'yolo', '--to', 'coco',
+                              '--images', self.images, '--resume'])
+        self.assertEqual(status, 0)
+        self.assertIn('already complete', err)
+
+    def test_convert_to_store(self):
+        store_path = os.path.join(self.root, 'train.ppa')
+        status, out, _ = self.convert(store_path, 'store')
+        self.assertEqual(status, 0)
+        self.assertEqual(json.loads(out)['boxes'], 3)
+        with AnnotationStore(store_path) as store:
+            self.assertEqual(store.sizes.tolist(), [[200, 100], [64, 48], [32, 24]])
+
+    def test_detect_hands_shards_and_resume(self):
+        output = os.path.join(self.root, 'out')
+        argv = ['detect-hands', self.images, '-o', output, '--workers', '1', '--chunk-size', '2', '--format', 'json']
+        status, out, _ = run(argv)
+        self.assertEqual(status, 0)
+        self.assertEqual(json.loads(out), {'images': {'items': 3, 'hands': 0, 'skipped': 0}})
+        job_dir = os.path.join(output, 'images')
+        with open(os.path.join(job_dir, 'shard-000000.json')) as file:
+            items = json.load(file)
+        self.assertEqual([(item['name'], item['size'], item['hands']) for item in items],
+                         [('a.png', [200, 100], []), ('b.png', [64, 48], [])])
+
+        os.remove(os.path.join(job_dir, 'shard-000001.json'))
+        with open(os.path.join(job_dir, 'manifest.json')) as file:
+            manifest = json.load(file)
+        with open(os.path.join(job_dir, 'manifest.json'), 'w') as file:
+            json.dump(dict(manifest, complete=False), file)
+        status, out, _ = run(argv + ['--resume'])
+        self.assertEqual(json.loads(out)['images'], {'items': 1, 'hands': 0, 'skipped': 2})
+        status, out, _ = run(argv + ['--resume'])
+        self.assertEqual(json.loads(out)['images'], {'items': 0, 'hands': 0, 'skipped': 3})
+        status, _, err = run(argv[:-1] + ['npz', '--resume'])
+        self.assertEqual(status, 2)
+        self.assertIn('format changed', err)
+
+    def test_detect_hands_resume_after_short_last_shard(self):
+        output = os.path.join(self.root, 'out')
+        argv = ['detect-hands', self.images, '-o', output, '--workers', '1', '--chunk-size', '2']
+        status, _, _ = run(argv)
+        self.assertEqual(status, 0)
+        # Interrupted after the short last shard was written but before the manifest was completed
+        manifest_path = os.path.join(output, 'images', 'manifest.json')
+        with open(manifest_path) as file:
+            manifest = json.load(file)
+        with open(manifest_path, 'w') as file:
+            json.dump(dict(manifest, complete=False), file)
+        status, out, _ = run(argv + ['--resume'])
+        self.assertEqual(json.loads(out)['images'], {'items': 0, 'hands': 0, 'skipped': 3})
+        with open(manifest_path) as file:
+            self.assertEqual(json.load(file)['items'], 3)
+
+    def test_detect_hands_npz(self):
+        output = os.path.join(self.root, 'out')
+        status, _, _ = run(['detect-hands', os.path.join(self.images, 'a.png'), '-o', output, '--workers', '1'])
+        self.assertEqual(status, 0)
+        with np.load(os.path.join(output, 'images', 'shard-000000.npz')) as data:
+            self.assertEqual(data['names'].tolist(), ['a.png'])
+            self.assertEqual(data['sizes'].tolist(), [[200, 100]])
+            self.assertEqual(data['landmarks'].shape, (0, 21, 3))
+
+    def test_errors(self):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(['convert', self.labels, os.path.join(self.root, 'voc'), '--from', 'yolo', '--to', 'voc'])
+        status, _, err = run(['detect-hands', os.path.join(self.root, 'missing'), '-o', self.root])
+        self.assertEqual(status, 2)
+        self.assertIn('Input not found', err)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import os
+import tempfile
+import threading
+import unittest
+import urllib.request
+
+import numpy as np
+
+from pyprocess.convert import get_plan
+from pyprocess.mp_utils.hand_detector import HandDetector, arrays_to_results
+from pyprocess.utils import metrics
+
+class FixedHands:
+    """Stands in for the MediaPipe graph and returns one detected hand."""
+    def __init__(self):
+        rng = np.random.default_rng(0)
+        self.results = arrays_to_results(rng.uniform(0, 1, (1, 21, 3)).astype(np.float32),
+                                         np.array([1], np.int8), np.array([0.9], np.float32))
+
+    def process(self, img):
+        return self.results
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.was_enabled = metrics.ENABLED
+        metrics.reset()
+
+    def tearDown(self):
+        (metrics.enable if self.was_enabled else metrics.disable)()
+        metrics.reset()
+
+    def test_disabled_records_nothing(self):
+        metrics.disable()
+        with metrics.timer('stage'):
+            metrics.count('frames')
+        get_plan('pascal', 'yolo', size=(100, 100)).batch([[0, 0, 10, 10]])
+        self.assertEqual(metrics.snapshot(), {'counters': {}, 'histograms': {}})
+        self.assertIs(metrics.timer('a'), metrics.timer('b'))
+
+    def test_counters_histograms_and_hooks(self):
+        metrics.enable()
+        seen = []
+        metrics.add_hook(lambda name, seconds: seen.append(name))
+        try:
+            for _ in range(3):
+                with metrics.timer('stage'):
+                    metrics.count('frames')
+            metrics.observe('stage', 20.0)
+        finally:
+            metrics._hooks.clear()
+        data = metrics.snapshot()
+        self.assertEqual(data['counters'], {'frames': 3})
+        histogram = data['histograms']['stage']
+        self.assertEqual(histogram['count'], 4)
+        self.assertEqual(dict(histogram['buckets'])[0.25], 3)
+        self.assertEqual(histogram['buckets'][-1][1], 3)
+        self.assertEqual(seen, ['stage'] * 4)
+
+    def test_conversion_and_detector_are_instrumented(self):
+        metrics.enable()
+        plan = get_plan('pascal', 'yolo', size=(100, 100), validation='clip')
+        plan.batch([[0, 0, 10, 10], [50, 50, 40, 40]], return_mask=True)
+        with self.assertRaises(ValueError):
+            get_plan('pascal', 'yolo', size=(100, 100)).batch([[0, 0, 200, 10]])
+        detector = HandDetector(mode=True)
+        detector.hands = FixedHands()
+        detector.find_hands(np.zeros((32, 32, 3), np.uint8), draw=False)
+        detector.arrays()
+        data = metrics.snapshot()
+        self.assertEqual(data['counters'], {'convert.boxes': 2, 'convert.invalid': 1,
+                                            'convert.validation_failures': 1,
+                                            'hand_detector.frames': 1, 'hand_detector.hands': 1})
+        self.assertLessEqual({'convert.batch', 'hand_detector.color', 'hand_detector.inference',
+                              'hand_detector.landmarks'}, set(data['histograms']))
+        self.assertNotIn('hand_detector.draw', data['histograms'])
+
+    def test_detector_drawing_is_timed(self):
+        metrics.enable()
+        detector = HandDetector(mode=True)
+        detector.hands = FixedHands()
+        img = np.zeros((32, 32, 3), np.uint8)
+        detector.find_hands(img)
+        self.assertEqual(metrics.snapshot()['histograms']['hand_detector.draw']['count'], 1)
+        detector.find_positions(img, draw=True)
+        detector.find_positions(img, draw=False)
+        detector.draw_bounding_box(img, detector.get_bounding_box(img), text='hand')
+        self.assertEqual(metrics.snapshot()['histograms']['hand_detector.draw']['count'], 3)
+
+    def test_prometheus_file_and_endpoint(self):
+        metrics.enable()
+        metrics.count('convert.boxes', 5)
+        metrics.observe('hand_detector.inference', 0.003)
+        text = metrics.to_prometheus()
+        self.assertIn('pyprocess_convert_boxes_total 5', text)
+        self.assertIn('pyprocess_hand_detector_inference_seconds_bucket{le="0.005"} 1', text)
+        self.assertIn('pyprocess_hand_detector_inference_seconds_count 1', text)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'pyprocess.prom')
+            metrics.write_prometheus(path)
+            with open(path) as f:
+                self.assertEqual(f.read(), text)
+        server = metrics.serve_prometheus(port=0)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics") as response:
+                self.assertEqual(response.read().decode(), text)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_sampler_sees_stages_of_other_threads(self):
+        metrics.enable()
+        inside, done = threading.Event(), threading.Event()
+
+        def work():
+            with metrics.timer('worker.stage'):
+                inside.set()
+                done.wait(5)
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        inside.wait(5)
+        try:
+            self.assertIn(('worker.stage',), metrics.active_stages().values())
+            with metrics.Sampler(interval=0.001) as sampler:
+                while not sampler.samples:
+                    done.wait(0.005)
+        finally:
+            done.set()
+            thread.join()
+        self.assertEqual(list(sampler.profile()), ['worker.stage'])
+        self.assertEqual(metrics.active_stages(), {})
+
+if __name__ == '__main__':
+    unittest.main()
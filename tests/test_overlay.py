@@ -0,0 +1,73 @@
+import unittest
+import cv2
+import numpy as np
+
+from pyprocess.mp_utils import HandDetector
+from pyprocess.shapes import OverlayRenderer, draw_points, text_size
+
+class TestOverlayRenderer(unittest.TestCase):
+    def setUp(self):
+        self.img = np.random.default_rng(0).integers(0, 255, (480, 640, 3), dtype=np.uint8)
+        self.boxes = np.array([[20, 60, 120, 80], [200, 60, 90, 150], [400, 300, 200, 100], [30, 300, 60, 40]])
+        self.labels = ['Left', 'Right', None, 'x']
+        self.colors = [(0, 0, 255), (0, 255, 0), (0, 0, 255), (10, 20, 30)]
+
+    def test_matches_per_box_drawing(self):
+        for position, padding, thickness in [('left', 0, 2), ('right', 4, 1), ('center', 2, 3)]:
+            expected = self.img.copy()
+            for box, label, color in zip(self.boxes.tolist(), self.labels, self.colors):
+                HandDetector.draw_bounding_box(None, expected, tuple(box), color, thickness, label,
+                                               text_position=position, padding=padding)
+            renderer = OverlayRenderer(thickness=thickness, text_position=position, padding=padding)
+            result = renderer.draw(self.img.copy(), self.boxes, self.labels, self.colors)
+            np.testing.assert_array_equal(result, expected)
+
+    def test_points_match_cv2_circles(self):
+        points = np.array([[[0, 0], [320, 240], [639, 479], [-3, 100]], [[5, 5], [100, 470], [700, 10], [50, 50]]])
+        expected = self.img.copy()
+        for x, y in points.reshape(-1, 2).tolist():
+            cv2.circle(expected, (x, y), 5, (255, 0, 255), cv2.FILLED)
+        np.testing.assert_array_equal(draw_points(self.img.copy(), points), expected)
+        np.testing.assert_array_equal(draw_points(self.img.copy(), np.empty((0, 2))), self.img)
+
+    def test_overlapping_labels_are_filled(self):
+        boxes = np.array([[50, 80, 100, 60], [60, 85, 100, 60]])
+        renderer = OverlayRenderer()
+        result = renderer.draw(np.zeros_like(self.img), boxes, ['hand', 'hand'], (0, 0, 255))
+        (w, h), _ = text_size('hand')
+        first = np.zeros(result.shape[:2], bool)
+        first[80 - h:81, 50:51 + w] = True
+        second = np.zeros_like(first)
+        second[85 - h:86, 60:61 + w] = True
+        overlap = result[first & second]
+        self.assertGreater(len(overlap), 0)
+        # Red background, white text: no pixel of the intersection may be left unpainted.
+        self.assertFalse(np.any(np.all(overlap == 0, axis=1)))
+
+    def test_points_on_view(self):
+        frame = self.img.copy()
+        expected = self.img.copy()
+        draw_points(frame[:, 50:150], [[10, 10], [0, 200]])
+        for x, y in ((60, 10), (50, 200)):
+            cv2.circle(expected, (x, y), 5, (255, 0, 255), cv2.FILLED)
+        expected[:, :50] = self.img[:, :50]
+        np.testing.assert_array_equal(frame, expected)
+
+    def test_alpha_composites_once(self):
+        renderer = OverlayRenderer()
+        opaque = renderer.draw(self.img.copy(), self.boxes, colors=(0, 0, 255))
+        blended = renderer.draw(self.img.copy(), self.boxes, colors=(0, 0, 255), alpha=0.5)
+        expected = cv2.addWeighted(opaque, 0.5, self.img, 0.5, 0)
+        np.testing.assert_array_equal(blended, expected)
+        layer = next(iter(renderer._layers.values()))
+        renderer.draw(self.img.copy(), self.boxes, alpha=0.5)
+        self.assertIs(next(iter(renderer._layers.values())), layer)
+
+    def test_text_size_is_cached(self):
+        text_size.cache_clear()
+        for _ in range(3):
+            self.assertEqual(text_size('Right', 1, 1), cv2.getTextSize('Right', cv2.FONT_HERSHEY_SIMPLEX, 1, 1))
+        self.assertEqual(text_size.cache_info().hits, 2)
+
+if __name__ == '__main__':
+    unittest.main()
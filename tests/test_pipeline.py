@@ -0,0 +1,68 @@
+import time
+import unittest
+import numpy as np
+
+from pyprocess.mp_utils import DropOldestQueue, HandPipeline
+
+class FakeCapture:
+    def __init__(self, n):
+        self.n = n
+        self.i = 0
+
+    def read(self):
+        if self.i >= self.n:
+            return False, None
+        self.i += 1
+        return True, np.full((4, 4, 3), self.i, dtype=np.uint8)
+
+class FakeDetector:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    def find_hands(self, img, draw=True):
+        time.sleep(self.delay)
+        return img, [{'label': 'Right', 'score': 1.0}]
+
+class TestDropOldestQueue(unittest.TestCase):
+    def test_drops_oldest(self):
+        queue = DropOldestQueue(2)
+        for i in range(5):
+            queue.put(i)
+        self.assertEqual(queue.dropped, 3)
+        self.assertEqual([queue.get(), queue.get()], [3, 4])
+        queue.close()
+        self.assertIsNone(queue.get())
+
+class TestHandPipeline(unittest.TestCase):
+    def test_callback_receives_all_frames_in_order(self):
+        seen = []
+        pipeline = HandPipeline(FakeCapture(20), FakeDetector(), on_result=lambda r: seen.append(r.frame.index),
+                                queue_size=64)
+        with pipeline:
+            pipeline.wait(timeout=5)
+        self.assertEqual(seen, list(range(20)))
+        report = pipeline.report()
+        self.assertEqual(report['inference']['count'], 20)
+        self.assertEqual(report['processed'], 20)
+        self.assertEqual(report['dropped'], {'frames': 0, 'results': 0})
+
+    def test_slow_inference_drops_frames(self):
+        capture = FakeCapture(200)
+        with HandPipeline(capture, FakeDetector(delay=0.01), queue_size=1) as pipeline:
+            indices = [result.frame.index for result in pipeline]
+        self.assertEqual(indices, sorted(indices))
+        self.assertLess(len(indices), 200)
+        self.assertGreater(pipeline.report()['dropped']['frames'], 0)
+
+    def test_stage_error_is_raised(self):
+        class Broken(FakeDetector):
+            def find_hands(self, img, draw=True):
+                raise RuntimeError("boom")
+        pipeline = HandPipeline(FakeCapture(5), Broken(), on_result=lambda r: None).start()
+        with self.assertRaises(RuntimeError):
+            pipeline.wait(timeout=5)
+        pipeline.stop()
+        self.assertFalse(any(thread.is_alive() for thread in pipeline.threads))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from pyprocess.mp_utils import HandDetectorPool, results_to_arrays
+
+def fake_results(hands):
+    landmarks = [SimpleNamespace(landmark=[SimpleNamespace(x=i / 21, y=h, z=0.0) for i in range(21)])
+                 for h, _ in hands]
+    handedness = [SimpleNamespace(classification=[SimpleNamespace(label=label, score=0.9)]) for _, label in hands]
+    return SimpleNamespace(multi_hand_landmarks=landmarks, multi_handedness=handedness)
+
+class TestResultsToArrays(unittest.TestCase):
+    def test_arrays(self):
+        landmarks, handedness, scores = results_to_arrays(fake_results([(0.25, 'Left'), (0.75, 'Right')]))
+        self.assertEqual(landmarks.shape, (2, 21, 3))
+        self.assertEqual(landmarks.dtype, np.float32)
+        self.assertEqual(handedness.tolist(), [0, 1])
+        np.testing.assert_allclose(landmarks[1, :, 1], 0.75)
+        np.testing.assert_allclose(scores, 0.9)
+
+    def test_no_hands(self):
+        landmarks, handedness, scores = results_to_arrays(SimpleNamespace(multi_hand_landmarks=None))
+        self.assertEqual(landmarks.shape, (0, 21, 3))
+        self.assertEqual(len(handedness), 0)
+
+class TestHandDetectorPool(unittest.TestCase):
+    def test_ordered_results_and_reuse(self):
+        frames = [np.full((48, 64 + i, 3), i, dtype=np.uint8) for i in range(6)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'a.png')
+            cv2.imwrite(path, frames[0])
+            with HandDetectorPool(workers=2, chunk_size=2) as pool:
+                results = list(pool.map_frames(frames))
+                files = list(pool.map_files([path, os.path.join(tmp, 'missing.png')]))
+        self.assertEqual([r.size for r in results], [(64 + i, 48) for i in range(6)])
+        self.assertTrue(all(r.landmarks.shape == (0, 21, 3) for r in results))
+        self.assertEqual([r.size for r in files], [(64, 48), (0, 0)])
+
+if __name__ == '__main__':
+    unittest.main()
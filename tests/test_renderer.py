@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+
+from pyprocess.shapes import Circle, IncrementalRenderer, Rect, Scene, Triangle
+
+class TestIncrementalRenderer(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        shapes = [cls(tuple(rng.integers(-30, 600, 2).tolist()), tuple(rng.integers(20, 120, 2).tolist()),
+                      tuple(rng.integers(1, 255, 3).tolist()))
+                  for cls in [Rect, Circle, Triangle] * 40]
+        self.scene = Scene(shapes)
+        self.renderer = IncrementalRenderer(self.scene)
+        self.rng = rng
+
+    def frame(self, seed):
+        return np.random.default_rng(seed).integers(0, 255, (480, 640, 3), dtype=np.uint8)
+
+    def assert_matches_full_draw(self, seed):
+        frame = self.frame(seed)
+        expected = self.scene.draw(frame.copy())
+        np.testing.assert_array_equal(self.renderer.render(frame), expected)
+
+    def test_matches_full_draw_while_shapes_move(self):
+        self.assert_matches_full_draw(0)
+        self.assertEqual(self.renderer.dirty, [(0, 0, 640, 480)])
+        for step in range(1, 15):
+            cursor = self.rng.integers(0, 640, (1, 2))
+            self.scene.update(cursor, pressed=[step % 4 != 0])
+            self.assert_matches_full_draw(step)
+
+    def test_only_changed_regions_are_redrawn(self):
+        self.renderer.render(self.frame(0))
+        self.renderer.redrawn_pixels = 0
+        self.assert_matches_full_draw(1)
+        self.assertEqual(self.renderer.dirty, [])
+        self.assertEqual(self.renderer.redrawn_pixels, 0)
+
+        self.scene.colors[5] = (1, 2, 3)
+        self.assert_matches_full_draw(2)
+        self.assertEqual(len(self.renderer.dirty), 1)
+        self.assertLess(self.renderer.redrawn_pixels, 640 * 480 // 10)
+
+    def test_added_and_removed_shapes(self):
+        self.renderer.render(self.frame(0))
+        self.scene.add(Circle((300, 200), (80, 80), (9, 9, 9)))
+        self.assert_matches_full_draw(1)
+        self.scene.remove(3)
+        self.assert_matches_full_draw(2)
+        self.renderer.invalidate()
+        self.assert_matches_full_draw(3)
+        self.assertEqual(self.renderer.dirty, [(0, 0, 640, 480)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+
+from pyprocess.mp_utils import HandDetector, ResultCache, frame_key
+from pyprocess.mp_utils.hand_detector import arrays_to_results, results_to_arrays
+
+def hand_arrays(seed, hands=2):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(0, 1, (hands, 21, 3)).astype(np.float32), np.array([0, 1][:hands], np.int8),
+            rng.uniform(0.5, 1, hands).astype(np.float32))
+
+class CountingHands:
+    """Stands in for the MediaPipe graph and returns fixed protobuf results."""
+    def __init__(self, arrays):
+        self.results = arrays_to_results(*arrays)
+        self.calls = 0
+
+    def process(self, img):
+        self.calls += 1
+        return self.results
+
+class TestResultCache(unittest.TestCase):
+    def test_frame_key_depends_on_content_and_params(self):
+        img = np.zeros((8, 8, 3), np.uint8)
+        key = frame_key(img, (2, 1))
+        self.assertEqual(key, frame_key(img.copy(), (2, 1)))
+        self.assertNotEqual(key, frame_key(img, (1, 1)))
+        other = img.copy()
+        other[3, 3, 1] = 1
+        self.assertNotEqual(key, frame_key(other, (2, 1)))
+        self.assertEqual(frame_key(img[:, ::2]), frame_key(np.ascontiguousarray(img[:, ::2])))
+
+    def test_memory_lru_eviction(self):
+        cache = ResultCache(max_items=2)
+        for i in range(3):
+            cache.put(str(i), hand_arrays(i))
+        self.assertIsNone(cache.get('0'))
+        self.assertIsNotNone(cache.get('1'))
+        cache.put('3', hand_arrays(3))
+        self.assertIsNone(cache.get('2'))
+        self.assertEqual(cache.stats()['items'], 2)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_disk_tier_survives_new_instance_and_is_bounded(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ResultCache(max_items=0, cache_dir=cache_dir)
+            arrays = hand_arrays(0)
+            cache.put('a', arrays)
+            restored = pickle.loads(pickle.dumps(cache)).get('a')
+            for expected, actual in zip(arrays, restored):
+                np.testing.assert_array_equal(expected, actual)
+                self.assertEqual(expected.dtype, actual.dtype)
+
+            size = os.path.getsize(os.path.join(cache_dir, 'a.npz'))
+            bounded = ResultCache(cache_dir=cache_dir, max_disk_bytes=size * 3)
+            for i in range(10):
+                bounded.put(f"k{i}", hand_arrays(i))
+            files = [name for name in os.listdir(cache_dir) if name.endswith('.npz')]
+            self.assertLessEqual(len(files), 3)
+            self.assertIn('k9.npz', files)
+            self.assertLessEqual(bounded.disk_bytes, size * 3)
+            bounded.clear()
+            self.assertEqual(os.listdir(cache_dir), [])
+
+class TestHandDetectorCache(unittest.TestCase):
+    def test_repeated_images_skip_inference(self):
+        arrays = hand_arrays(1)
+        detector = HandDetector(mode=True, cache=ResultCache())
+        detector.hands = CountingHands(arrays)
+        images = [np.full((48, 64, 3), i, np.uint8) for i in range(3)]
+        first = [detector.find_hands(img, draw=True) for img in images]
+        second = [detector.find_hands(img, draw=True) for img in images]
+        self.assertEqual(detector.hands.calls, 3)
+        self.assertEqual(detector.cache.stats()['hits'], 3)
+        for (img_a, hands_a), (img_b, hands_b) in zip(first, second):
+            np.testing.assert_array_equal(img_a, img_b)
+            self.assertEqual([h['label'] for h in hands_a], [h['label'] for h in hands_b])
+        np.testing.assert_array_equal(detector.landmarks, arrays[0])
+        self.assertEqual(detector.get_bounding_box(images[0]), tuple(detector.bounding_boxes(images[0])[0].tolist()))
+
+        detector.find_hands(images[0], rgb=True)
+        self.assertEqual(detector.hands.calls, 4)
+
+    def test_arrays_round_trip_and_tracking_mode_rejected(self):
+        arrays = hand_arrays(2)
+        for expected, actual in zip(arrays, results_to_arrays(arrays_to_results(*arrays))):
+            np.testing.assert_array_equal(expected, actual)
+        self.assertEqual(len(results_to_arrays(arrays_to_results(*hand_arrays(0, hands=0)))[0]), 0)
+        with self.assertRaises(ValueError):
+            HandDetector(cache=ResultCache())
+
+if __name__ == '__main__':
+    unittest.main()
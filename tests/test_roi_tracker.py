@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+
+from pyprocess.mp_utils import ROITracker
+
+class MarkerDetector:
+    """Bright pixels stand in for a hand; landmarks span their bounding box."""
+    def __init__(self):
+        self.inputs = []
+        self.result = None
+
+    def process(self, img, copy=True):
+        self.inputs.append(img.shape[:2])
+        ys, xs = np.nonzero(img[..., 0] > 128)
+        if not len(xs):
+            self.result = (np.empty((0, 21, 3), np.float32), np.empty(0, np.int8), np.empty(0, np.float32))
+            return img
+        h, w = img.shape[:2]
+        t = np.linspace(0, 1, 21)
+        x = (xs.min() + t * (xs.max() + 1 - xs.min())) / w
+        y = (ys.min() + t * (ys.max() + 1 - ys.min())) / h
+        landmarks = np.stack([x, y, np.zeros(21)], axis=1)[None].astype(np.float32)
+        self.result = (landmarks, np.array([1], np.int8), np.array([0.9], np.float32))
+        return img
+
+    def arrays(self):
+        return self.result
+
+def frame(x, y, size=(2160, 3840)):
+    img = np.zeros(size + (3,), dtype=np.uint8)
+    img[y:y + 200, x:x + 160] = 255
+    return img
+
+class TestROITracker(unittest.TestCase):
+    def test_tracks_with_crops_and_maps_back(self):
+        detector = MarkerDetector()
+        tracker = ROITracker(detector, max_side=640)
+        first = tracker.process(frame(1000, 800))
+        self.assertIsNone(first.roi)
+        self.assertEqual(max(detector.inputs[-1]), 640)
+
+        result = tracker.process(frame(1020, 810))
+        self.assertIsNotNone(result.roi)
+        self.assertLessEqual(max(detector.inputs[-1]), 640)
+        pixels = ROITracker.pixel_landmarks(result, frame(0, 0))
+        self.assertAlmostEqual(pixels[0, 0, 0], 1020, delta=2)
+        self.assertAlmostEqual(pixels[0, 0, 1], 810, delta=2)
+        self.assertAlmostEqual(pixels[0, -1, 0], 1180, delta=2)
+        self.assertEqual(tracker.roi_frames, 1)
+
+    def test_falls_back_to_full_frame(self):
+        detector = MarkerDetector()
+        tracker = ROITracker(detector)
+        tracker.process(frame(1000, 800))
+        result = tracker.process(frame(3000, 1500))
+        self.assertIsNone(result.roi)
+        self.assertEqual(len(result.landmarks), 1)
+        self.assertEqual((tracker.full_frames, tracker.roi_frames), (2, 0))
+        empty = tracker.process(np.zeros((2160, 3840, 3), np.uint8))
+        self.assertEqual(len(empty.landmarks), 0)
+        self.assertIsNone(tracker.previous)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+
+from pyprocess.shapes import Circle, Rect, Scene, Triangle
+
+class TestScene(unittest.TestCase):
+    def setUp(self):
+        self.rect = Rect((100, 100), (200, 100))
+        self.circle = Circle((300, 50), (100, 100))
+        self.triangle = Triangle((50, 250), (100, 100))
+        self.scene = Scene([self.rect, self.circle, self.triangle])
+
+    def test_true_geometry(self):
+        # Dairenin sınırlayıcı kutu köşesi ve üçgenin tepe yanları isabet sayılmaz.
+        self.assertEqual(self.scene.hit_test((305, 55)).tolist(), [False, False, False])
+        self.assertEqual(self.scene.hit_test((350, 100)).tolist(), [False, True, False])
+        self.assertEqual(self.scene.hit_test((55, 255)).tolist(), [False, False, False])
+        self.assertEqual(self.scene.hit_test((100, 340)).tolist(), [False, False, True])
+        self.assertEqual(self.scene.hit_test((150, 150)).tolist(), [True, False, False])
+        self.assertEqual(self.scene.hit_test((100, 150)).tolist(), [False, False, False])
+
+    def test_hit_test_matches_rasterised_shapes(self):
+        rng = np.random.default_rng(0)
+        shapes = [cls(tuple(rng.integers(0, 400, 2).tolist()), tuple(rng.integers(20, 120, 2).tolist()))
+                  for cls in [Rect, Circle, Triangle] * 30]
+        scene = Scene(shapes, capacity=4)
+        cursors = rng.integers(0, 520, (400, 2))
+        hits = scene.hit_test(cursors)
+        self.assertEqual(hits.shape, (400, 90))
+        for i, shape in enumerate(shapes):
+            mask = shape.draw(np.zeros((520, 520, 3), np.uint8))[..., 0] > 0
+            raster = mask[cursors[:, 1], cursors[:, 0]]
+            self.assertLessEqual((raster != hits[:, i]).sum(), 6)
+
+    def test_drag_state(self):
+        scene = self.scene
+        self.assertEqual(scene.update([[150, 150], [5, 5]]).tolist(), [0, -1])
+        self.assertEqual(scene.colors[0].tolist(), [0, 255, 0])
+        self.assertEqual(scene.update([[400, 400], [5, 5]]).tolist(), [0, -1])
+        self.assertEqual(scene.points[0].tolist(), [300, 350])
+        # İkinci imleç sürüklenen şekli kapamaz.
+        self.assertEqual(scene.update([[400, 400], [400, 400]]).tolist(), [0, -1])
+        self.assertEqual(scene.update([[400, 400]], pressed=[False]).tolist(), [-1])
+        self.assertEqual(scene.colors[0].tolist(), [255, 0, 255])
+        self.assertEqual(scene.dragging, {})
+        self.assertEqual(scene.topmost([[400, 400], [0, 0]]).tolist(), [0, -1])
+
+    def test_topmost_remove_and_draw(self):
+        scene = Scene([Rect((0, 0), (100, 100)), Rect((50, 50), (100, 100), (1, 2, 3))])
+        self.assertEqual(scene.topmost((75, 75)).tolist(), [1])
+        scene.update([[75, 75]])
+        scene.remove(0)
+        self.assertEqual(scene.dragging, {0: 0})
+        self.assertEqual(len(scene), 1)
+
+        expected = np.zeros((500, 500, 3), np.uint8)
+        for shape in self.scene.shapes():
+            shape.draw(expected)
+        np.testing.assert_array_equal(self.scene.draw(np.zeros_like(expected)), expected)
+        with self.assertRaises(TypeError):
+            scene.add(object())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import time
+import unittest
+import numpy as np
+
+from pyprocess.mp_utils import StreamScheduler
+
+class PacedCapture:
+    def __init__(self, n, value=0, interval=0.001):
+        self.n = n
+        self.i = 0
+        self.value = value
+        self.interval = interval
+
+    def read(self):
+        if self.i >= self.n:
+            return False, None
+        time.sleep(self.interval)
+        self.i += 1
+        return True, np.full((4, 4, 3), self.value, dtype=np.uint8)
+
+class FakeDetector:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.value = 0
+
+    def process(self, img, copy=True):
+        time.sleep(self.delay)
+        self.value = int(img[0, 0, 0])
+        return img
+
+    def arrays(self):
+        return (np.full((1, 21, 3), self.value, np.float32), np.array([1], np.int8), np.array([0.9], np.float32))
+
+class TestStreamScheduler(unittest.TestCase):
+    def test_routes_results_and_accounts_for_every_frame(self):
+        seen = {}
+        def on_result(result):
+            seen.setdefault(result.stream, set()).add(int(result.landmarks[0, 0, 0]))
+
+        with StreamScheduler([FakeDetector(), FakeDetector()], on_result=on_result) as scheduler:
+            for value in range(3):
+                scheduler.add_stream(PacedCapture(20, value, interval=0.002), name=f"cam{value}")
+            scheduler.wait(timeout=10)
+        self.assertEqual(seen, {f"cam{value}": {value} for value in range(3)})
+        report = scheduler.report()
+        for stats in report['streams'].values():
+            self.assertEqual(stats['captured'], 20)
+            self.assertEqual(stats['processed'] + stats['dropped'] + stats['stale'], 20)
+            self.assertGreater(stats['processed'], 0)
+            self.assertEqual(stats['latency']['count'], stats['processed'])
+        self.assertEqual(report['workers'], 2)
+
+    def test_priority_shares_detector_under_overload(self):
+        scheduler = StreamScheduler([FakeDetector(delay=0.005)])
+        scheduler.add_stream(PacedCapture(400), name='high', priority=3)
+        scheduler.add_stream(PacedCapture(400), name='low', priority=1)
+        with scheduler:
+            time.sleep(0.5)
+        streams = scheduler.report()['streams']
+        ratio = streams['high']['processed'] / max(streams['low']['processed'], 1)
+        self.assertGreater(ratio, 2)
+        self.assertLess(ratio, 4.5)
+        self.assertGreater(streams['low']['dropped'], 0)
+
+    def test_stale_frames_are_dropped(self):
+        scheduler = StreamScheduler([FakeDetector(delay=0.02)])
+        for i in range(3):
+            scheduler.add_stream(PacedCapture(30, interval=0.005), latency_budget=0.01)
+        with scheduler:
+            scheduler.wait(timeout=10)
+        streams = scheduler.report()['streams']
+        self.assertEqual(sorted(streams), ['stream-0', 'stream-1', 'stream-2'])
+        self.assertGreater(sum(s['stale'] for s in streams.values()), 0)
+
+    def test_validation_and_errors(self):
+        scheduler = StreamScheduler([FakeDetector()])
+        scheduler.add_stream(PacedCapture(1), name='a')
+        with self.assertRaises(ValueError):
+            scheduler.add_stream(PacedCapture(1), name='a')
+        with self.assertRaises(ValueError):
+            scheduler.add_stream(PacedCapture(1), priority=0)
+        with self.assertRaises(ValueError):
+            StreamScheduler([])
+
+        class Broken(FakeDetector):
+            def process(self, img, copy=True):
+                raise RuntimeError("boom")
+
+        with StreamScheduler([FakeDetector()]) as empty:
+            started = time.perf_counter()
+            empty.wait()
+            self.assertLess(time.perf_counter() - started, 1)
+
+        with StreamScheduler([Broken()]) as broken:
+            broken.add_stream(PacedCapture(5))
+            with self.assertRaises(RuntimeError):
+                broken.wait(timeout=5)
+
+if __name__ == '__main__':
+    unittest.main()
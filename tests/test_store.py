@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from pyprocess.convert import convert_bbox_batch
+from pyprocess.convert.annotations import AnnotationStore, ImageAnnotation, convert_dataset, iter_yolo, write_store
+
+def sample_records():
+    return [
+        ImageAnnotation('a.jpg', 200, 100, np.array([[10, 10, 110, 60], [0, 0, 50, 50]], float), ['cat', 'dog']),
+        ImageAnnotation('b.jpg', 640, 480, np.empty((0, 4)), []),
+        ImageAnnotation('çift.png', 320, 240, np.array([[20, 30, 120, 230]], float), ['dog']),
+    ]
+
+class TestAnnotationStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'train.ppa')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_columns_are_memory_mapped(self):
+        stats = write_store(sample_records(), self.path)
+        self.assertEqual(stats, {'images': 3, 'boxes': 3, 'invalid': 0})
+        with AnnotationStore(self.path) as store:
+            self.assertEqual((len(store), store.num_boxes, store.box_format), (3, 3, 'pascal'))
+            self.assertEqual(store.classes, ['cat', 'dog'])
+            self.assertIsInstance(store.boxes, np.memmap)
+            self.assertEqual(store.boxes.dtype, np.float32)
+            self.assertEqual(store.offsets.tolist(), [0, 2, 2, 3])
+            self.assertEqual(store.image_ids.tolist(), [0, 0, 2])
+            self.assertEqual(store.class_ids.tolist(), [0, 1, 1])
+            self.assertTrue(np.shares_memory(store.image_boxes(0), store.boxes))
+            np.testing.assert_array_equal(store.image_boxes(2), [[20, 30, 120, 230]])
+            self.assertEqual(store.image_boxes(1).shape, (0, 4))
+            record = store[2]
+            self.assertEqual((record.file_name, record.width, record.height, record.labels),
+                             ('çift.png', 320, 240, ['dog']))
+            self.assertEqual([r.file_name for r in store], ['a.jpg', 'b.jpg', 'çift.png'])
+
+    def test_negative_indices(self):
+        write_store(sample_records(), self.path)
+        with AnnotationStore(self.path) as store:
+            np.testing.assert_array_equal(store.image_boxes(-1), [[20, 30, 120, 230]])
+            self.assertEqual(store.image_slice(-3), store.image_slice(0))
+            self.assertEqual(store.file_name(-1), 'çift.png')
+            for index in (3, -4):
+                with self.assertRaises(IndexError):
+                    store.image_boxes(index)
+
+    def test_convert_in_place_and_to_format(self):
+        records = sample_records()
+        write_store(records, self.path, box_format='yolo')
+        with AnnotationStore(self.path) as store:
+            self.assertEqual(store.box_format, 'yolo')
+            expected = convert_bbox_batch('pascal', 'yolo', records[0].boxes, size=(200, 100))
+            np.testing.assert_allclose(store.image_boxes(0), expected, rtol=1e-6)
+            np.testing.assert_allclose(store[0].boxes, records[0].boxes, atol=1e-4)
+            coco = store.to_format('coco', chunk_size=2)
+            np.testing.assert_allclose(coco[2], [20, 30, 100, 200], atol=1e-4)
+            with self.assertRaises(ValueError):
+                store.convert('coco')
+        with AnnotationStore(self.path, mode='r+') as store:
+            store.convert('coco', chunk_size=2)
+        with AnnotationStore(self.path) as store:
+            self.assertEqual(store.box_format, 'coco')
+            np.testing.assert_allclose(store.boxes, coco)
+
+    def test_interrupted_convert_is_detected(self):
+        write_store(sample_records(), self.path)
+
+        def crash(store, to_format, out, chunk_size):
+            out[:1] = -1
+            raise KeyboardInterrupt
+
+        with mock.patch.object(AnnotationStore, '_convert_into', crash):
+            with AnnotationStore(self.path, mode='r+') as store:
+                with self.assertRaises(KeyboardInterrupt):
+                    store.convert('yolo')
+        with self.assertRaises(ValueError):
+            AnnotationStore(self.path)
+
+    def test_validation_and_dataset_roundtrip(self):
+        records = sample_records()
+        records[0] = records[0]._replace(boxes=np.array([[10, 10, 250, 60], [60, 0, 50, 50]], float))
+        with self.assertRaises(ValueError):
+            write_store(records, self.path)
+        self.assertFalse(os.path.exists(self.path))
+        stats = write_store(records, self.path, validation='clip')
+        self.assertEqual(stats['invalid'], 1)
+
+        labels = os.path.join(self.tmp.name, 'labels')
+        os.makedirs(labels)
+        with open(os.path.join(labels, 'a.txt'), 'w') as file:
+            file.write("0 0.5 0.5 0.5 0.5\n1 0.25 0.25 0.5 0.5\n")
+        sizes, classes = {'a': (200, 100)}, ['cat', 'dog']
+        convert_dataset(labels, 'yolo', self.path, 'store', size_of=sizes, classes=classes)
+        yolo_dir = os.path.join(self.tmp.name, 'yolo')
+        convert_dataset(self.path, 'store', yolo_dir, 'yolo', classes=classes)
+        original, = iter_yolo(labels, sizes, classes)
+        restored, = iter_yolo(yolo_dir, sizes, classes)
+        self.assertEqual(original.labels, restored.labels)
+        np.testing.assert_allclose(original.boxes, restored.boxes, atol=1e-3)
+
+    def test_rejects_other_files(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a store at all')
+        with self.assertRaises(ValueError):
+            AnnotationStore(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import numpy as np
+
+from pyprocess.mp_utils import OneEuroFilter, TemporalHandDetector
+
+class ScriptedDetector:
+    """Returns landmarks from a function of the call index instead of running a model."""
+    def __init__(self, positions):
+        self.positions = positions
+        self.calls = 0
+        self.index = 0
+
+    def process(self, img, copy=True):
+        self.index = int(img[0, 0, 0])
+        self.calls += 1
+        return img
+
+    def arrays(self):
+        landmarks = self.positions(self.index)
+        if landmarks is None:
+            return np.empty((0, 21, 3), np.float32), np.empty(0, np.int8), np.empty(0, np.float32)
+        return landmarks[None].astype(np.float32), np.array([1], np.int8), np.array([0.9], np.float32)
+
+def hand_at(x, y):
+    landmarks = np.zeros((21, 3))
+    landmarks[:, 0] = x + np.linspace(0, 0.1, 21)
+    landmarks[:, 1] = y
+    return landmarks
+
+def frame(index):
+    img = np.zeros((4, 4, 3), dtype=np.uint8)
+    img[0, 0, 0] = index
+    return img
+
+class TestTemporalHandDetector(unittest.TestCase):
+    def run_frames(self, temporal, stop, start=0, fps=30.0):
+        return [temporal.process(frame(i), timestamp=i / fps) for i in range(start, stop)]
+
+    def test_fixed_interval_predicts_linear_motion(self):
+        detector = ScriptedDetector(lambda i: hand_at(0.2 + 0.005 * i, 0.5))
+        temporal = TemporalHandDetector(detector, every=2, adaptive=False, smoothing='constant_velocity')
+        results = self.run_frames(temporal, 20)
+        self.assertEqual(detector.calls, 10)
+        self.assertEqual([r.detected for r in results[:4]], [True, False, True, False])
+        self.assertAlmostEqual(temporal.detection_ratio, 0.5)
+        for i, result in enumerate(results[3:], start=3):
+            np.testing.assert_allclose(result.landmarks[0], hand_at(0.2 + 0.005 * i, 0.5), atol=1e-5)
+
+    def test_adaptive_interval_follows_motion(self):
+        detector = ScriptedDetector(lambda i: hand_at(0.5, 0.5) if i < 60 else hand_at(0.5 + 0.05 * (i - 60), 0.5))
+        temporal = TemporalHandDetector(detector, every=2, max_every=4, motion_threshold=0.5)
+        self.run_frames(temporal, 60)
+        self.assertEqual(temporal.interval, 4)
+        self.assertLess(detector.calls, 20)
+        self.run_frames(temporal, 70, start=60)
+        self.assertEqual(temporal.interval, 1)
+
+    def test_smooths_jitter_and_resets_on_lost_hand(self):
+        rng = np.random.default_rng(0)
+        noise = rng.normal(0, 0.01, (40, 21, 3))
+        detector = ScriptedDetector(lambda i: None if i == 20 else hand_at(0.5, 0.5) + noise[i])
+        temporal = TemporalHandDetector(detector, every=1, adaptive=False, min_cutoff=0.5, beta=0.0)
+        results = self.run_frames(temporal, 40)
+        self.assertEqual(len(results[20].landmarks), 0)
+        self.assertTrue(results[21].detected)
+        np.testing.assert_allclose(results[21].landmarks[0], hand_at(0.5, 0.5) + noise[21], atol=1e-6)
+        smoothed = np.stack([r.landmarks[0] for r in results[30:]])
+        raw = np.stack([hand_at(0.5, 0.5) + noise[i] for i in range(30, 40)])
+        self.assertLess(smoothed.std(axis=0).mean(), raw.std(axis=0).mean() / 2)
+
+    def test_one_euro_passes_first_sample_and_rejects_unknown_filter(self):
+        f = OneEuroFilter()
+        x = np.ones((1, 21, 3))
+        np.testing.assert_array_equal(f(x, 0.0), x)
+        with self.assertRaises(ValueError):
+            TemporalHandDetector(ScriptedDetector(lambda i: None), smoothing='kalman')
+
+if __name__ == '__main__':
+    unittest.main()